@@ -0,0 +1,71 @@
+"""initial schema (users, tasks, task_histories)
+
+기존에 create_all 또는 수동 SQL로 만든 DB는
+`alembic stamp 0001` 후 `alembic upgrade head`로 이어서 적용한다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("employee_id", sa.String(20), nullable=False, unique=True),
+        sa.Column("password_hash", sa.String(255), nullable=False),
+        sa.Column("name", sa.String(50), nullable=False),
+        sa.Column("organization", sa.String(100), nullable=False),
+        sa.Column("role", sa.String(20), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_table(
+        "tasks",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column(
+            "parent_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("tasks.id", ondelete="RESTRICT"),
+            nullable=True,
+        ),
+        sa.Column("level", sa.String(10), nullable=False),
+        sa.Column("name", sa.String(200), nullable=False),
+        sa.Column("organization", sa.String(100), nullable=False),
+        sa.Column("team", sa.String(100), nullable=True),
+        sa.Column("manager_name", sa.String(50), nullable=True),
+        sa.Column("manager_id", sa.String(20), nullable=True),
+        sa.Column("keywords", postgresql.ARRAY(sa.String()), nullable=True),
+        sa.Column("is_ai_utilized", sa.Boolean(), nullable=True),
+        sa.Column("version", sa.Integer(), nullable=True),
+        sa.Column("created_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("updated_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_table(
+        "task_histories",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("task_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("tasks.id"), nullable=False),
+        sa.Column("snapshot", postgresql.JSONB(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("change_type", sa.String(20), nullable=False),
+        sa.Column("changed_by", postgresql.UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("changed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("task_histories")
+    op.drop_table("tasks")
+    op.drop_table("users")
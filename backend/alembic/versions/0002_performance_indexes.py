@@ -0,0 +1,53 @@
+"""performance index pack for hot queries
+
+- ix_tasks_parent_id_name_live: upsert의 (parent_id, name) 조회, 자식 확인, 트리 인덱스
+- ix_tasks_level_live / ix_tasks_organization_live: 그래프 필터
+- ix_task_histories_task_id_changed_at: 이력 조회 (task_id + 최신순)
+- ix_task_histories_changed_at: changed_at 단독 정렬 (사용하는 쿼리가 없어 0006에서 제거)
+
+live 인덱스는 deleted_at IS NULL 부분 인덱스라 soft delete된 행은 포함하지 않는다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+LIVE = sa.text("deleted_at IS NULL")
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tasks_parent_id_name_live", "tasks", ["parent_id", "name"],
+        postgresql_where=LIVE, if_not_exists=True,
+    )
+    op.create_index(
+        "ix_tasks_level_live", "tasks", ["level"],
+        postgresql_where=LIVE, if_not_exists=True,
+    )
+    op.create_index(
+        "ix_tasks_organization_live", "tasks", ["organization"],
+        postgresql_where=LIVE, if_not_exists=True,
+    )
+    op.create_index(
+        "ix_task_histories_task_id_changed_at", "task_histories", ["task_id", "changed_at"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_task_histories_changed_at", "task_histories", ["changed_at"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_histories_changed_at", table_name="task_histories")
+    op.drop_index("ix_task_histories_task_id_changed_at", table_name="task_histories")
+    op.drop_index("ix_tasks_organization_live", table_name="tasks")
+    op.drop_index("ix_tasks_level_live", table_name="tasks")
+    op.drop_index("ix_tasks_parent_id_name_live", table_name="tasks")
@@ -0,0 +1,62 @@
+"""subtree aggregate columns on tasks
+
+태스크별 live 하위 노드 수(레벨별)와 AI 활용 하위 노드 수.
+이후에는 쓰기 시 조상 경로만 증분 갱신한다 (app/services/task_aggregates.py).
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+COLUMNS = (
+    "subtree_l1_count",
+    "subtree_l2_count",
+    "subtree_l3_count",
+    "subtree_l4_count",
+    "subtree_ai_count",
+)
+
+BACKFILL = """
+WITH RECURSIVE closure(ancestor_id, descendant_id) AS (
+    SELECT parent_id, id FROM tasks WHERE parent_id IS NOT NULL AND deleted_at IS NULL
+    UNION ALL
+    SELECT t.parent_id, c.descendant_id
+    FROM closure c JOIN tasks t ON t.id = c.ancestor_id
+    WHERE t.parent_id IS NOT NULL
+), agg AS (
+    SELECT c.ancestor_id,
+           count(*) FILTER (WHERE d.level = 'L1') AS l1,
+           count(*) FILTER (WHERE d.level = 'L2') AS l2,
+           count(*) FILTER (WHERE d.level = 'L3') AS l3,
+           count(*) FILTER (WHERE d.level = 'L4') AS l4,
+           count(*) FILTER (WHERE d.is_ai_utilized) AS ai
+    FROM closure c JOIN tasks d ON d.id = c.descendant_id
+    GROUP BY c.ancestor_id
+)
+UPDATE tasks
+SET subtree_l1_count = agg.l1, subtree_l2_count = agg.l2, subtree_l3_count = agg.l3,
+    subtree_l4_count = agg.l4, subtree_ai_count = agg.ai
+FROM agg
+WHERE tasks.id = agg.ancestor_id
+"""
+
+
+def upgrade() -> None:
+    for column in COLUMNS:
+        op.add_column(
+            "tasks",
+            sa.Column(column, sa.Integer(), nullable=False, server_default="0"),
+        )
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    for column in reversed(COLUMNS):
+        op.drop_column("tasks", column)
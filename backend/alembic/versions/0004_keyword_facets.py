@@ -0,0 +1,60 @@
+"""keyword facet table
+
+키워드별 태스크 수 (전체 / 조직 / 서브트리 범위, AI 활용 수 포함).
+이후에는 태스크 쓰기 시 증분 갱신한다 (app/services/keyword_facets.py).
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+BACKFILL = """
+WITH RECURSIVE task_keywords AS (
+    SELECT t.id, t.organization, t.is_ai_utilized, k.keyword
+    FROM tasks t
+    CROSS JOIN LATERAL (
+        SELECT DISTINCT btrim(kw) AS keyword FROM unnest(t.keywords) AS kw WHERE btrim(kw) <> ''
+    ) k
+    WHERE t.deleted_at IS NULL
+), closure(ancestor_id, descendant_id) AS (
+    SELECT id, id FROM tasks WHERE deleted_at IS NULL
+    UNION ALL
+    SELECT t.parent_id, c.descendant_id
+    FROM closure c JOIN tasks t ON t.id = c.ancestor_id
+    WHERE t.parent_id IS NOT NULL
+)
+INSERT INTO keyword_facets (scope_type, scope_key, keyword, task_count, ai_count)
+SELECT 'all', '', keyword, count(*), count(*) FILTER (WHERE is_ai_utilized)
+FROM task_keywords GROUP BY keyword
+UNION ALL
+SELECT 'organization', organization, keyword, count(*), count(*) FILTER (WHERE is_ai_utilized)
+FROM task_keywords GROUP BY organization, keyword
+UNION ALL
+SELECT 'task', c.ancestor_id::text, tk.keyword, count(*), count(*) FILTER (WHERE tk.is_ai_utilized)
+FROM closure c JOIN task_keywords tk ON tk.id = c.descendant_id
+GROUP BY c.ancestor_id, tk.keyword
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "keyword_facets",
+        sa.Column("scope_type", sa.String(20), nullable=False),
+        sa.Column("scope_key", sa.String(100), nullable=False),
+        sa.Column("keyword", sa.String(), nullable=False),
+        sa.Column("task_count", sa.Integer(), nullable=False),
+        sa.Column("ai_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("scope_type", "scope_key", "keyword"),
+    )
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    op.drop_table("keyword_facets")
@@ -0,0 +1,52 @@
+"""tree version sequence and applied uploads
+
+tasks에 대한 쓰기 문장마다 tree_version_seq를 증가시키는 트리거와
+워커 간에 공유되는 업로드 반영 기록 테이블.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE SEQUENCE IF NOT EXISTS tree_version_seq")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_tree_version() RETURNS trigger AS $$
+        BEGIN
+            PERFORM nextval('tree_version_seq');
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER tasks_bump_tree_version
+        BEFORE INSERT OR UPDATE OR DELETE OR TRUNCATE ON tasks
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_tree_version()
+        """
+    )
+    op.create_table(
+        "applied_uploads",
+        sa.Column("fingerprint", sa.String(64), primary_key=True),
+        sa.Column("tree_version", sa.BigInteger(), nullable=False),
+        sa.Column("result", postgresql.JSONB(), nullable=False),
+        sa.Column("applied_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("applied_uploads")
+    op.execute("DROP TRIGGER IF EXISTS tasks_bump_tree_version ON tasks")
+    op.execute("DROP FUNCTION IF EXISTS bump_tree_version()")
+    op.execute("DROP SEQUENCE IF EXISTS tree_version_seq")
@@ -0,0 +1,26 @@
+"""drop ix_task_histories_changed_at
+
+changed_at 단독으로 정렬·필터하는 쿼리가 없다 (이력 조회는 task_id + changed_at 복합 인덱스 사용).
+쓰기마다 유지 비용만 드므로 제거한다.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19
+"""
+from alembic import op
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_task_histories_changed_at", table_name="task_histories", if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_task_histories_changed_at", "task_histories", ["changed_at"],
+        if_not_exists=True,
+    )
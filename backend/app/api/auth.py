@@ -3,7 +3,7 @@ from fastapi import APIRouter, HTTPException, status, Request
 from sqlalchemy import select
 from app.api.deps import DbSession, CurrentUser
 from app.core.security import (
-    verify_password, create_access_token, create_refresh_token,
+    verify_and_update_password, create_access_token, create_refresh_token,
     decode_token, add_token_to_blacklist, is_token_blacklisted
 )
 from app.core.rate_limit import limiter
@@ -19,12 +19,21 @@ async def login(request: Request, login_data: LoginRequest, db: DbSession):
     result = await db.execute(select(User).where(User.employee_id == login_data.employee_id))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(login_data.password, user.password_hash):
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+
+    valid, new_hash = await verify_and_update_password(login_data.password, user.password_hash)
+    if not valid:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
     if not user.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User is inactive")
 
+    # BCRYPT_ROUNDS가 바뀌었으면 새 cost로 재해싱하여 저장
+    if new_hash:
+        user.password_hash = new_hash
+        await db.commit()
+
     access_token = create_access_token({"sub": str(user.id)})
     refresh_token = create_refresh_token({"sub": str(user.id)})
 
@@ -38,7 +47,7 @@ async def login(request: Request, login_data: LoginRequest, db: DbSession):
 @limiter.limit("10/minute")  # 분당 10회 토큰 갱신 제한
 async def refresh(request: Request, refresh_data: RefreshRequest, db: DbSession):
     # 블랙리스트 확인
-    if is_token_blacklisted(refresh_data.refresh_token):
+    if await is_token_blacklisted(refresh_data.refresh_token):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has been revoked")
 
     payload = decode_token(refresh_data.refresh_token)
@@ -54,7 +63,7 @@ async def refresh(request: Request, refresh_data: RefreshRequest, db: DbSession)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
 
     # 기존 refresh token 블랙리스트에 추가
-    add_token_to_blacklist(refresh_data.refresh_token)
+    await add_token_to_blacklist(refresh_data.refresh_token)
 
     access_token = create_access_token({"sub": str(user.id)})
     refresh_token = create_refresh_token({"sub": str(user.id)})
@@ -72,7 +81,7 @@ async def logout(request: Request, current_user: CurrentUser):
     auth_header = request.headers.get("Authorization")
     if auth_header and auth_header.startswith("Bearer "):
         token = auth_header.split(" ")[1]
-        add_token_to_blacklist(token)
+        await add_token_to_blacklist(token)
 
     return ApiResponse(success=True, data=True, message="Successfully logged out")
 
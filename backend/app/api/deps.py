@@ -3,13 +3,44 @@ from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from app.db.session import get_db
+from sqlalchemy import select, event
+from app.db.session import get_db, read_session_for
+from app.core.cache import TTLCache
+from app.core.config import settings
 from app.core.security import decode_token, is_token_blacklisted
 from app.models import User
 
 security = HTTPBearer()
 
+# user_id → User (세션에서 분리된 읽기 전용 인스턴스, 워커별)
+# 같은 프로세스의 ORM 변경은 즉시 무효화되고, 다른 워커의 변경은 TTL(기본 5초)이 지나야 반영된다.
+_user_cache: TTLCache[UUID, User] = TTLCache(
+    maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_user_cache(user_id: UUID | None = None) -> None:
+    """사용자 캐시 무효화 (user_id가 없으면 전체)."""
+    if user_id is None:
+        _user_cache.clear()
+    else:
+        _user_cache.pop(user_id)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_change(mapper, connection, target: User) -> None:
+    # 비활성화·역할 변경 등 모든 사용자 변경 시 캐시에서 제거
+    invalidate_user_cache(target.id)
+
+
+async def is_access_token_valid(token: str) -> bool:
+    """액세스 토큰이 아직 유효한지 (서명·만료·블랙리스트). 오래 열린 연결의 재검증용."""
+    payload = decode_token(token)
+    if not payload or payload.get("type") != "access":
+        return False
+    return not await is_token_blacklisted(token)
+
 
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
@@ -18,7 +49,7 @@ async def get_current_user(
     token = credentials.credentials
 
     # 블랙리스트 확인
-    if is_token_blacklisted(token):
+    if await is_token_blacklisted(token):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has been revoked")
 
     payload = decode_token(token)
@@ -30,8 +61,14 @@ async def get_current_user(
     if not user_id:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    result = await db.execute(select(User).where(User.id == UUID(user_id)))
-    user = result.scalar_one_or_none()
+    user_uuid = UUID(user_id)
+    user = _user_cache.get(user_uuid)
+    if user is None:
+        result = await db.execute(select(User).where(User.id == user_uuid))
+        user = result.scalar_one_or_none()
+        if user:
+            db.expunge(user)
+            _user_cache.set(user_uuid, user)
 
     if not user or not user.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
@@ -51,7 +88,19 @@ def require_role(required_roles: list[str]):
     return role_checker
 
 
+async def get_read_db(current_user: Annotated[User, Depends(get_current_user)]):
+    """읽기 전용 엔드포인트용 세션 (복제본 라우팅, 본인 쓰기 직후에는 primary)."""
+    session_factory = await read_session_for(current_user.id)
+    async with session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+BearerToken = Annotated[HTTPAuthorizationCredentials, Depends(security)]
 CurrentUser = Annotated[User, Depends(get_current_user)]
 AdminUser = Annotated[User, Depends(require_role(["admin"]))]
 EditorUser = Annotated[User, Depends(require_role(["admin", "editor"]))]
 DbSession = Annotated[AsyncSession, Depends(get_db)]
+ReadDbSession = Annotated[AsyncSession, Depends(get_read_db)]
@@ -0,0 +1,37 @@
+import secrets
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user
+from app.core.config import settings
+from app.core.metrics import render_metrics
+from app.core.rate_limit import limiter
+from app.db.session import get_db
+
+router = APIRouter(tags=["metrics"])
+bearer = HTTPBearer()
+
+
+async def require_metrics_access(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(bearer)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> None:
+    """METRICS_TOKEN(스크레이퍼용 고정 토큰) 또는 admin 사용자의 access token 허용."""
+    if settings.METRICS_TOKEN and secrets.compare_digest(
+        credentials.credentials, settings.METRICS_TOKEN
+    ):
+        return
+    user = await get_current_user(credentials, db)
+    if user.role != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Required role: ['admin']")
+
+
+@router.get("/metrics", response_class=PlainTextResponse, dependencies=[Depends(require_metrics_access)])
+@limiter.exempt
+async def metrics():
+    """Prometheus 텍스트 포맷 지표 (워커 프로세스별 값)."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,86 @@
+"""관리자용 on-demand 프로파일링.
+
+`X-Profile: 1` 헤더 또는 `?profile=1` 쿼리가 붙은 admin 요청만 샘플링 프로파일러로
+감싸고, 응답 헤더 X-Profile-Id로 받은 id를 GET /api/profiles/{id}로 내려받는다.
+플래그가 없는 요청은 헤더 검사 외에 추가 작업이 없다.
+"""
+import threading
+import uuid
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import FileResponse
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.api.deps import AdminUser, get_current_user, require_role
+from app.core.config import settings
+from app.core.profiler import SamplingProfiler, profile_path
+from app.db.session import async_session
+
+router = APIRouter(prefix="/profiles", tags=["profiles"])
+
+_TRUE_VALUES = (b"1", b"true", b"yes")
+
+
+@router.get("/{profile_id}")
+async def download_profile(profile_id: str, current_user: AdminUser):
+    """collapsed stack 형식 프로파일 (flamegraph.pl, speedscope에서 열기)."""
+    path = profile_path(profile_id)
+    if path is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return FileResponse(path, media_type="text/plain", filename=path.name)
+
+
+def _profiling_requested(scope) -> bool:
+    for name, value in scope["headers"]:
+        if name == b"x-profile":
+            return value.lower() in _TRUE_VALUES
+    query = scope.get("query_string", b"")
+    return b"profile=" in query and any(
+        param == b"profile=" + value for param in query.split(b"&") for value in _TRUE_VALUES
+    )
+
+
+async def _is_admin(scope) -> bool:
+    authorization = dict(scope["headers"]).get(b"authorization", b"").decode()
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    credentials = HTTPAuthorizationCredentials(scheme=scheme, credentials=token)
+    try:
+        async with async_session() as db:
+            user = await get_current_user(credentials, db)
+        await require_role(["admin"])(user)
+    except HTTPException:
+        return False
+    return True
+
+
+class ProfilerMiddleware:
+    """admin이 요청한 경우에만 해당 요청을 프로파일링 (그 외 요청은 그대로 통과)."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not _profiling_requested(scope) or not await _is_admin(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex
+
+        async def send_wrapper(message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-profile-id", profile_id.encode()),
+                ]
+            await send(message)
+
+        profiler = SamplingProfiler(
+            threading.get_ident(), settings.PROFILE_SAMPLE_INTERVAL_MS / 1000
+        )
+        try:
+            with profiler:
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.save(profile_id)
@@ -1,29 +1,72 @@
 from uuid import UUID
 from fastapi import APIRouter, HTTPException, status, Query
-from app.api.deps import DbSession, CurrentUser
-from app.schemas import ApiResponse, TaskGraphItem, TaskDetail, TaskCreate, TaskUpdate, TaskHistoryResponse
-from app.services import task_service
+from fastapi.responses import JSONResponse, StreamingResponse
+from app.api.deps import BearerToken, DbSession, ReadDbSession, CurrentUser, is_access_token_valid
+from app.db.session import mark_user_write
+from app.schemas import (
+    ApiResponse, TaskGraphItem, TaskDetail, TaskBatchResponse, KeywordFacetItem, KeywordFacets,
+    TaskCreate, TaskUpdate, TaskHistoryResponse,
+)
+from app.services import keyword_facets, task_service
+from app.services.task_events import stream_task_changes
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
+MAX_BATCH_IDS = 500
+FIELDS_DESCRIPTION = "응답에 포함할 필드 (콤마 구분, id는 항상 포함). 생략하면 전체 필드"
+
+
+def _parse_fields(fields: str | None, allowed: tuple[str, ...]) -> list[str] | None:
+    """?fields= 파싱. 지정한 컬럼만 SELECT하도록 서비스에 넘긴다."""
+    if not fields:
+        return None
+    requested = ["id", *(name.strip() for name in fields.split(",") if name.strip())]
+    unknown = [name for name in requested if name not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {unknown}. Allowed: {list(allowed)}",
+        )
+    return list(dict.fromkeys(requested))
+
+
+def _parse_ids(ids: list[str]) -> list[UUID]:
+    """?ids=a,b&ids=c 형식 모두 허용. 중복은 첫 위치만 남긴다."""
+    try:
+        parsed = [UUID(value.strip()) for raw in ids for value in raw.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid task id")
+    parsed = list(dict.fromkeys(parsed))
+    if not parsed:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ids is required")
+    if len(parsed) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many ids (max {MAX_BATCH_IDS})",
+        )
+    return parsed
+
+
+def _projected_response(data) -> JSONResponse:
+    # 일부 필드만 담은 응답은 response_model 검증을 거치지 않고 그대로 직렬화
+    return JSONResponse(ApiResponse(success=True, data=data).model_dump(mode="json"))
+
 
 @router.get("/graph", response_model=ApiResponse[list[TaskGraphItem]])
 async def get_graph(
-    db: DbSession,
+    db: ReadDbSession,
     current_user: CurrentUser,  # 인증 필수
     organization: str | None = Query(None),
     level: str | None = Query(None),
     is_ai_utilized: bool | None = Query(None),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
 ):
-    tasks = await task_service.get_all_tasks(db)
+    projection = _parse_fields(fields, tuple(TaskGraphItem.model_fields))
+    if projection is not None:
+        rows = await task_service.get_task_rows(db, projection, organization, level, is_ai_utilized)
+        return _projected_response(rows)
 
-    # 필터링
-    if organization:
-        tasks = [t for t in tasks if t.organization == organization]
-    if level:
-        tasks = [t for t in tasks if t.level == level]
-    if is_ai_utilized is not None:
-        tasks = [t for t in tasks if t.is_ai_utilized == is_ai_utilized]
+    tasks = await task_service.get_all_tasks(db, organization, level, is_ai_utilized)
 
     return ApiResponse(
         success=True,
@@ -31,8 +74,98 @@ async def get_graph(
     )
 
 
+@router.get("", response_model=ApiResponse[TaskBatchResponse])
+async def get_tasks_batch(
+    db: ReadDbSession,
+    current_user: CurrentUser,  # 인증 필수
+    ids: list[str] = Query(..., description=f"태스크 id 목록 (콤마 구분 또는 반복, 최대 {MAX_BATCH_IDS}개)"),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+):
+    """여러 태스크 상세를 한 번에 조회. 요청 순서를 유지하고 없는 id는 missing으로 알려준다."""
+    task_ids = _parse_ids(ids)
+
+    projection = _parse_fields(fields, tuple(TaskDetail.model_fields))
+    if projection is not None:
+        found = {row["id"]: row for row in await task_service.get_task_rows_by_ids(db, task_ids, projection)}
+        tasks = [found[task_id] for task_id in task_ids if task_id in found]
+        missing = [task_id for task_id in task_ids if task_id not in found]
+        return _projected_response({"tasks": tasks, "missing": missing})
+
+    found = {task.id: task for task in await task_service.get_tasks_by_ids(db, task_ids)}
+    return ApiResponse(
+        success=True,
+        data=TaskBatchResponse(
+            tasks=[TaskDetail.model_validate(found[task_id]) for task_id in task_ids if task_id in found],
+            missing=[task_id for task_id in task_ids if task_id not in found],
+        ),
+    )
+
+
+@router.get("/keywords/facets", response_model=ApiResponse[KeywordFacets])
+async def get_keyword_facets(
+    db: ReadDbSession,
+    current_user: CurrentUser,  # 인증 필수
+    organization: str | None = Query(None),
+    task_id: UUID | None = Query(None, description="이 노드의 서브트리(자신 포함)로 범위 제한"),
+    limit: int = Query(100, ge=1, le=1000),
+):
+    """키워드 빈도 (전체 / AI 활용 / 미활용). 쓰기 시 갱신되는 facet 테이블에서 조회."""
+    if organization and task_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either organization or task_id",
+        )
+    facets = await keyword_facets.get_keyword_facets(db, organization, task_id, limit)
+    scope = "task" if task_id else "organization" if organization else "all"
+    return ApiResponse(
+        success=True,
+        data=KeywordFacets(
+            scope=scope,
+            keywords=[
+                KeywordFacetItem(
+                    keyword=f.keyword,
+                    count=f.task_count,
+                    ai_count=f.ai_count,
+                    non_ai_count=f.task_count - f.ai_count,
+                )
+                for f in facets
+            ],
+        ),
+    )
+
+
+@router.get("/changes")
+async def stream_changes(
+    current_user: CurrentUser,  # 인증 필수 (Authorization 헤더를 보낼 수 있는 fetch 기반 SSE 클라이언트 사용)
+    credentials: BearerToken,
+    organization: str | None = Query(None),
+):
+    """태스크 변경 알림 SSE 스트림 (created / updated / deleted / resync).
+
+    토큰이 만료되거나 로그아웃으로 폐기되면 unauthorized 이벤트를 보내고 닫는다.
+    """
+    token = credentials.credentials
+    return StreamingResponse(
+        stream_task_changes(organization, lambda: is_access_token_valid(token)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{task_id}", response_model=ApiResponse[TaskDetail])
-async def get_task(task_id: UUID, db: DbSession, current_user: CurrentUser):  # 인증 필수
+async def get_task(
+    task_id: UUID,
+    db: ReadDbSession,
+    current_user: CurrentUser,  # 인증 필수
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+):
+    projection = _parse_fields(fields, tuple(TaskDetail.model_fields))
+    if projection is not None:
+        row = await task_service.get_task_row_by_id(db, task_id, projection)
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+        return _projected_response(row)
+
     task = await task_service.get_task_by_id(db, task_id)
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
@@ -43,6 +176,7 @@ async def get_task(task_id: UUID, db: DbSession, current_user: CurrentUser):  #
 async def create_task(data: TaskCreate, db: DbSession, current_user: CurrentUser):
     try:
         task = await task_service.create_task(db, data, current_user.id)
+        await mark_user_write(current_user.id)
         return ApiResponse(success=True, data=TaskDetail.model_validate(task))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -52,6 +186,7 @@ async def create_task(data: TaskCreate, db: DbSession, current_user: CurrentUser
 async def update_task(task_id: UUID, data: TaskUpdate, db: DbSession, current_user: CurrentUser):
     try:
         task = await task_service.update_task(db, task_id, data, current_user.id)
+        await mark_user_write(current_user.id)
         return ApiResponse(success=True, data=TaskDetail.model_validate(task))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -61,13 +196,14 @@ async def update_task(task_id: UUID, data: TaskUpdate, db: DbSession, current_us
 async def delete_task(task_id: UUID, db: DbSession, current_user: CurrentUser):
     try:
         await task_service.delete_task(db, task_id, current_user.id)
+        await mark_user_write(current_user.id)
         return ApiResponse(success=True, data=True, message="Task deleted")
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.get("/{task_id}/history", response_model=ApiResponse[list[TaskHistoryResponse]])
-async def get_history(task_id: UUID, db: DbSession, current_user: CurrentUser):  # 인증 필수
+async def get_history(task_id: UUID, db: ReadDbSession, current_user: CurrentUser):  # 인증 필수
     histories = await task_service.get_task_histories(db, task_id)
     return ApiResponse(
         success=True,
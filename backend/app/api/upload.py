@@ -1,6 +1,10 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File, status
+from typing import Literal
 
-from app.api.deps import DbSession, EditorUser
+from fastapi import APIRouter, HTTPException, UploadFile, File, Query, status
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.api.deps import DbSession, CurrentUser, EditorUser
+from app.db.session import mark_user_write
 from app.schemas.common import ApiResponse
 from app.schemas.upload import UploadPreview, DiffResult, UpsertResult
 from app.services import upload_service
@@ -9,6 +13,7 @@ router = APIRouter(prefix="/upload", tags=["upload"])
 
 ALLOWED_EXTENSIONS = {".xlsx", ".xls"}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 
 
 def _validate_file(file: UploadFile) -> None:
@@ -25,22 +30,27 @@ def _validate_file(file: UploadFile) -> None:
         )
 
 
-@router.post("/preview", response_model=ApiResponse[UploadPreview])
-async def upload_preview(
-    current_user: EditorUser,
-    file: UploadFile = File(...),
-):
-    """엑셀 파일을 파싱하여 미리보기 데이터를 반환합니다."""
-    _validate_file(file)
-    file_bytes = await file.read()
-    if len(file_bytes) > MAX_FILE_SIZE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="파일 크기가 10MB를 초과합니다.",
-        )
-
+async def _read_files(files: list[UploadFile]) -> list[bytes]:
+    """업로드된 파일들을 검증하고 내용을 읽습니다."""
+    contents: list[bytes] = []
+    for file in files:
+        _validate_file(file)
+        file_bytes = await file.read()
+        if len(file_bytes) > MAX_FILE_SIZE:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"파일 크기가 10MB를 초과합니다. ({file.filename})",
+            )
+        contents.append(file_bytes)
+    return contents
+
+
+async def _parse_contents(
+    contents: list[bytes], sheets: list[str] | None, all_sheets: bool
+) -> upload_service.ParsedExcel:
+    """파일 내용의 시트들을 병렬 파싱해 하나로 병합합니다."""
     try:
-        parsed = upload_service.parse_excel(file_bytes)
+        return await upload_service.parse_workbooks(contents, sheets, all_sheets)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception:
@@ -49,13 +59,33 @@ async def upload_preview(
             detail="엑셀 파일을 파싱할 수 없습니다. 올바른 형식인지 확인해주세요.",
         )
 
+
+async def _parse_upload(
+    files: list[UploadFile], sheets: list[str] | None, all_sheets: bool
+) -> upload_service.ParsedExcel:
+    contents = await _read_files(files)
+    return await _parse_contents(contents, sheets, all_sheets)
+
+
+@router.post("/preview", response_model=ApiResponse[UploadPreview])
+async def upload_preview(
+    current_user: EditorUser,
+    file: list[UploadFile] = File(...),
+    sheets: list[str] | None = Query(None),
+    all_sheets: bool = Query(False),
+    hierarchy_offset: int = Query(0, ge=0),
+    hierarchy_limit: int | None = Query(None, ge=1),
+):
+    """엑셀 파일(여러 개 가능)을 파싱하여 미리보기 데이터를 반환합니다."""
+    parsed = await _parse_upload(file, sheets, all_sheets)
+
     if not parsed.rows:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="엑셀 파일에 유효한 데이터가 없습니다.",
         )
 
-    preview = upload_service.build_preview(parsed)
+    preview = upload_service.build_preview(parsed, hierarchy_offset, hierarchy_limit)
     return ApiResponse(success=True, data=preview)
 
 
@@ -63,45 +93,62 @@ async def upload_preview(
 async def upload_diff(
     db: DbSession,
     current_user: EditorUser,
-    file: UploadFile = File(...),
+    file: list[UploadFile] = File(...),
+    sheets: list[str] | None = Query(None),
+    all_sheets: bool = Query(False),
 ):
-    """엑셀 파일을 파싱하여 기존 DB와 비교한 diff를 반환합니다."""
-    _validate_file(file)
-    file_bytes = await file.read()
-
-    try:
-        parsed = upload_service.parse_excel(file_bytes)
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="엑셀 파일을 파싱할 수 없습니다.",
-        )
-
+    """엑셀 파일(여러 개 가능)을 파싱하여 기존 DB와 비교한 diff를 반환합니다."""
+    parsed = await _parse_upload(file, sheets, all_sheets)
     diff = await upload_service.diff_tasks(db, parsed)
-    return ApiResponse(success=True, data=diff)
+    # 노드 수만큼 커지는 응답이라 response_model 재검증 없이 바로 직렬화 (스키마는 문서용)
+    return JSONResponse({"success": True, "data": diff, "message": None, "error_code": None})
 
 
 @router.post("/confirm", response_model=ApiResponse[UpsertResult])
 async def upload_confirm(
     db: DbSession,
     current_user: EditorUser,
-    file: UploadFile = File(...),
+    file: list[UploadFile] = File(...),
+    sheets: list[str] | None = Query(None),
+    all_sheets: bool = Query(False),
 ):
-    """엑셀 파일을 파싱하여 DB에 upsert합니다."""
-    _validate_file(file)
-    file_bytes = await file.read()
+    """엑셀 파일(여러 개 가능)을 파싱하여 DB에 upsert합니다.
+
+    같은 파일이 변경 없는 트리에 다시 제출되면 파싱 없이 이전 결과를 반환합니다.
+    """
+    contents = await _read_files(file)
+    fingerprint = upload_service.upload_fingerprint(contents, sheets, all_sheets)
+
+    applied = await upload_service.get_applied_upload(db, fingerprint)
+    if applied is None:
+        # 파싱하는 동안 트랜잭션(커넥션)을 붙잡지 않도록 먼저 끝낸다
+        await db.rollback()
+        parsed = await _parse_contents(contents, sheets, all_sheets)
+        # 트리 잠금 후 다시 확인 (다른 요청·워커가 파싱 중에 먼저 반영했을 수 있음)
+        await upload_service.lock_task_tree(db)
+        applied = await upload_service.get_applied_upload(db, fingerprint)
+    if applied is not None:
+        return ApiResponse(success=True, data=applied, message="이미 반영된 업로드입니다.")
+
+    result = await upload_service.upsert_tasks(db, parsed, current_user.id, fingerprint)
+    await mark_user_write(current_user.id)
+    return ApiResponse(success=True, data=result)
 
-    try:
-        parsed = upload_service.parse_excel(file_bytes)
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="엑셀 파일을 파싱할 수 없습니다.",
-        )
 
-    result = await upload_service.upsert_tasks(db, parsed, current_user.id)
-    return ApiResponse(success=True, data=result)
+@router.get("/export")
+async def upload_export(
+    current_user: CurrentUser,
+    format: Literal["xlsx", "csv"] = Query("xlsx"),
+):
+    """현재 태스크 트리를 업로드와 같은 L1~L4 형식의 엑셀/CSV로 내려받습니다."""
+    if format == "csv":
+        return StreamingResponse(
+            upload_service.export_csv(),
+            media_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": 'attachment; filename="pi_tasks.csv"'},
+        )
+    return StreamingResponse(
+        upload_service.export_xlsx(),
+        media_type=XLSX_MEDIA_TYPE,
+        headers={"Content-Disposition": 'attachment; filename="pi_tasks.xlsx"'},
+    )
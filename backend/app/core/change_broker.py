@@ -0,0 +1,111 @@
+import asyncio
+import json
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# 구독자 큐가 가득 차면(느린 클라이언트) 쌓인 이벤트를 버리고 이 이벤트로 전체 재조회를 요청
+RESYNC_EVENT = {"type": "resync"}
+
+
+class ChangeBroker(ABC):
+    """태스크 변경 이벤트 pub/sub. 이벤트는 JSON 직렬화 가능한 dict."""
+
+    @abstractmethod
+    async def publish(self, event: dict) -> None:
+        """모든 워커의 구독자에게 이벤트 전달."""
+
+    @abstractmethod
+    def subscription(self) -> "AsyncIterator[asyncio.Queue[dict]]":
+        """구독 동안 이벤트가 들어오는 큐 (async context manager)."""
+
+
+class InMemoryChangeBroker(ChangeBroker):
+    """프로세스 로컬 구현 (단일 워커/개발용). Redis 구현의 로컬 fan-out에도 쓰인다."""
+
+    def __init__(self, queue_size: int = 256) -> None:
+        self._queue_size = queue_size
+        self._subscribers: set[asyncio.Queue[dict]] = set()
+
+    def deliver(self, event: dict) -> None:
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(RESYNC_EVENT)
+
+    async def publish(self, event: dict) -> None:
+        self.deliver(event)
+
+    @asynccontextmanager
+    async def subscription(self) -> AsyncIterator[asyncio.Queue[dict]]:
+        queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=self._queue_size)
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+
+class RedisChangeBroker(ChangeBroker):
+    """Redis pub/sub 구현 (멀티 워커/인스턴스).
+
+    워커당 Redis 구독 연결 하나만 열고, 받은 이벤트를 로컬 구독자에게 나눠준다.
+    client는 redis.asyncio.Redis 호환 객체.
+    """
+
+    def __init__(self, client: Any, channel: str = "task_changes") -> None:
+        self._client = client
+        self._channel = channel
+        self._local = InMemoryChangeBroker()
+        self._reader: asyncio.Task | None = None
+
+    async def publish(self, event: dict) -> None:
+        await self._client.publish(self._channel, json.dumps(event))
+
+    async def _read(self) -> None:
+        reconnect = False
+        while True:
+            try:
+                pubsub = self._client.pubsub()
+                await pubsub.subscribe(self._channel)
+                if reconnect:
+                    # 끊긴 사이에 놓친 이벤트가 있을 수 있으므로 재조회 요청
+                    self._local.deliver(RESYNC_EVENT)
+                reconnect = True
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._local.deliver(json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Change broker subscription lost, retrying: %r", e)
+                await asyncio.sleep(1)
+
+    @asynccontextmanager
+    async def subscription(self) -> AsyncIterator[asyncio.Queue[dict]]:
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.create_task(self._read())
+        async with self._local.subscription() as queue:
+            yield queue
+
+
+def create_change_broker(backend: str, redis_url: str = "") -> ChangeBroker:
+    if backend == "memory":
+        return InMemoryChangeBroker()
+    if backend == "redis":
+        if not redis_url:
+            raise ValueError("REDIS_URL must be set when CHANGE_BROKER_BACKEND=redis")
+        from redis.asyncio import Redis
+
+        return RedisChangeBroker(Redis.from_url(redis_url))
+    raise ValueError(f"Unknown CHANGE_BROKER_BACKEND: {backend}")
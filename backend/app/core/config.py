@@ -20,14 +20,71 @@ class Settings(BaseSettings):
     DB_PASSWORD: str = ""
     DB_NAME: str = "pi_management"
 
+    # 읽기 전용 복제본 (비어 있으면 모든 읽기를 primary로)
+    DATABASE_REPLICA_URL: str = ""
+    # 사용자가 쓰기 후 이 시간 동안은 본인 읽기를 primary로 보냄 (read-your-writes)
+    DB_REPLICA_STICKY_SECONDS: int = 5
+    # 최근 쓰기 기록 저장소 (memory: 프로세스 로컬, redis: 워커 간 공유). 워커가 여러 개면 redis 필요
+    DB_REPLICA_STICKY_BACKEND: str = "memory"
+
+    # 커넥션 풀 모드
+    # pgbouncer: NullPool + prepared statement 비활성화 (PgBouncer transaction mode)
+    # pool: 애플리케이션 풀 + statement 캐시 (직접 연결 또는 PgBouncer session mode)
+    DB_POOL_MODE: str = "pgbouncer"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800  # 초
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
     # JWT (프로덕션에서는 반드시 환경변수로 설정)
     SECRET_KEY: str = ""
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    JWT_CACHE_MAX_SIZE: int = 4096  # 검증된 토큰 payload 캐시 (0이면 비활성화)
+
+    # 비밀번호 해싱 (cost 변경 시 로그인 때 자동 재해싱)
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_CONCURRENCY: int = 2
+
+    # 토큰 블랙리스트 저장소 (memory: 프로세스 로컬, redis: 워커 간 공유)
+    TOKEN_BLACKLIST_BACKEND: str = "memory"
+    REDIS_URL: str = ""
+
+    # 태스크 변경 알림 브로커 (memory | redis). 워커가 여러 개면 redis 필요
+    CHANGE_BROKER_BACKEND: str = "memory"
+
+    # 인증 사용자 캐시 (get_current_user의 DB 조회 생략, 0이면 비활성화)
+    # 워커별 캐시라 다른 워커의 비활성화·역할 변경은 최대 TTL만큼 늦게 반영되므로 짧게 유지
+    USER_CACHE_TTL_SECONDS: int = 5
+    USER_CACHE_MAX_SIZE: int = 1024
 
     # Rate Limiting
-    RATE_LIMIT_PER_MINUTE: int = 60
+    RATE_LIMIT_PER_MINUTE: int = 60  # 명시적 제한이 없는 모든 경로의 기본값
+    # 카운터 저장소 (비어 있으면 REDIS_URL, 그것도 없으면 프로세스 로컬 memory://)
+    RATE_LIMIT_STORAGE_URI: str = ""
+    RATE_LIMIT_STRATEGY: str = "moving-window"  # sliding window
+
+    # Upload (0이면 CPU 코어 수만큼 시트 파싱 워커 사용)
+    UPLOAD_PARSE_WORKERS: int = 0
+
+    # Metrics (/metrics는 admin 토큰 또는 이 고정 토큰으로 접근, 비우면 admin만)
+    METRICS_TOKEN: str = ""
+
+    # Query monitor (off | warn | raise): 요청당 같은 형태 쿼리가 임계값을 넘으면 경고/실패
+    QUERY_MONITOR_MODE: str = "off"
+    QUERY_REPEAT_THRESHOLD: int = 10
+    SLOW_QUERY_MS: int = 0  # 0이면 느린 쿼리 로그 비활성화
+
+    # On-demand profiling (admin 요청에 X-Profile: 1 또는 ?profile=1)
+    PROFILE_DIR: str = ""  # 비우면 시스템 임시 디렉터리/profiles
+    PROFILE_SAMPLE_INTERVAL_MS: int = 5
+    PROFILE_MAX_FILES: int = 50
+
+    # 기동 시 DB 연결·트리 조회 warm-up (완료 후 요청 수신)
+    STARTUP_WARMUP: bool = False
 
     # CORS - 환경변수에서 문자열로 받아서 파싱
     CORS_ORIGINS_STR: str = ""
@@ -39,6 +96,15 @@ class Settings(BaseSettings):
             return self.DATABASE_URL
         return f"postgresql+asyncpg://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def rate_limit_storage_uri(self) -> str:
+        """Rate limit 카운터 저장소 URI"""
+        if self.RATE_LIMIT_STORAGE_URI:
+            return self.RATE_LIMIT_STORAGE_URI
+        if self.REDIS_URL:
+            return self.REDIS_URL
+        return "memory://"
+
     @property
     def secret_key(self) -> str:
         """시크릿 키 반환 (없으면 랜덤 생성 - 개발용)"""
@@ -0,0 +1,211 @@
+"""요청 단위 성능 계측과 Prometheus 텍스트 포맷 출력.
+
+- MetricsMiddleware: 경로별 지연 시간/응답 크기 히스토그램, 상태 코드 카운터,
+  요청당 쿼리 수·DB 시간 (Server-Timing 헤더로도 반환)
+- instrument_engine: SQLAlchemy 엔진 이벤트로 현재 요청의 쿼리 수·DB 시간 누적
+
+외부 의존성 없이 프로세스 로컬로 집계한다 (워커별 값).
+"""
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 500)
+
+
+def _labels(names: tuple[str, ...], values: tuple) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{str(v).replace(chr(34), "")}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name, self.help, self.labelnames = name, help, labelnames
+        self.values: dict[tuple, float] = {}
+
+    def inc(self, labels: tuple = (), amount: float = 1.0) -> None:
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for labels, value in self.values.items():
+            lines.append(f"{self.name}{_labels(self.labelnames, labels)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self, name: str, help: str, labelnames: tuple[str, ...], buckets: tuple[float, ...]
+    ) -> None:
+        self.name, self.help, self.labelnames, self.buckets = name, help, labelnames, buckets
+        # labels → [bucket counts..., +Inf count, sum]
+        self.values: dict[tuple, list[float]] = {}
+
+    def observe(self, labels: tuple, value: float) -> None:
+        series = self.values.get(labels)
+        if series is None:
+            series = self.values[labels] = [0.0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, series in self.values.items():
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, "+Inf"), series[:-1]):
+                cumulative += count
+                le_labels = _labels((*self.labelnames, "le"), (*labels, bound))
+                lines.append(f"{self.name}_bucket{le_labels} {cumulative}")
+            base = _labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{base} {series[-1]}")
+            lines.append(f"{self.name}_count{base} {cumulative}")
+        return lines
+
+
+def gauge_lines(name: str, help: str, value: float) -> list[str]:
+    return [f"# HELP {name} {help}", f"# TYPE {name} gauge", f"{name} {value}"]
+
+
+ROUTE_LABELS = ("method", "route")
+requests_total = Counter("http_requests_total", "HTTP requests", ("method", "route", "status"))
+request_duration = Histogram(
+    "http_request_duration_seconds", "Request latency", ROUTE_LABELS, LATENCY_BUCKETS
+)
+response_size = Histogram(
+    "http_response_size_bytes", "Response body size", ROUTE_LABELS, SIZE_BUCKETS
+)
+db_queries = Histogram(
+    "http_request_db_queries", "DB queries per request", ROUTE_LABELS, QUERY_COUNT_BUCKETS
+)
+db_duration = Histogram(
+    "http_request_db_duration_seconds", "DB time per request", ROUTE_LABELS, LATENCY_BUCKETS
+)
+
+# 추가 지표 제공자 (각 모듈의 캐시/풀 통계 등): 이름 접두사 → dict 반환 함수
+_collectors: dict[str, Callable[[], dict]] = {}
+
+
+def register_collector(prefix: str, collect: Callable[[], dict]) -> None:
+    _collectors[prefix] = collect
+
+
+def render_metrics() -> str:
+    lines: list[str] = []
+    for metric in (requests_total, request_duration, response_size, db_queries, db_duration):
+        lines.extend(metric.render())
+    for prefix, collect in _collectors.items():
+        for key, value in collect().items():
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            lines.extend(gauge_lines(f"{prefix}_{key}", f"{prefix} {key}", value))
+    return "\n".join(lines) + "\n"
+
+
+class RequestStats:
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+current_request_stats: ContextVar[RequestStats | None] = ContextVar("current_request_stats", default=None)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """엔진의 커서 실행 시간을 현재 요청 통계에 누적 (실패한 문장 포함).
+
+    시작 시각은 실행마다 새로 만들어지는 execution context에 두므로 실패해도 남지 않는다.
+    """
+    sync_engine = engine.sync_engine
+
+    def _record(context) -> None:
+        started_at = getattr(context, "_metrics_started_at", None)
+        if started_at is None:
+            return
+        context._metrics_started_at = None
+        stats = current_request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_seconds += time.perf_counter() - started_at
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metrics_started_at = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        _record(context)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(exception_context):
+        _record(exception_context.execution_context)
+
+
+class MetricsMiddleware:
+    """순수 ASGI 미들웨어 (스트리밍 응답도 본문을 버퍼링하지 않음)."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+        self._route_paths: dict[Callable, str] = {}
+
+    def _route_label(self, scope) -> str:
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            # 라우터가 scope에 endpoint만 남기므로 최초 1회 라우트 템플릿으로 역매핑
+            for route in scope["app"].routes:
+                if getattr(route, "endpoint", None) is endpoint:
+                    path = route.path
+                    break
+            else:
+                path = "unmatched"
+            self._route_paths[endpoint] = path
+        return path
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        started_at = time.perf_counter()
+        status_code = 500
+        body_size = 0
+
+        async def send_wrapper(message) -> None:
+            nonlocal status_code, body_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed_ms = (time.perf_counter() - started_at) * 1000
+                timing = (
+                    f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.queries} queries", '
+                    f"app;dur={elapsed_ms:.1f}"
+                ).encode()
+                message["headers"] = [*message.get("headers", []), (b"server-timing", timing)]
+            elif message["type"] == "http.response.body":
+                body_size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_request_stats.reset(token)
+            labels = (scope["method"], self._route_label(scope))
+            requests_total.inc((*labels, status_code))
+            request_duration.observe(labels, time.perf_counter() - started_at)
+            response_size.observe(labels, body_size)
+            db_queries.observe(labels, stats.queries)
+            db_duration.observe(labels, stats.db_seconds)
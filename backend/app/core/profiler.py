@@ -0,0 +1,80 @@
+"""요청 단위 샘플링 프로파일러와 프로파일 저장소.
+
+대상 스레드(이벤트 루프)의 스택을 주기적으로 샘플링해 collapsed stack 형식
+(flamegraph.pl, speedscope 호환)으로 PROFILE_DIR에 저장한다.
+같은 루프에서 동시에 처리 중인 다른 요청의 스택도 함께 잡힐 수 있다.
+"""
+import os
+import re
+import sys
+import tempfile
+import threading
+from collections import Counter
+from pathlib import Path
+
+from app.core.config import settings
+
+PROFILE_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+
+def profile_dir() -> Path:
+    path = Path(settings.PROFILE_DIR or os.path.join(tempfile.gettempdir(), "profiles"))
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def profile_path(profile_id: str) -> Path | None:
+    """저장된 프로파일 경로 (형식이 잘못됐거나 없으면 None)."""
+    if not PROFILE_ID_PATTERN.match(profile_id):
+        return None
+    path = profile_dir() / f"{profile_id}.collapsed"
+    return path if path.is_file() else None
+
+
+def _frame_label(code) -> str:
+    filename = "/".join(Path(code.co_filename).parts[-2:])
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """별도 스레드에서 대상 스레드의 스택을 interval마다 수집."""
+
+    def __init__(self, thread_id: int, interval: float) -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def _run(self) -> None:
+        labels: dict = {}
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                label = labels.get(code)
+                if label is None:
+                    label = labels[code] = _frame_label(code)
+                stack.append(label)
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def __enter__(self) -> "SamplingProfiler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def save(self, profile_id: str) -> Path:
+        directory = profile_dir()
+        path = directory / f"{profile_id}.collapsed"
+        path.write_text("".join(f"{stack} {count}\n" for stack, count in self.stacks.items()))
+        # 오래된 프로파일 정리
+        saved = sorted(directory.glob("*.collapsed"), key=lambda p: p.stat().st_mtime)
+        for old in saved[: max(len(saved) - settings.PROFILE_MAX_FILES, 0)]:
+            old.unlink(missing_ok=True)
+        return path
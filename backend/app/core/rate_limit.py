@@ -3,6 +3,7 @@ from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from fastapi import Request
 from fastapi.responses import JSONResponse
+from app.core.config import settings
 
 
 def get_client_ip(request: Request) -> str:
@@ -22,7 +23,15 @@ def get_client_ip(request: Request) -> str:
 
 
 # Rate limiter 인스턴스
-limiter = Limiter(key_func=get_client_ip)
+# Redis 저장소를 쓰면 워커/인스턴스가 카운터를 공유하여 "5/minute"이 전체 기준으로 적용된다.
+# moving-window 전략은 Redis에서 Lua 스크립트로 원자적으로 증가·검사한다.
+limiter = Limiter(
+    key_func=get_client_ip,
+    default_limits=[f"{settings.RATE_LIMIT_PER_MINUTE}/minute"],
+    storage_uri=settings.rate_limit_storage_uri,
+    strategy=settings.RATE_LIMIT_STRATEGY,
+    key_prefix="rate_limit",
+)
 
 
 async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
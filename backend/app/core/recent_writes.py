@@ -0,0 +1,65 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Any
+from uuid import UUID
+
+from .cache import TTLCache
+
+
+class RecentWrites(ABC):
+    """최근 쓰기를 한 사용자 목록 (read-your-writes). 항목은 ttl초 후 사라진다."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+
+    @abstractmethod
+    async def mark(self, user_id: UUID) -> None:
+        """사용자의 쓰기를 기록."""
+
+    @abstractmethod
+    async def contains(self, user_id: UUID) -> bool:
+        """ttl 안에 쓰기를 한 사용자인지 확인."""
+
+
+class InMemoryRecentWrites(RecentWrites):
+    """프로세스 로컬 구현 (단일 워커/개발용). 다른 워커의 쓰기는 보지 못한다."""
+
+    def __init__(self, ttl: float, maxsize: int = 10000) -> None:
+        super().__init__(ttl)
+        self._writers: TTLCache[UUID, bool] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def mark(self, user_id: UUID) -> None:
+        self._writers.set(user_id, True)
+
+    async def contains(self, user_id: UUID) -> bool:
+        return bool(self._writers.get(user_id))
+
+
+class RedisRecentWrites(RecentWrites):
+    """Redis 구현 (멀티 워커/인스턴스 공유). 만료는 Redis 키 TTL에 맡긴다."""
+
+    def __init__(self, client: Any, ttl: float, prefix: str = "recent_write:") -> None:
+        super().__init__(ttl)
+        self._client = client
+        self._prefix = prefix
+
+    async def mark(self, user_id: UUID) -> None:
+        ttl_ms = int(self.ttl * 1000)
+        if ttl_ms <= 0:
+            return
+        await self._client.set(f"{self._prefix}{user_id}", int(time.time()), px=ttl_ms)
+
+    async def contains(self, user_id: UUID) -> bool:
+        return bool(await self._client.exists(f"{self._prefix}{user_id}"))
+
+
+def create_recent_writes(backend: str, ttl: float, redis_url: str = "") -> RecentWrites:
+    if backend == "memory":
+        return InMemoryRecentWrites(ttl)
+    if backend == "redis":
+        if not redis_url:
+            raise ValueError("REDIS_URL must be set when DB_REPLICA_STICKY_BACKEND=redis")
+        from redis.asyncio import Redis
+
+        return RedisRecentWrites(Redis.from_url(redis_url), ttl)
+    raise ValueError(f"Unknown DB_REPLICA_STICKY_BACKEND: {backend}")
@@ -2,14 +2,69 @@ from datetime import datetime, timedelta
 from typing import Any
 from jose import jwt, JWTError
 from passlib.context import CryptContext
+from .cache import TTLCache
 from .config import settings
+from .token_blacklist import TokenBlacklist, create_token_blacklist
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import hashlib
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-# 토큰 블랙리스트 (프로덕션에서는 Redis 사용 권장)
-# 메모리 기반 블랙리스트 (서버 재시작 시 초기화됨)
-_token_blacklist: set[str] = set()
+import time
+from uuid import uuid4
+
+# 설정된 cost와 다른 해시는 needs_update로 판단되어 로그인 시 재해싱된다
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
+
+# bcrypt 전용 스레드풀 (bcrypt는 GIL을 해제하므로 이벤트 루프를 막지 않음)
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_CONCURRENCY, thread_name_prefix="bcrypt"
+)
+_hash_semaphore: asyncio.Semaphore | None = None
+
+
+class PasswordHashMetrics:
+    """해싱 작업의 대기 시간(queue wait)과 실행 시간(latency) 누적 통계."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.in_flight = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def observe(self, wait: float, latency: float) -> None:
+        self.count += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+
+    def snapshot(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "in_flight": self.in_flight,
+            "latency_avg_seconds": self.latency_total / self.count if self.count else 0.0,
+            "latency_max_seconds": self.latency_max,
+            "wait_avg_seconds": self.wait_total / self.count if self.count else 0.0,
+            "wait_max_seconds": self.wait_max,
+        }
+
+
+password_hash_metrics = PasswordHashMetrics()
+
+# 토큰 해시 → 검증된 payload (토큰 exp까지 유효)
+_jwt_cache: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=settings.JWT_CACHE_MAX_SIZE, ttl=0)
+
+# 토큰 블랙리스트 (TOKEN_BLACKLIST_BACKEND=redis면 워커 간 공유)
+_token_blacklist: TokenBlacklist = create_token_blacklist(
+    settings.TOKEN_BLACKLIST_BACKEND, settings.REDIS_URL
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -20,44 +75,107 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password[:72])
 
 
+async def _run_hash_job(func, *args):
+    """bcrypt 작업을 전용 풀에서 동시 실행 수를 제한해 실행하고 지표를 기록."""
+    global _hash_semaphore
+    if _hash_semaphore is None:
+        _hash_semaphore = asyncio.Semaphore(settings.PASSWORD_HASH_CONCURRENCY)
+
+    queued_at = time.perf_counter()
+    async with _hash_semaphore:
+        started_at = time.perf_counter()
+        password_hash_metrics.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_hash_executor, func, *args)
+        finally:
+            password_hash_metrics.in_flight -= 1
+            password_hash_metrics.observe(
+                started_at - queued_at, time.perf_counter() - started_at
+            )
+
+
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """비밀번호 검증 (비동기). cost가 바뀐 해시면 새 해시도 함께 반환."""
+    return await _run_hash_job(
+        pwd_context.verify_and_update, plain_password[:72], hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await _run_hash_job(pwd_context.hash, password[:72])
+
+
+# jti: 같은 초에 발급된 토큰도 서로 달라야 하나를 폐기해도 다른 토큰(갱신 결과 등)이 함께 폐기되지 않는다
 def create_access_token(data: dict[str, Any]) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire, "type": "access"})
+    to_encode.update({"exp": expire, "type": "access", "jti": uuid4().hex})
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.ALGORITHM)
 
 
 def create_refresh_token(data: dict[str, Any]) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh"})
+    to_encode.update({"exp": expire, "type": "refresh", "jti": uuid4().hex})
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.ALGORITHM)
 
 
 def decode_token(token: str) -> dict[str, Any] | None:
+    """서명·만료 검증 후 payload 반환. 검증된 토큰은 exp까지 캐시해 재검증을 생략.
+
+    반환된 payload는 캐시와 공유되므로 수정하지 않는다.
+    """
+    key = _hash_token(token)
+    payload = _jwt_cache.get(key)
+    if payload is not None:
+        return payload
+
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.ALGORITHM])
-        return payload
     except JWTError:
         return None
 
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        _jwt_cache.set(key, payload, ttl=exp - time.time())
+    return payload
+
+
+def jwt_cache_stats() -> dict[str, float]:
+    """검증 토큰 캐시 적중률 통계."""
+    return _jwt_cache.stats
+
 
 def _hash_token(token: str) -> str:
     """토큰을 해시하여 저장 (메모리 절약)"""
     return hashlib.sha256(token.encode()).hexdigest()
 
 
-def add_token_to_blacklist(token: str) -> None:
-    """토큰을 블랙리스트에 추가"""
-    _token_blacklist.add(_hash_token(token))
+def _token_expires_at(token: str) -> float:
+    """토큰의 exp (unix timestamp). 읽을 수 없으면 가장 긴 수명(refresh)으로 간주."""
+    try:
+        exp = jwt.get_unverified_claims(token).get("exp")
+    except JWTError:
+        exp = None
+    if isinstance(exp, (int, float)):
+        return float(exp)
+    return time.time() + settings.REFRESH_TOKEN_EXPIRE_DAYS * 86400
+
+
+async def add_token_to_blacklist(token: str) -> None:
+    """토큰을 만료 시각까지 블랙리스트에 추가"""
+    _jwt_cache.pop(_hash_token(token))
+    await _token_blacklist.add(_hash_token(token), _token_expires_at(token))
 
 
-def is_token_blacklisted(token: str) -> bool:
+async def is_token_blacklisted(token: str) -> bool:
     """토큰이 블랙리스트에 있는지 확인"""
-    return _hash_token(token) in _token_blacklist
+    return await _token_blacklist.contains(_hash_token(token))
 
 
-def clear_expired_tokens() -> None:
-    """만료된 토큰 정리 (주기적으로 호출 권장)"""
-    # 프로덕션에서는 Redis TTL 사용 권장
-    pass
+async def clear_expired_tokens() -> int:
+    """만료된 토큰 정리 (메모리 저장소는 추가 시 자동 정리, Redis는 TTL로 처리)"""
+    return await _token_blacklist.clear_expired()
@@ -0,0 +1,130 @@
+"""프로덕션 SPA 정적 파일 서빙.
+
+시작 시 static 디렉터리를 한 번 훑어 파일 목록(manifest)과 stat을 메모리에 두므로
+요청마다 파일 시스템을 조회하지 않는다 (배포 시 재시작으로 갱신).
+
+- 빌드 시 만든 .br / .gz 파일이 있으면 Accept-Encoding에 맞춰 그대로 전송
+- /assets 아래 해시된 파일은 immutable 장기 캐시
+- index.html은 메모리에 두고 ETag로 재검증 (SPA fallback도 index.html).
+  본문이 인코딩마다 다르므로 ETag도 인코딩별로 둔다 ("<hash>", "<hash>-gz", "<hash>-br")
+"""
+import hashlib
+import mimetypes
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+
+ASSETS_PREFIX = "assets/"
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+ETAG_SUFFIXES = {"identity": "", "br": "-br", "gzip": "-gz"}
+
+
+@dataclass
+class StaticFile:
+    path: str
+    stat: os.stat_result
+    media_type: str
+    # content-encoding → (경로, stat)
+    variants: dict[str, tuple[str, os.stat_result]] = field(default_factory=dict)
+
+
+@dataclass
+class CachedFile:
+    media_type: str
+    # content-encoding("identity" 포함) → 본문 / 강한 ETag
+    bodies: dict[str, bytes]
+    etags: dict[str, str]
+
+
+def _accepted_encodings(headers: Headers) -> set[str]:
+    accepted = set()
+    for part in headers.get("accept-encoding", "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding and params.replace(" ", "") not in ("q=0", "q=0.0"):
+            accepted.add(coding.lower())
+    return accepted
+
+
+def _pick_encoding(available, headers: Headers) -> str | None:
+    accepted = _accepted_encodings(headers)
+    for encoding, _ in ENCODINGS:
+        if encoding in available and (encoding in accepted or "*" in accepted):
+            return encoding
+    return None
+
+
+class SpaFiles:
+    def __init__(self, directory: str) -> None:
+        self.directory = os.path.realpath(directory)
+        self.files = self._scan()
+        self.index = self._load_index()
+
+    def _scan(self) -> dict[str, StaticFile]:
+        files: dict[str, StaticFile] = {}
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                path = os.path.join(root, name)
+                rel = os.path.relpath(path, self.directory).replace(os.sep, "/")
+                media_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+                files[rel] = StaticFile(path, os.stat(path), media_type)
+        # 빌드 시 만든 압축본을 원본 파일의 변형으로 연결
+        for rel, static_file in files.items():
+            for encoding, suffix in ENCODINGS:
+                variant = files.get(rel + suffix)
+                if variant is not None:
+                    static_file.variants[encoding] = (variant.path, variant.stat)
+        return files
+
+    def _load_index(self) -> CachedFile:
+        index = self.files["index.html"]
+        bodies = {"identity": Path(index.path).read_bytes()}
+        for encoding, (path, _) in index.variants.items():
+            bodies[encoding] = Path(path).read_bytes()
+        digest = hashlib.sha256(bodies["identity"]).hexdigest()[:32]
+        etags = {encoding: f'"{digest}{ETAG_SUFFIXES[encoding]}"' for encoding in bodies}
+        return CachedFile(media_type="text/html; charset=utf-8", bodies=bodies, etags=etags)
+
+    def response(self, full_path: str, headers: Headers) -> Response:
+        static_file = self.files.get(full_path)
+        if static_file is not None and full_path != "index.html":
+            return self._file_response(full_path, static_file, headers)
+        if full_path.startswith(ASSETS_PREFIX):
+            # 없는 에셋에 index.html을 주면 브라우저가 HTML을 JS/CSS로 해석하려 한다
+            return Response(status_code=404)
+        return self._index_response(headers)
+
+    def _file_response(self, full_path: str, static_file: StaticFile, headers: Headers) -> Response:
+        cache_control = IMMUTABLE_CACHE if full_path.startswith(ASSETS_PREFIX) else REVALIDATE_CACHE
+        response_headers = {"Cache-Control": cache_control}
+        path, stat = static_file.path, static_file.stat
+        if static_file.variants:
+            response_headers["Vary"] = "Accept-Encoding"
+            encoding = _pick_encoding(static_file.variants, headers)
+            if encoding is not None:
+                path, stat = static_file.variants[encoding]
+                response_headers["Content-Encoding"] = encoding
+        return FileResponse(
+            path, stat_result=stat, media_type=static_file.media_type, headers=response_headers
+        )
+
+    def _index_response(self, headers: Headers) -> Response:
+        index = self.index
+        # 보낼 인코딩을 먼저 정하고 그 본문의 ETag로만 재검증
+        encoding = _pick_encoding(index.bodies, headers) or "identity"
+        etag = index.etags[encoding]
+        response_headers = {
+            "Cache-Control": REVALIDATE_CACHE,
+            "ETag": etag,
+            "Vary": "Accept-Encoding",
+        }
+        if_none_match = headers.get("if-none-match", "")
+        if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=response_headers)
+        if encoding != "identity":
+            response_headers["Content-Encoding"] = encoding
+        return Response(index.bodies[encoding], media_type=index.media_type, headers=response_headers)
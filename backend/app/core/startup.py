@@ -0,0 +1,93 @@
+"""콜드 스타트 지원: 시작 시 warm-up과 import 시간 리포트.
+
+import 시간 리포트는 새 인터프리터에서 측정한다:
+
+    python -m app.core.startup [--top 20] [--budget-ms 1500]
+
+`python -X importtime -c "import app.main"` 결과를 최상위 패키지별로 합산해
+출력하고, 전체가 budget을 넘으면 exit 1.
+"""
+import argparse
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from sqlalchemy import text
+
+
+async def warm_up() -> dict[str, float]:
+    """첫 사용자 요청이 치르던 비용을 시작 시 미리 치른다 (단계별 소요 초 반환).
+
+    - primary / replica DB 연결 수립
+    - 트리 조회 쿼리 1회 실행 (SQLAlchemy 컴파일 캐시, PostgreSQL 버퍼 캐시)
+    - bcrypt 백엔드 로드 (passlib 자체 검사)
+    """
+    from app.core.security import pwd_context
+    from app.db.session import async_read_session, engine, replica_engine
+    from app.services import task_service
+
+    timings: dict[str, float] = {}
+
+    started_at = time.perf_counter()
+    for db_engine in (engine, replica_engine):
+        if db_engine is not None:
+            async with db_engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+    timings["db_connect"] = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    async with async_read_session() as db:
+        await task_service.get_all_tasks(db)
+    timings["task_tree"] = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    pwd_context.handler().get_backend()
+    timings["password_hash"] = time.perf_counter() - started_at
+
+    return timings
+
+
+def import_report(module: str = "app.main") -> list[tuple[str, int, int]]:
+    """(모듈, self μs, cumulative μs) 목록 (import 순서)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        entries.append((name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="app.main import 시간 리포트")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=0, help="초과 시 exit 1 (0이면 검사 안 함)")
+    args = parser.parse_args()
+
+    entries = import_report()
+    by_package: dict[str, int] = defaultdict(int)
+    for name, self_us, _ in entries:
+        by_package[name.split(".")[0]] += self_us
+    total_ms = entries[-1][2] / 1000 if entries else 0.0
+
+    print(f"import app.main: {total_ms:.1f} ms\n")
+    print("by top-level package (self time)")
+    for package, us in sorted(by_package.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"  {us / 1000:8.1f} ms  {package}")
+    print("\nslowest app modules (cumulative)")
+    app_modules = [entry for entry in entries if entry[0].startswith("app.")]
+    for name, _, cumulative_us in sorted(app_modules, key=lambda e: -e[2])[: args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    return 1 if args.budget_ms and total_ms > args.budget_ms else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
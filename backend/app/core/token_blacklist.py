@@ -0,0 +1,95 @@
+import heapq
+import time
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class TokenBlacklist(ABC):
+    """로그아웃/갱신으로 폐기된 토큰 해시 저장소. 항목은 토큰 만료(exp)와 함께 사라진다."""
+
+    @abstractmethod
+    async def add(self, token_hash: str, expires_at: float) -> None:
+        """토큰 해시를 expires_at(unix timestamp)까지 폐기 목록에 추가."""
+
+    @abstractmethod
+    async def contains(self, token_hash: str) -> bool:
+        """폐기된(아직 만료되지 않은) 토큰인지 확인."""
+
+    @abstractmethod
+    async def clear_expired(self) -> int:
+        """만료된 항목 정리. 정리한 개수를 반환."""
+
+
+class InMemoryTokenBlacklist(TokenBlacklist):
+    """프로세스 로컬 구현 (단일 워커/개발용).
+
+    dict로 O(1) 조회하고, 만료 순 힙으로 추가 시점마다 만료 항목을 정리한다.
+    """
+
+    def __init__(self) -> None:
+        self._expires: dict[str, float] = {}
+        self._heap: list[tuple[float, str]] = []
+
+    async def add(self, token_hash: str, expires_at: float) -> None:
+        if expires_at <= time.time():
+            return
+        self._expires[token_hash] = expires_at
+        heapq.heappush(self._heap, (expires_at, token_hash))
+        await self.clear_expired()
+
+    async def contains(self, token_hash: str) -> bool:
+        expires_at = self._expires.get(token_hash)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            del self._expires[token_hash]
+            return False
+        return True
+
+    async def clear_expired(self) -> int:
+        now = time.time()
+        removed = 0
+        while self._heap and self._heap[0][0] <= now:
+            expires_at, token_hash = heapq.heappop(self._heap)
+            if self._expires.get(token_hash) == expires_at:
+                del self._expires[token_hash]
+                removed += 1
+        return removed
+
+    def __len__(self) -> int:
+        return len(self._expires)
+
+
+class RedisTokenBlacklist(TokenBlacklist):
+    """Redis 구현 (멀티 워커/인스턴스 공유). 만료는 Redis 키 TTL에 맡긴다.
+
+    client는 redis.asyncio.Redis 호환 객체 (테스트에서는 fakeredis 등으로 대체 가능).
+    """
+
+    def __init__(self, client: Any, prefix: str = "token_blacklist:") -> None:
+        self._client = client
+        self._prefix = prefix
+
+    async def add(self, token_hash: str, expires_at: float) -> None:
+        ttl_ms = int((expires_at - time.time()) * 1000)
+        if ttl_ms <= 0:
+            return
+        await self._client.set(self._prefix + token_hash, 1, px=ttl_ms)
+
+    async def contains(self, token_hash: str) -> bool:
+        return bool(await self._client.exists(self._prefix + token_hash))
+
+    async def clear_expired(self) -> int:
+        return 0
+
+
+def create_token_blacklist(backend: str, redis_url: str = "") -> TokenBlacklist:
+    if backend == "memory":
+        return InMemoryTokenBlacklist()
+    if backend == "redis":
+        if not redis_url:
+            raise ValueError("REDIS_URL must be set when TOKEN_BLACKLIST_BACKEND=redis")
+        from redis.asyncio import Redis
+
+        return RedisTokenBlacklist(Redis.from_url(redis_url))
+    raise ValueError(f"Unknown TOKEN_BLACKLIST_BACKEND: {backend}")
@@ -0,0 +1,231 @@
+"""대용량 합성 데이터 생성기 (벤치마크/용량 테스트용).
+
+asyncpg COPY로 적재하며 시드가 같으면 항상 같은 데이터(UUID 포함)를 만든다.
+
+    python -m app.db.generate --l1 10 --fanout 20,50,100 --history-depth 10 --reset
+
+위 예시는 L4 100만 개(전체 약 101만 태스크), 이력 약 1,010만 건을 생성한다.
+tasks가 비어 있지 않으면 --reset 없이는 실행을 거부한다.
+스키마는 미리 만들어 두어야 한다 (alembic upgrade head 또는 --create-schema).
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import asyncpg
+
+from app.core.config import settings
+from app.core.security import get_password_hash
+from app.db.session import Base, engine
+from app.services.keyword_facets import REBUILD_STATEMENTS as FACET_REBUILD_STATEMENTS
+from app.services.task_aggregates import REBUILD_STATEMENTS
+import app.models  # noqa: F401  (메타데이터에 모델 등록)
+
+TASK_COLUMNS = [
+    "id", "parent_id", "level", "name", "organization", "team", "manager_name",
+    "manager_id", "keywords", "is_ai_utilized", "version", "created_by",
+    "updated_by", "created_at", "updated_at",
+]
+HISTORY_COLUMNS = ["id", "task_id", "snapshot", "version", "change_type", "changed_by", "changed_at"]
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class Shape:
+    """생성할 트리 모양."""
+
+    l1_count: int = 10
+    fanout: tuple[int, int, int] = (4, 4, 7)  # L1→L2, L2→L3, L3→L4 자식 수
+    keyword_cardinality: int = 200  # 키워드 어휘 크기
+    keywords_per_task: int = 3
+    history_depth: int = 1  # 태스크당 이력 수 (CREATE 1 + UPDATE n-1)
+    ai_ratio: float = 0.4
+
+    @property
+    def task_count(self) -> int:
+        f2, f3, f4 = self.fanout
+        return 1 + self.l1_count * (1 + f2 * (1 + f3 * (1 + f4)))
+
+
+class Generator:
+    """시드 고정 RNG로 태스크/이력 레코드를 깊이 우선 순서(부모 먼저)로 생성."""
+
+    def __init__(self, shape: Shape, seed: int, admin_id: uuid.UUID) -> None:
+        self.shape = shape
+        self.rng = random.Random(seed)
+        self.admin_id = admin_id
+        self.vocabulary = [f"kw{i:05d}" for i in range(shape.keyword_cardinality)]
+        self.managers = [(f"담당자{i:03d}", f"EMP{i:05d}") for i in range(100)]
+        self._seq = 0
+
+    def _uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def _task(self, parent_id, level, name, organization) -> tuple:
+        rng = self.rng
+        self._seq += 1
+        created_at = BASE_TIME + timedelta(seconds=self._seq)
+        manager_name, manager_id = rng.choice(self.managers)
+        keywords = rng.sample(self.vocabulary, min(self.shape.keywords_per_task, len(self.vocabulary)))
+        return (
+            self._uuid(), parent_id, level, name, organization, f"{organization}팀",
+            manager_name, manager_id, keywords, rng.random() < self.shape.ai_ratio,
+            self.shape.history_depth, self.admin_id, self.admin_id, created_at, created_at,
+        )
+
+    def histories(self, task: tuple) -> list[tuple]:
+        task_id, parent_id, level, name, organization = task[:5]
+        snapshot = json.dumps(
+            {
+                "parent_id": str(parent_id) if parent_id else None,
+                "level": level,
+                "name": name,
+                "organization": organization,
+                "team": task[5],
+                "manager_name": task[6],
+                "manager_id": task[7],
+                "keywords": task[8],
+                "is_ai_utilized": task[9],
+            },
+            ensure_ascii=False,
+        )
+        created_at = task[13]
+        return [
+            (
+                self._uuid(), task_id, snapshot, version,
+                "CREATE" if version == 1 else "UPDATE", self.admin_id,
+                created_at + timedelta(minutes=version - 1),
+            )
+            for version in range(1, self.shape.history_depth + 1)
+        ]
+
+    def tasks(self) -> Iterator[tuple]:
+        f2, f3, f4 = self.shape.fanout
+        root = self._task(None, "Root", "Root", "전사")
+        yield root
+        for i in range(self.shape.l1_count):
+            org = f"조직{i:03d}"
+            l1 = self._task(root[0], "L1", org, org)
+            yield l1
+            for j in range(f2):
+                l2 = self._task(l1[0], "L2", f"{org} 업무{j:03d}", org)
+                yield l2
+                for k in range(f3):
+                    l3 = self._task(l2[0], "L3", f"세부{k:03d}", org)
+                    yield l3
+                    for m in range(f4):
+                        yield self._task(l3[0], "L4", f"과제{m:04d}", org)
+
+
+def _asyncpg_dsn() -> str:
+    return settings.database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+async def _ensure_admin(conn: asyncpg.Connection) -> uuid.UUID:
+    admin_id = await conn.fetchval("SELECT id FROM users WHERE employee_id = 'admin'")
+    if admin_id:
+        return admin_id
+    admin_id = uuid.uuid4()
+    await conn.execute(
+        "INSERT INTO users (id, employee_id, password_hash, name, organization, role, is_active, created_at)"
+        " VALUES ($1, 'admin', $2, '관리자', '전사', 'admin', true, now())",
+        admin_id, get_password_hash("admin123"),
+    )
+    return admin_id
+
+
+async def generate(shape: Shape, seed: int, batch_size: int, reset: bool) -> dict:
+    conn = await asyncpg.connect(_asyncpg_dsn(), statement_cache_size=0)
+    started_at = time.perf_counter()
+    counts = {"tasks": 0, "histories": 0}
+    try:
+        await conn.execute("SET synchronous_commit = off")
+        async with conn.transaction():
+            if reset:
+                await conn.execute("TRUNCATE task_histories, tasks")
+            elif await conn.fetchval("SELECT EXISTS (SELECT 1 FROM tasks)"):
+                # 같은 시드는 같은 UUID를 만들고 Root가 둘이 되므로 기존 트리에 덧붙이지 않는다
+                raise ValueError("tasks가 비어 있지 않습니다. --reset으로 비운 뒤 생성하세요.")
+            admin_id = await _ensure_admin(conn)
+            gen = Generator(shape, seed, admin_id)
+
+            task_batch: list[tuple] = []
+            history_batch: list[tuple] = []
+
+            async def flush() -> None:
+                if task_batch:
+                    await conn.copy_records_to_table("tasks", records=task_batch, columns=TASK_COLUMNS)
+                    counts["tasks"] += len(task_batch)
+                if history_batch:
+                    await conn.copy_records_to_table(
+                        "task_histories", records=history_batch, columns=HISTORY_COLUMNS
+                    )
+                    counts["histories"] += len(history_batch)
+                task_batch.clear()
+                history_batch.clear()
+
+            for task in gen.tasks():
+                task_batch.append(task)
+                history_batch.extend(gen.histories(task))
+                if len(history_batch) >= batch_size or len(task_batch) >= batch_size:
+                    await flush()
+            await flush()
+            for statement in (*REBUILD_STATEMENTS, *FACET_REBUILD_STATEMENTS):
+                await conn.execute(statement)
+
+        await conn.execute("ANALYZE tasks")
+        await conn.execute("ANALYZE task_histories")
+    finally:
+        await conn.close()
+
+    counts["seconds"] = round(time.perf_counter() - started_at, 1)
+    return counts
+
+
+async def _create_schema() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="대용량 합성 태스크/이력 데이터 생성 (COPY)")
+    parser.add_argument("--l1", type=int, default=10, help="L1 노드 수")
+    parser.add_argument("--fanout", default="4,4,7", help="L2,L3,L4 자식 수 (예: 20,50,100)")
+    parser.add_argument("--keywords", type=int, default=200, help="키워드 어휘 크기")
+    parser.add_argument("--keywords-per-task", type=int, default=3)
+    parser.add_argument("--history-depth", type=int, default=1, help="태스크당 이력 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=50_000, help="COPY 1회당 최대 행 수")
+    parser.add_argument(
+        "--reset", action="store_true", help="기존 tasks / task_histories 비우기 (tasks가 있으면 필수)"
+    )
+    parser.add_argument("--create-schema", action="store_true", help="테이블이 없으면 생성")
+    args = parser.parse_args()
+
+    f2, f3, f4 = (int(x) for x in args.fanout.split(","))
+    shape = Shape(
+        l1_count=args.l1,
+        fanout=(f2, f3, f4),
+        keyword_cardinality=args.keywords,
+        keywords_per_task=args.keywords_per_task,
+        history_depth=args.history_depth,
+    )
+    print(f"Generating {shape.task_count} tasks, {shape.task_count * shape.history_depth} histories (seed={args.seed})")
+    if args.create_schema:
+        asyncio.run(_create_schema())
+    try:
+        counts = asyncio.run(generate(shape, args.seed, args.batch_size, args.reset))
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"Done: {counts['tasks']} tasks, {counts['histories']} histories in {counts['seconds']}s")
+
+
+if __name__ == "__main__":
+    main()
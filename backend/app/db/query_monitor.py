@@ -0,0 +1,159 @@
+"""N+1 쿼리 탐지와 느린 쿼리 로그.
+
+- QUERY_MONITOR_MODE=warn|raise: 요청(또는 monitor_queries 블록) 안에서 같은 형태의
+  SQL이 QUERY_REPEAT_THRESHOLD번을 넘게 실행되면 경고 로그 또는 QueryRepetitionError
+- SLOW_QUERY_MS > 0: 해당 시간을 넘긴 쿼리를 파라미터·호출 위치와 함께 로그
+
+둘 다 꺼져 있으면 엔진 이벤트를 등록하지 않는다 (운영 기본값).
+"""
+import logging
+import re
+import time
+import traceback
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+import greenlet
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER = re.compile(r"\$\d+(::[\w\[\]]+)?|%\(\w+\)s|\?")
+_PLACEHOLDER_LIST = re.compile(r"\?(\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+_STACK_DEPTH = 6
+
+
+class QueryRepetitionError(RuntimeError):
+    """같은 형태의 쿼리가 임계값을 넘게 반복됨 (N+1 의심)."""
+
+
+class QueryLog:
+    """한 요청 동안 실행된 쿼리 형태별 횟수."""
+
+    def __init__(self, threshold: int) -> None:
+        self.threshold = threshold
+        self.shapes: Counter[str] = Counter()
+        self.reported: set[str] = set()
+
+    @property
+    def total(self) -> int:
+        return sum(self.shapes.values())
+
+
+_current_log: ContextVar[QueryLog | None] = ContextVar("current_query_log", default=None)
+
+
+def statement_shape(statement: str) -> str:
+    """바인드 위치·IN 목록 길이를 지운 쿼리 형태."""
+    shape = _PLACEHOLDER.sub("?", statement)
+    shape = _PLACEHOLDER_LIST.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+def _caller_stack() -> str:
+    """쿼리를 실행한 애플리케이션 코드 위치.
+
+    AsyncSession 호출은 별도 greenlet에서 실행되므로 await한 쪽(부모 greenlet)의
+    스택까지 이어서 본다.
+    """
+    frames = []
+    current = greenlet.getcurrent()
+    if current.parent is not None and current.parent.gr_frame is not None:
+        frames.extend(traceback.extract_stack(current.parent.gr_frame))
+    frames.extend(traceback.extract_stack())
+    app_frames = [
+        frame for frame in frames
+        if "/app/" in frame.filename and not frame.filename.endswith("query_monitor.py")
+    ]
+    return "".join(traceback.format_list(app_frames[-_STACK_DEPTH:]))
+
+
+@contextmanager
+def monitor_queries(threshold: int | None = None) -> Iterator[QueryLog]:
+    """블록 안의 쿼리 반복을 감시 (스크립트·테스트용, 요청 단위는 미들웨어가 처리)."""
+    log = QueryLog(threshold or settings.QUERY_REPEAT_THRESHOLD)
+    token = _current_log.set(log)
+    try:
+        yield log
+    finally:
+        _current_log.reset(token)
+
+
+def _check_repetition(statement: str) -> None:
+    log = _current_log.get()
+    if log is None:
+        return
+    shape = statement_shape(statement)
+    log.shapes[shape] += 1
+    if log.shapes[shape] <= log.threshold or shape in log.reported:
+        return
+    log.reported.add(shape)
+    message = (
+        f"Query repeated more than {log.threshold} times in one request (N+1?): {shape}\n"
+        f"{_caller_stack()}"
+    )
+    if settings.QUERY_MONITOR_MODE == "raise":
+        raise QueryRepetitionError(message)
+    logger.warning(message)
+
+
+def install_query_monitor(engine: AsyncEngine) -> None:
+    """설정에 따라 엔진에 반복 감시/느린 쿼리 이벤트 등록."""
+    monitor_repetition = settings.QUERY_MONITOR_MODE in ("warn", "raise")
+    slow_seconds = settings.SLOW_QUERY_MS / 1000
+    if not monitor_repetition and slow_seconds <= 0:
+        return
+
+    sync_engine = engine.sync_engine
+
+    def _log_if_slow(context, statement, parameters) -> None:
+        # 시작 시각은 실행별 context에 두므로 실패한 문장도 남기지 않는다
+        started_at = getattr(context, "_monitor_started_at", None)
+        if started_at is None:
+            return
+        context._monitor_started_at = None
+        elapsed = time.perf_counter() - started_at
+        if 0 < slow_seconds <= elapsed:
+            logger.warning(
+                "Slow query (%.1f ms): %s\nparams: %r\n%s",
+                elapsed * 1000, statement, parameters, _caller_stack(),
+            )
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if monitor_repetition:
+            _check_repetition(statement)
+        if context is not None:
+            context._monitor_started_at = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        _log_if_slow(context, statement, parameters)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(exception_context):
+        _log_if_slow(
+            exception_context.execution_context,
+            exception_context.statement,
+            exception_context.parameters,
+        )
+
+
+class QueryMonitorMiddleware:
+    """요청마다 새 QueryLog로 반복 감시 범위를 나눈다."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        with monitor_queries():
+            await self.app(scope, receive, send)
@@ -1,27 +1,129 @@
+import time
+from uuid import UUID
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+from app.core.recent_writes import RecentWrites, create_recent_writes
 from app.core.config import settings
 
 
-# PgBouncer 호환성을 위해 prepared statements 비활성화
-# Render PostgreSQL은 PgBouncer를 사용하므로 필요
+class PoolWaitMetrics:
+    """풀에서 커넥션을 얻기까지 기다린 시간 통계."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+
+pool_wait_metrics = PoolWaitMetrics()
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """checkout 대기 시간을 기록하는 QueuePool."""
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_wait_metrics.observe(time.perf_counter() - started_at)
+
+
+def _engine_options() -> dict:
+    if settings.DB_POOL_MODE == "pool":
+        return {
+            "poolclass": MeteredQueuePool,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+            "connect_args": {
+                "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            },
+        }
+    if settings.DB_POOL_MODE == "pgbouncer":
+        # PgBouncer transaction mode: Connection pooling은 PgBouncer가 담당하므로 NullPool 사용,
+        # prepared statements 비활성화 (Render PostgreSQL은 PgBouncer를 사용하므로 필요)
+        return {
+            "poolclass": NullPool,
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+            },
+        }
+    raise ValueError(f"Unknown DB_POOL_MODE: {settings.DB_POOL_MODE}")
+
+
 engine = create_async_engine(
     settings.database_url,
     echo=settings.DEBUG,
-    # Connection pooling은 PgBouncer가 담당하므로 NullPool 사용
-    poolclass=NullPool,
-    # PgBouncer transaction mode에서 prepared statements 비활성화
-    connect_args={
-        "statement_cache_size": 0,
-        "prepared_statement_cache_size": 0,
-    },
+    **_engine_options(),
 )
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# 읽기 전용 복제본 (설정되지 않으면 primary를 그대로 사용)
+if settings.DATABASE_REPLICA_URL:
+    replica_engine = create_async_engine(
+        settings.DATABASE_REPLICA_URL,
+        echo=settings.DEBUG,
+        **_engine_options(),
+    )
+    async_read_session = async_sessionmaker(
+        replica_engine, class_=AsyncSession, expire_on_commit=False
+    )
+else:
+    replica_engine = None
+    async_read_session = async_session
+
+# 최근 쓰기를 한 사용자 → primary 고정 (복제 지연보다 길게 설정, redis 백엔드면 워커 간 공유)
+_recent_writes: RecentWrites = create_recent_writes(
+    settings.DB_REPLICA_STICKY_BACKEND, settings.DB_REPLICA_STICKY_SECONDS, settings.REDIS_URL
+)
+
 Base = declarative_base()
 
 
+def get_pool_status() -> dict:
+    """풀 점유 현황과 checkout 대기 시간 (pgbouncer 모드는 대기 통계만 0)."""
+    pool = engine.pool
+    status = {
+        "mode": settings.DB_POOL_MODE,
+        "wait_count": pool_wait_metrics.count,
+        "wait_avg_seconds": pool_wait_metrics.total / pool_wait_metrics.count if pool_wait_metrics.count else 0.0,
+        "wait_max_seconds": pool_wait_metrics.max,
+    }
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=pool.overflow(),
+        )
+    return status
+
+
+async def mark_user_write(user_id: UUID) -> None:
+    """사용자의 쓰기 직후 호출. 이후 짧은 시간 동안 해당 사용자의 읽기는 primary로 간다."""
+    if replica_engine is not None:
+        await _recent_writes.mark(user_id)
+
+
+async def read_session_for(user_id: UUID | None) -> async_sessionmaker[AsyncSession]:
+    """읽기에 사용할 세션 팩토리 (복제본, 단 최근 쓰기한 사용자는 primary)."""
+    if replica_engine is None:
+        return async_session
+    if user_id is not None and await _recent_writes.contains(user_id):
+        return async_session
+    return async_read_session
+
+
 async def get_db():
     async with async_session() as session:
         try:
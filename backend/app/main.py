@@ -1,21 +1,50 @@
+import time
+
+_import_started_at = time.perf_counter()
+
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
+from slowapi.middleware import SlowAPIMiddleware
 from app.core.config import settings
+from app.core.metrics import MetricsMiddleware, instrument_engine, register_collector
+from app.core.security import jwt_cache_stats, password_hash_metrics
+from app.core.spa import SpaFiles
+from app.core.startup import warm_up
+from app.db.session import engine, replica_engine, get_pool_status
+from app.db.query_monitor import QueryMonitorMiddleware, install_query_monitor
 from app.core.rate_limit import limiter, rate_limit_exceeded_handler
 from app.api import api_router
+from app.api.deps import _user_cache
+from app.api.metrics import router as metrics_router
+from app.api.profiles import ProfilerMiddleware
 import os
 
 # Swagger UI 접근 제한 (프로덕션에서는 비활성화)
 docs_url = "/docs" if settings.DEBUG else None
 redoc_url = "/redoc" if settings.DEBUG else None
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 콜드 스타트 리포트 (+ 선택적 warm-up: 끝나야 요청을 받으므로 /health 전에 완료됨)
+    report = f"Startup: app load {(time.perf_counter() - _import_started_at) * 1000:.0f} ms"
+    if settings.STARTUP_WARMUP:
+        try:
+            timings = await warm_up()
+            report += ", warm-up " + ", ".join(f"{k} {v * 1000:.0f} ms" for k, v in timings.items())
+        except Exception as e:  # warm-up 실패로 기동을 막지 않는다
+            report += f", warm-up failed: {e!r}"
+    print(report)
+    yield
+
+
 app = FastAPI(
     title=settings.APP_NAME,
+    lifespan=lifespan,
     docs_url=docs_url,
     redoc_url=redoc_url,
     openapi_url="/openapi.json" if settings.DEBUG else None,
@@ -24,6 +53,8 @@ app = FastAPI(
 # Rate Limiter 설정
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+# 데코레이터가 없는 경로에 기본 제한(RATE_LIMIT_PER_MINUTE) 적용
+app.add_middleware(SlowAPIMiddleware)
 
 # Trusted Host 미들웨어 (프로덕션에서 호스트 검증)
 if settings.ENVIRONMENT == "production" and settings.CORS_ORIGINS:
@@ -50,11 +81,28 @@ app.add_middleware(
     expose_headers=expose_headers if settings.ENVIRONMENT == "production" else ["*"],
 )
 
+# 요청 계측 (경로별 지연·응답 크기·DB 쿼리 수, Server-Timing 헤더)
+app.add_middleware(MetricsMiddleware)
+for db_engine in (engine, replica_engine):
+    if db_engine is not None:
+        instrument_engine(db_engine)
+        install_query_monitor(db_engine)
+if settings.QUERY_MONITOR_MODE != "off":
+    app.add_middleware(QueryMonitorMiddleware)
+# admin 요청에 X-Profile: 1 (또는 ?profile=1)이 붙으면 해당 요청만 샘플링 프로파일링
+app.add_middleware(ProfilerMiddleware)
+register_collector("db_pool", get_pool_status)
+register_collector("jwt_cache", jwt_cache_stats)
+register_collector("user_cache", lambda: _user_cache.stats)
+register_collector("password_hash", password_hash_metrics.snapshot)
+
 # API Routes (먼저 등록)
 app.include_router(api_router)
+app.include_router(metrics_router)
 
 
 @app.get("/health")
+@limiter.exempt
 async def health():
     return {"status": "ok", "environment": settings.ENVIRONMENT}
 
@@ -63,17 +111,14 @@ async def health():
 STATIC_DIR = os.path.join(os.path.dirname(__file__), "..", "static")
 
 if os.path.exists(STATIC_DIR):
-    # 정적 에셋 서빙 (JS, CSS, images)
-    app.mount("/assets", StaticFiles(directory=os.path.join(STATIC_DIR, "assets")), name="assets")
-    
+    # 파일 목록·index.html을 시작 시 메모리에 올려 두고 서빙 (/assets 포함)
+    spa_files = SpaFiles(STATIC_DIR)
+
     # SPA fallback - 모든 비-API 경로를 index.html로
     @app.get("/{full_path:path}")
-    async def serve_spa(full_path: str):
+    @limiter.exempt
+    async def serve_spa(full_path: str, request: Request):
         # API 경로는 제외
         if full_path.startswith("api/"):
             return {"detail": "Not Found"}
-        
-        file_path = os.path.join(STATIC_DIR, full_path)
-        if os.path.isfile(file_path):
-            return FileResponse(file_path)
-        return FileResponse(os.path.join(STATIC_DIR, "index.html"))
\ No newline at end of file
+        return spa_files.response(full_path, request.headers)
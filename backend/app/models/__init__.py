@@ -1,4 +1,4 @@
 from .user import User
-from .task import Task, TaskHistory
+from .task import Task, TaskHistory, KeywordFacet, AppliedUpload
 
-__all__ = ["User", "Task", "TaskHistory"]
+__all__ = ["User", "Task", "TaskHistory", "KeywordFacet", "AppliedUpload"]
@@ -1,6 +1,9 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import String, Boolean, Integer, ForeignKey, DateTime, ARRAY
+from sqlalchemy import (
+    String, Boolean, Integer, BigInteger, ForeignKey, DateTime, ARRAY, Index, PrimaryKeyConstraint, DDL,
+    event, text,
+)
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.session import Base
@@ -8,6 +11,12 @@ from app.db.session import Base
 
 class Task(Base):
     __tablename__ = "tasks"
+    # 마이그레이션 0002와 동일 (live = soft delete되지 않은 행만 포함하는 부분 인덱스)
+    __table_args__ = (
+        Index("ix_tasks_parent_id_name_live", "parent_id", "name", postgresql_where=text("deleted_at IS NULL")),
+        Index("ix_tasks_level_live", "level", postgresql_where=text("deleted_at IS NULL")),
+        Index("ix_tasks_organization_live", "organization", postgresql_where=text("deleted_at IS NULL")),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     parent_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -28,6 +37,13 @@ class Task(Base):
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
     deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
+    # 서브트리 집계 (자기 자신 제외 live 하위 노드 수, app/services/task_aggregates.py에서 증분 갱신)
+    subtree_l1_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    subtree_l2_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    subtree_l3_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    subtree_l4_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    subtree_ai_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+
     # Relationships
     parent = relationship("Task", remote_side=[id], backref="children")
     histories = relationship("TaskHistory", back_populates="task")
@@ -35,6 +51,9 @@ class Task(Base):
 
 class TaskHistory(Base):
     __tablename__ = "task_histories"
+    __table_args__ = (
+        Index("ix_task_histories_task_id_changed_at", "task_id", "changed_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     task_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("tasks.id"), nullable=False)
@@ -46,3 +65,53 @@ class TaskHistory(Base):
 
     # Relationships
     task = relationship("Task", back_populates="histories")
+
+
+class KeywordFacet(Base):
+    """키워드별 태스크 수 (전체 / 조직 / 서브트리 범위). 태스크 쓰기 시 증분 갱신.
+
+    scope_type: all(scope_key="") | organization(조직명) | task(서브트리 루트 id, 자신 포함)
+    """
+    __tablename__ = "keyword_facets"
+    __table_args__ = (PrimaryKeyConstraint("scope_type", "scope_key", "keyword"),)
+
+    scope_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    scope_key: Mapped[str] = mapped_column(String(100), nullable=False)
+    keyword: Mapped[str] = mapped_column(String, nullable=False)
+    task_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    ai_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class AppliedUpload(Base):
+    """이미 반영된 업로드 (confirm 멱등 단축 경로). 워커 간 공유되며 tree_version이 현재와 같을 때만 유효."""
+    __tablename__ = "applied_uploads"
+
+    fingerprint: Mapped[str] = mapped_column(String(64), primary_key=True)
+    tree_version: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    result: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    applied_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+
+
+# 트리 버전 (마이그레이션 0005와 동일): tasks에 대한 모든 쓰기 문장이 시퀀스를 증가시킨다.
+# 잠금은 잡지 않으므로 일반 태스크 쓰기끼리는 서로 기다리지 않는다. 그래서 confirm이 버전을
+# 읽은 뒤에 커밋되는 동시 단건 쓰기가 있으면 그 기록이 한 번 더 유효할 수 있으나, 반영 기록은
+# 다음 tasks 쓰기에서 바로 무효가 되므로 허용한다.
+TREE_VERSION_DDL = (
+    "CREATE SEQUENCE IF NOT EXISTS tree_version_seq",
+    """
+CREATE OR REPLACE FUNCTION bump_tree_version() RETURNS trigger AS $$
+BEGIN
+    PERFORM nextval('tree_version_seq');
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+""",
+    """
+CREATE TRIGGER tasks_bump_tree_version
+BEFORE INSERT OR UPDATE OR DELETE OR TRUNCATE ON tasks
+FOR EACH STATEMENT EXECUTE FUNCTION bump_tree_version()
+""",
+)
+
+for _statement in TREE_VERSION_DDL:
+    event.listen(Task.__table__, "after_create", DDL(_statement))
@@ -1,9 +1,9 @@
 from .common import ApiResponse
 from .user import UserCreate, UserResponse, LoginRequest, TokenResponse, RefreshRequest
-from .task import TaskGraphItem, TaskDetail, TaskCreate, TaskUpdate, TaskHistoryResponse
+from .task import TaskGraphItem, TaskAggregates, TaskDetail, TaskBatchResponse, KeywordFacetItem, KeywordFacets, TaskCreate, TaskUpdate, TaskHistoryResponse
 
 __all__ = [
     "ApiResponse",
     "UserCreate", "UserResponse", "LoginRequest", "TokenResponse", "RefreshRequest",
-    "TaskGraphItem", "TaskDetail", "TaskCreate", "TaskUpdate", "TaskHistoryResponse",
+    "TaskGraphItem", "TaskAggregates", "TaskDetail", "TaskBatchResponse", "KeywordFacetItem", "KeywordFacets", "TaskCreate", "TaskUpdate", "TaskHistoryResponse",
 ]
@@ -15,11 +15,28 @@ class TaskGraphItem(BaseModel):
     organization: str
     is_ai_utilized: bool
     keywords: list[str] | None = None
+    # 서브트리 집계 (하위 노드 수: 레벨별, AI 활용)
+    subtree_l1_count: int = 0
+    subtree_l2_count: int = 0
+    subtree_l3_count: int = 0
+    subtree_l4_count: int = 0
+    subtree_ai_count: int = 0
 
     class Config:
         from_attributes = True
 
 
+class TaskAggregates(BaseModel):
+    """조상 노드의 서브트리 집계 변경 (aggregates 이벤트)."""
+    id: UUID
+    organization: str
+    subtree_l1_count: int
+    subtree_l2_count: int
+    subtree_l3_count: int
+    subtree_l4_count: int
+    subtree_ai_count: int
+
+
 class TaskDetail(TaskGraphItem):
     team: str | None
     manager_name: str | None
@@ -31,6 +48,23 @@ class TaskDetail(TaskGraphItem):
     updated_at: datetime
 
 
+class TaskBatchResponse(BaseModel):
+    tasks: list[TaskDetail]  # 요청한 ids 순서 (없는 id는 제외)
+    missing: list[UUID]  # 존재하지 않거나 삭제된 id
+
+
+class KeywordFacetItem(BaseModel):
+    keyword: str
+    count: int  # 키워드가 달린 태스크 수
+    ai_count: int  # 그중 AI 활용
+    non_ai_count: int
+
+
+class KeywordFacets(BaseModel):
+    scope: Literal["all", "organization", "task"]
+    keywords: list[KeywordFacetItem]
+
+
 class TaskCreate(BaseModel):
     parent_id: UUID | None = None
     name: str
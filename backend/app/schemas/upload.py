@@ -19,18 +19,20 @@ class UploadPreview(BaseModel):
     total_rows: int
     summary: dict
     hierarchy: list[HierarchyNode]
+    hierarchy_total: int = 0  # 전체 L1 노드 수 (페이지네이션용)
+    hierarchy_truncated: bool = False  # 노드 수 제한으로 잘렸는지 여부
 
 
 class DiffNode(BaseModel):
     name: str
     level: str
-    status: str  # "new" | "existing"
+    status: str  # "new" | "existing" | "moved" | "removed"
     children: list["DiffNode"] = []
 
 
 class DiffResult(BaseModel):
     diff_tree: list[DiffNode]
-    stats: dict  # {"new": N, "existing": N, "total": N}
+    stats: dict  # {"new": N, "existing": N, "moved": N, "removed": N, "total": N}
 
 
 class UpsertResult(BaseModel):
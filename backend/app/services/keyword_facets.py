@@ -0,0 +1,163 @@
+"""키워드 facet (키워드별 태스크 수, AI 활용 여부별).
+
+keyword_facets 테이블에 범위별로 유지하고 태스크 쓰기 때마다 증분 갱신하므로
+조회 시 tasks.keywords 전체를 unnest하지 않는다.
+
+- all: 전체 live 태스크
+- organization: 조직별
+- task: 서브트리별 (해당 노드 자신 포함, 조상 경로 전체에 반영)
+"""
+from collections import defaultdict
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import KeywordFacet, Task
+from app.services.task_aggregates import ancestors_cte
+
+facets_table = KeywordFacet.__table__
+
+# 전체 재계산 (마이그레이션 0004와 동일, COPY 적재 후 등)
+REBUILD_STATEMENTS = (
+    "TRUNCATE keyword_facets",
+    """
+    WITH RECURSIVE task_keywords AS (
+        SELECT t.id, t.organization, t.is_ai_utilized, k.keyword
+        FROM tasks t
+        CROSS JOIN LATERAL (
+            SELECT DISTINCT btrim(kw) AS keyword FROM unnest(t.keywords) AS kw WHERE btrim(kw) <> ''
+        ) k
+        WHERE t.deleted_at IS NULL
+    ), closure(ancestor_id, descendant_id) AS (
+        SELECT id, id FROM tasks WHERE deleted_at IS NULL
+        UNION ALL
+        SELECT t.parent_id, c.descendant_id
+        FROM closure c JOIN tasks t ON t.id = c.ancestor_id
+        WHERE t.parent_id IS NOT NULL
+    )
+    INSERT INTO keyword_facets (scope_type, scope_key, keyword, task_count, ai_count)
+    SELECT 'all', '', keyword, count(*), count(*) FILTER (WHERE is_ai_utilized)
+    FROM task_keywords GROUP BY keyword
+    UNION ALL
+    SELECT 'organization', organization, keyword, count(*), count(*) FILTER (WHERE is_ai_utilized)
+    FROM task_keywords GROUP BY organization, keyword
+    UNION ALL
+    SELECT 'task', c.ancestor_id::text, tk.keyword, count(*), count(*) FILTER (WHERE tk.is_ai_utilized)
+    FROM closure c JOIN task_keywords tk ON tk.id = c.descendant_id
+    GROUP BY c.ancestor_id, tk.keyword
+    """,
+)
+
+
+def normalize_keywords(keywords: Iterable[str] | None) -> set[str]:
+    return {keyword.strip() for keyword in keywords or () if keyword and keyword.strip()}
+
+
+class FacetDeltas:
+    """(범위, 키워드)별 증감을 모아 한 번의 upsert로 반영."""
+
+    def __init__(self) -> None:
+        self._deltas: dict[tuple[str, str, str], list[int]] = defaultdict(lambda: [0, 0])
+
+    def add(
+        self,
+        keywords: set[str],
+        organization: str,
+        is_ai_utilized: bool,
+        subtree_ids: list[UUID],
+        sign: int = 1,
+    ) -> None:
+        scopes = [("all", ""), ("organization", organization)]
+        scopes += [("task", str(task_id)) for task_id in subtree_ids]
+        for keyword in keywords:
+            for scope_type, scope_key in scopes:
+                delta = self._deltas[(scope_type, scope_key, keyword)]
+                delta[0] += sign
+                delta[1] += sign * int(is_ai_utilized)
+
+    async def apply(self, db: AsyncSession) -> None:
+        rows = [
+            {"scope_type": scope_type, "scope_key": scope_key, "keyword": keyword,
+             "task_count": count, "ai_count": ai_count}
+            # 키 순서로 정렬해 동시 쓰기 간 행 잠금 순서를 일정하게 (교착 방지)
+            for (scope_type, scope_key, keyword), (count, ai_count) in sorted(self._deltas.items())
+            if count or ai_count
+        ]
+        if not rows:
+            return
+        stmt = insert(facets_table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["scope_type", "scope_key", "keyword"],
+            set_={
+                "task_count": facets_table.c.task_count + stmt.excluded.task_count,
+                "ai_count": facets_table.c.ai_count + stmt.excluded.ai_count,
+            },
+        )
+        await db.execute(stmt, rows)
+        # 0이 될 수 있는 건 이번에 감소한 행뿐 → 그 PK만 지운다
+        decremented = [
+            (row["scope_type"], row["scope_key"], row["keyword"]) for row in rows if row["task_count"] < 0
+        ]
+        if decremented:
+            key = tuple_(facets_table.c.scope_type, facets_table.c.scope_key, facets_table.c.keyword)
+            await db.execute(
+                delete(facets_table).where(key.in_(decremented), facets_table.c.task_count <= 0)
+            )
+        self._deltas.clear()
+
+
+async def subtree_ids(db: AsyncSession, task_id: UUID) -> list[UUID]:
+    """task_id와 그 조상 id 목록 (task 범위 facet을 갱신할 대상)."""
+    ancestors = ancestors_cte(task_id)
+    result = await db.execute(select(ancestors.c.id))
+    return list(result.scalars().all())
+
+
+async def apply_task_change(
+    db: AsyncSession,
+    task_id: UUID,
+    before: tuple[set[str], str, bool] | None,
+    after: tuple[set[str], str, bool] | None,
+) -> None:
+    """태스크 하나의 생성/수정/삭제를 facet에 반영.
+
+    before / after는 (키워드 집합, 조직, AI 활용 여부). 생성은 before=None, 삭제는 after=None.
+    """
+    if before == after or not ((before and before[0]) or (after and after[0])):
+        return
+    ids = await subtree_ids(db, task_id)
+    deltas = FacetDeltas()
+    if before:
+        deltas.add(*before, ids, sign=-1)
+    if after:
+        deltas.add(*after, ids, sign=1)
+    await deltas.apply(db)
+
+
+def facet_state(task: Task) -> tuple[set[str], str, bool]:
+    return normalize_keywords(task.keywords), task.organization, bool(task.is_ai_utilized)
+
+
+async def get_keyword_facets(
+    db: AsyncSession,
+    organization: str | None = None,
+    task_id: UUID | None = None,
+    limit: int = 100,
+) -> list[KeywordFacet]:
+    """범위의 키워드 facet (빈도 내림차순)."""
+    if task_id is not None:
+        scope_type, scope_key = "task", str(task_id)
+    elif organization:
+        scope_type, scope_key = "organization", organization
+    else:
+        scope_type, scope_key = "all", ""
+    result = await db.execute(
+        select(KeywordFacet)
+        .where(KeywordFacet.scope_type == scope_type, KeywordFacet.scope_key == scope_key)
+        .order_by(KeywordFacet.task_count.desc(), KeywordFacet.keyword)
+        .limit(limit)
+    )
+    return list(result.scalars().all())
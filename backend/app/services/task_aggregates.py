@@ -0,0 +1,163 @@
+"""태스크별 서브트리 집계 (레벨별 하위 노드 수, AI 활용 하위 노드 수).
+
+tasks 행의 subtree_* 컬럼에 저장해 그래프/상세 조회가 추가 쿼리 없이 내려주고,
+쓰기 때마다 변경된 노드의 조상 경로만 증분 갱신한다 (col = col + delta라 동시 쓰기에도 안전).
+집계는 자기 자신을 제외한 live 하위 노드 기준이다.
+"""
+from collections import defaultdict
+from uuid import UUID
+
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models import Task
+
+tasks_table = Task.__table__
+
+LEVEL_COLUMNS = {
+    "L1": "subtree_l1_count",
+    "L2": "subtree_l2_count",
+    "L3": "subtree_l3_count",
+    "L4": "subtree_l4_count",
+}
+AI_COLUMN = "subtree_ai_count"
+AGGREGATE_COLUMNS = (*LEVEL_COLUMNS.values(), AI_COLUMN)
+
+# 갱신된 조상 행 (aggregates 변경 이벤트 payload)
+_AGGREGATE_ROW = (
+    tasks_table.c.id,
+    tasks_table.c.organization,
+    *(tasks_table.c[column] for column in AGGREGATE_COLUMNS),
+)
+
+# 전체 재계산 (마이그레이션 0003과 동일, COPY 적재 후 등)
+REBUILD_STATEMENTS = (
+    "UPDATE tasks SET subtree_l1_count = 0, subtree_l2_count = 0, subtree_l3_count = 0, "
+    "subtree_l4_count = 0, subtree_ai_count = 0",
+    """
+    WITH RECURSIVE closure(ancestor_id, descendant_id) AS (
+        SELECT parent_id, id FROM tasks WHERE parent_id IS NOT NULL AND deleted_at IS NULL
+        UNION ALL
+        SELECT t.parent_id, c.descendant_id
+        FROM closure c JOIN tasks t ON t.id = c.ancestor_id
+        WHERE t.parent_id IS NOT NULL
+    ), agg AS (
+        SELECT c.ancestor_id,
+               count(*) FILTER (WHERE d.level = 'L1') AS l1,
+               count(*) FILTER (WHERE d.level = 'L2') AS l2,
+               count(*) FILTER (WHERE d.level = 'L3') AS l3,
+               count(*) FILTER (WHERE d.level = 'L4') AS l4,
+               count(*) FILTER (WHERE d.is_ai_utilized) AS ai
+        FROM closure c JOIN tasks d ON d.id = c.descendant_id
+        GROUP BY c.ancestor_id
+    )
+    UPDATE tasks
+    SET subtree_l1_count = agg.l1, subtree_l2_count = agg.l2, subtree_l3_count = agg.l3,
+        subtree_l4_count = agg.l4, subtree_ai_count = agg.ai
+    FROM agg
+    WHERE tasks.id = agg.ancestor_id
+    """,
+)
+
+
+# 집계 갱신은 조상 노드의 수정이 아니므로 updated_at(onupdate)을 그대로 둔다
+KEEP_UPDATED_AT = {"updated_at": tasks_table.c.updated_at}
+
+
+def ancestors_cte(task_id: UUID):
+    """task_id 자신부터 Root까지의 (id, parent_id) 재귀 CTE."""
+    ancestors = (
+        select(tasks_table.c.id, tasks_table.c.parent_id)
+        .where(tasks_table.c.id == task_id)
+        .cte("ancestors", recursive=True)
+    )
+    return ancestors.union_all(
+        select(tasks_table.c.id, tasks_table.c.parent_id)
+        .join(ancestors, tasks_table.c.id == ancestors.c.parent_id)
+    )
+
+
+def _delta_values(level: str | None, count_delta: int, ai_delta: int) -> dict:
+    values = {}
+    if level in LEVEL_COLUMNS and count_delta:
+        column = LEVEL_COLUMNS[level]
+        values[column] = tasks_table.c[column] + count_delta
+    if ai_delta:
+        values[AI_COLUMN] = tasks_table.c[AI_COLUMN] + ai_delta
+    return values
+
+
+async def apply_to_ancestors(
+    db: AsyncSession,
+    parent_id: UUID | None,
+    level: str | None = None,
+    count_delta: int = 0,
+    ai_delta: int = 0,
+) -> list[dict]:
+    """parent_id부터 Root까지의 조상 집계를 한 번의 UPDATE로 갱신하고 갱신된 조상 행을 반환.
+
+    level 노드 하나가 추가/삭제되면 count_delta=±1, AI 활용 여부가 바뀌면 ai_delta=±1.
+    """
+    values = _delta_values(level, count_delta, ai_delta)
+    if parent_id is None or not values:
+        return []
+    ancestors = ancestors_cte(parent_id)
+    result = await db.execute(
+        update(tasks_table)
+        .where(tasks_table.c.id.in_(select(ancestors.c.id)))
+        .values(**values, **KEEP_UPDATED_AT)
+        .returning(*_AGGREGATE_ROW)
+    )
+    return [dict(row) for row in result.mappings()]
+
+
+class SubtreeDeltas:
+    """대량 생성(업로드 upsert) 시 조상별 증감을 모아 한 번에 반영."""
+
+    def __init__(self) -> None:
+        self._ancestors: dict[UUID, Task] = {}
+        self._deltas: dict[UUID, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def add(self, ancestors: list[Task], level: str, is_ai_utilized: bool = False) -> None:
+        for ancestor in ancestors:
+            self._ancestors[ancestor.id] = ancestor
+            delta = self._deltas[ancestor.id]
+            delta[LEVEL_COLUMNS[level]] += 1
+            if is_ai_utilized:
+                delta[AI_COLUMN] += 1
+
+    async def apply(self, db: AsyncSession) -> list[dict]:
+        """모은 증감을 반영하고 갱신된 조상 행을 반환."""
+        if not self._deltas:
+            return []
+        columns = AGGREGATE_COLUMNS
+        stmt = (
+            update(tasks_table)
+            .where(tasks_table.c.id == bindparam("ancestor_id"))
+            .values(
+                {
+                    **{column: tasks_table.c[column] + bindparam(f"d_{column}") for column in columns},
+                    **KEEP_UPDATED_AT,
+                }
+            )
+        )
+        await db.execute(
+            stmt,
+            [
+                {"ancestor_id": ancestor_id, **{f"d_{column}": delta[column] for column in columns}}
+                for ancestor_id, delta in self._deltas.items()
+            ],
+        )
+        # 세션의 객체에도 반영 (변경 이벤트 payload용, dirty로 만들지 않음)
+        for ancestor_id, delta in self._deltas.items():
+            ancestor = self._ancestors[ancestor_id]
+            for column, value in delta.items():
+                set_committed_value(ancestor, column, getattr(ancestor, column) + value)
+        # executemany UPDATE는 RETURNING이 없어 갱신된 행은 한 번에 다시 읽는다
+        result = await db.execute(
+            select(*_AGGREGATE_ROW).where(tasks_table.c.id.in_(list(self._deltas)))
+        )
+        self._ancestors.clear()
+        self._deltas.clear()
+        return [dict(row) for row in result.mappings()]
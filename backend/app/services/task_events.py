@@ -0,0 +1,91 @@
+"""태스크 변경 알림 (SSE 스트림).
+
+쓰기 서비스가 커밋 후 publish_task_changes로 compact 이벤트를 발행하면
+구독 중인 클라이언트가 전체 그래프를 다시 받지 않고 로컬 트리를 갱신한다.
+
+    {"type": "created" | "updated" | "deleted", "tasks": [TaskGraphItem, ...]}
+    {"type": "aggregates", "tasks": [TaskAggregates, ...]}  # 위 변경으로 서브트리 집계가 바뀐 조상
+    {"type": "resync"}  # 이벤트 유실 가능성 → 전체 재조회
+
+연결 중에도 토큰을 주기적으로 다시 검증하고, 만료·폐기되면 unauthorized 이벤트 후 스트림을 닫는다.
+"""
+import asyncio
+import json
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+
+from app.core.change_broker import ChangeBroker, create_change_broker
+from app.core.config import settings
+from app.models import Task
+from app.schemas import TaskAggregates, TaskGraphItem
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_SECONDS = 15
+AUTH_RECHECK_SECONDS = 15
+UNAUTHORIZED_EVENT = "event: unauthorized\ndata: {}\n\n"
+EVENT_CHUNK_SIZE = 500
+
+change_broker: ChangeBroker = create_change_broker(
+    settings.CHANGE_BROKER_BACKEND, settings.REDIS_URL
+)
+
+
+async def publish_task_changes(
+    change_type: str, tasks: Iterable[Task], aggregates: Iterable[dict] = ()
+) -> None:
+    """커밋된 변경을 발행. 알림 실패가 이미 커밋된 쓰기를 실패로 만들지 않도록 로그만 남긴다.
+
+    aggregates는 같은 쓰기로 서브트리 집계가 바뀐 조상 행이며 aggregates 이벤트로 뒤이어 보낸다.
+    """
+    events = [
+        (change_type, [TaskGraphItem.model_validate(task).model_dump(mode="json") for task in tasks]),
+        ("aggregates", [TaskAggregates.model_validate(row).model_dump(mode="json") for row in aggregates]),
+    ]
+    try:
+        for event_type, items in events:
+            for start in range(0, len(items), EVENT_CHUNK_SIZE):
+                await change_broker.publish(
+                    {"type": event_type, "tasks": items[start:start + EVENT_CHUNK_SIZE]}
+                )
+    except Exception as e:
+        logger.warning("Failed to publish task changes: %r", e)
+
+
+def _filter_event(event: dict, organization: str | None) -> dict | None:
+    if organization is None or "tasks" not in event:
+        return event
+    tasks = [task for task in event["tasks"] if task["organization"] == organization]
+    return {**event, "tasks": tasks} if tasks else None
+
+
+async def stream_task_changes(
+    organization: str | None = None,
+    still_authorized: Callable[[], Awaitable[bool]] | None = None,
+) -> AsyncIterator[str]:
+    """SSE 형식 이벤트 스트림. 프록시 유휴 연결 종료를 막기 위해 주기적으로 heartbeat.
+
+    still_authorized는 AUTH_RECHECK_SECONDS마다 호출되며 False면 스트림을 닫는다.
+    """
+    async with change_broker.subscription() as queue:
+        yield "retry: 3000\n\n"
+        checked_at = time.monotonic()
+        while True:
+            try:
+                event = await asyncio.wait_for(queue.get(), HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                event = None
+
+            if still_authorized is not None and time.monotonic() - checked_at >= AUTH_RECHECK_SECONDS:
+                if not await still_authorized():
+                    yield UNAUTHORIZED_EVENT
+                    return
+                checked_at = time.monotonic()
+
+            if event is None:
+                yield ": ping\n\n"
+                continue
+            event = _filter_event(event, organization)
+            if event is not None:
+                yield f"event: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
@@ -1,9 +1,13 @@
 from uuid import UUID
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Select, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from app.models import Task, TaskHistory, User
 from app.schemas import TaskCreate, TaskUpdate
+from app.services import keyword_facets
+from app.services.task_aggregates import apply_to_ancestors
+from app.services.task_events import publish_task_changes
 from dataclasses import dataclass
 
 
@@ -23,13 +27,49 @@ class TaskHistoryWithUser:
 LEVEL_MAP = {"Root": "L1", "L1": "L2", "L2": "L3", "L3": "L4"}
 
 
-async def get_all_tasks(db: AsyncSession) -> list[Task]:
-    result = await db.execute(
-        select(Task).where(Task.deleted_at.is_(None)).order_by(Task.level, Task.name)
-    )
+def _live_tasks(
+    stmt: Select,
+    organization: str | None = None,
+    level: str | None = None,
+    is_ai_utilized: bool | None = None,
+) -> Select:
+    """live 태스크 조건과 그래프 필터 (SQL로 내려 부분 인덱스를 사용)."""
+    stmt = stmt.where(Task.deleted_at.is_(None))
+    if organization:
+        stmt = stmt.where(Task.organization == organization)
+    if level:
+        stmt = stmt.where(Task.level == level)
+    if is_ai_utilized is not None:
+        stmt = stmt.where(Task.is_ai_utilized == is_ai_utilized)
+    return stmt
+
+
+async def get_all_tasks(
+    db: AsyncSession,
+    organization: str | None = None,
+    level: str | None = None,
+    is_ai_utilized: bool | None = None,
+) -> list[Task]:
+    """live 태스크 조회."""
+    stmt = _live_tasks(select(Task), organization, level, is_ai_utilized)
+    result = await db.execute(stmt.order_by(Task.level, Task.name))
     return list(result.scalars().all())
 
 
+async def get_task_rows(
+    db: AsyncSession,
+    fields: list[str],
+    organization: str | None = None,
+    level: str | None = None,
+    is_ai_utilized: bool | None = None,
+) -> list[dict]:
+    """get_all_tasks의 projection 버전: 요청한 컬럼만 SELECT해 dict로 반환."""
+    columns = [Task.__table__.c[name] for name in fields]
+    stmt = _live_tasks(select(*columns), organization, level, is_ai_utilized)
+    result = await db.execute(stmt.order_by(Task.level, Task.name))
+    return [dict(row) for row in result.mappings()]
+
+
 async def get_task_by_id(db: AsyncSession, task_id: UUID) -> Task | None:
     result = await db.execute(
         select(Task).where(Task.id == task_id, Task.deleted_at.is_(None))
@@ -37,6 +77,38 @@ async def get_task_by_id(db: AsyncSession, task_id: UUID) -> Task | None:
     return result.scalar_one_or_none()
 
 
+async def get_task_row_by_id(db: AsyncSession, task_id: UUID, fields: list[str]) -> dict | None:
+    """get_task_by_id의 projection 버전."""
+    columns = [Task.__table__.c[name] for name in fields]
+    result = await db.execute(
+        select(*columns).where(Task.id == task_id, Task.deleted_at.is_(None))
+    )
+    row = result.mappings().one_or_none()
+    return dict(row) if row is not None else None
+
+
+def _ids_filter(ids: list[UUID]):
+    # IN 목록 대신 배열 파라미터 하나로 보내 id 개수와 무관하게 같은 statement를 재사용
+    return Task.id == any_(bindparam("ids", ids, type_=ARRAY(PG_UUID(as_uuid=True))))
+
+
+async def get_tasks_by_ids(db: AsyncSession, ids: list[UUID]) -> list[Task]:
+    """여러 태스크를 한 번의 쿼리로 조회 (순서 보장 없음)."""
+    result = await db.execute(
+        select(Task).where(_ids_filter(ids), Task.deleted_at.is_(None))
+    )
+    return list(result.scalars().all())
+
+
+async def get_task_rows_by_ids(db: AsyncSession, ids: list[UUID], fields: list[str]) -> list[dict]:
+    """get_tasks_by_ids의 projection 버전."""
+    columns = [Task.__table__.c[name] for name in fields]
+    result = await db.execute(
+        select(*columns).where(_ids_filter(ids), Task.deleted_at.is_(None))
+    )
+    return [dict(row) for row in result.mappings()]
+
+
 async def create_task(db: AsyncSession, data: TaskCreate, user_id: UUID | None) -> Task:
     # 부모가 있으면 레벨 자동 결정
     if data.parent_id:
@@ -63,6 +135,8 @@ async def create_task(db: AsyncSession, data: TaskCreate, user_id: UUID | None)
         updated_by=user_id,
     )
     db.add(task)
+    # id 확정 + 아래 Core 문장(조상 집계·facet의 조상 CTE)이 새 행을 보도록 먼저 flush
+    await db.flush()
 
     # 이력 저장
     history = TaskHistory(
@@ -74,8 +148,13 @@ async def create_task(db: AsyncSession, data: TaskCreate, user_id: UUID | None)
     )
     db.add(history)
 
+    ancestors = await apply_to_ancestors(
+        db, task.parent_id, level, count_delta=1, ai_delta=int(bool(data.is_ai_utilized))
+    )
+    await keyword_facets.apply_task_change(db, task.id, None, keyword_facets.facet_state(task))
     await db.commit()
     await db.refresh(task)
+    await publish_task_changes("created", [task], ancestors)
     return task
 
 
@@ -95,9 +174,19 @@ async def update_task(db: AsyncSession, task_id: UUID, data: TaskUpdate, user_id
     db.add(history)
 
     # 업데이트
+    was_ai_utilized = task.is_ai_utilized
+    facets_before = keyword_facets.facet_state(task)
     update_data = data.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(task, key, value)
+    ancestors = []
+    if task.is_ai_utilized != was_ai_utilized:
+        ancestors = await apply_to_ancestors(
+            db, task.parent_id, ai_delta=1 if task.is_ai_utilized else -1
+        )
+    await keyword_facets.apply_task_change(
+        db, task.id, facets_before, keyword_facets.facet_state(task)
+    )
 
     task.version += 1
     task.updated_by = user_id
@@ -105,6 +194,7 @@ async def update_task(db: AsyncSession, task_id: UUID, data: TaskUpdate, user_id
 
     await db.commit()
     await db.refresh(task)
+    await publish_task_changes("updated", [task], ancestors)
     return task
 
 
@@ -133,7 +223,12 @@ async def delete_task(db: AsyncSession, task_id: UUID, user_id: UUID | None) ->
 
     # Soft delete
     task.deleted_at = datetime.utcnow()
+    ancestors = await apply_to_ancestors(
+        db, task.parent_id, task.level, count_delta=-1, ai_delta=-int(task.is_ai_utilized)
+    )
+    await keyword_facets.apply_task_change(db, task.id, keyword_facets.facet_state(task), None)
     await db.commit()
+    await publish_task_changes("deleted", [task], ancestors)
     return True
 
 
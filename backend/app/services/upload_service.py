@@ -1,35 +1,210 @@
+import asyncio
+import csv
+import hashlib
+import multiprocessing
+import tempfile
+from collections.abc import AsyncIterator, Iterable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from io import BytesIO
-from uuid import UUID
+from datetime import datetime
+from io import BytesIO, StringIO
+from typing import Any, NamedTuple
+from uuid import UUID, uuid4
 
-from openpyxl import load_workbook
-from sqlalchemy import select
+# openpyxl은 import 비용이 커서(콜드 스타트) 사용하는 함수 안에서 import한다.
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from app.models import Task, TaskHistory
+from app.core.config import settings
+from app.db.session import async_read_session
+from app.models import AppliedUpload, Task, TaskHistory
+from app.services.task_aggregates import SubtreeDeltas
+from app.services.task_events import publish_task_changes
 from app.services.task_service import _task_to_snapshot
 from app.schemas.upload import (
     ExcelRow,
     HierarchyNode,
     UploadPreview,
-    DiffNode,
-    DiffResult,
     UpsertResult,
 )
 
 
+LEVELS = ("L1", "L2", "L3", "L4")
+EXPORT_COLUMNS = LEVELS
+EXPORT_BATCH_SIZE = 1000
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+TREE_LOCK_KEY = 0x7461736B  # 업로드 confirm 직렬화용 pg_advisory_xact_lock 키
+
+PREVIEW_ROW_COUNT = 10
+PREVIEW_MAX_NODES = 5000  # 미리보기 hierarchy에 담을 최대 노드 수
+
+
+class ParsedRow(NamedTuple):
+    l1: str
+    l2: str
+    l3: str
+    l4: str
+
+
+class TreeNode:
+    """업로드 계층 노드. children은 삽입 순서를 유지하는 이름 → 노드 dict."""
+
+    __slots__ = ("name", "level", "children")
+
+    def __init__(self, name: str, level: str) -> None:
+        self.name = name
+        self.level = level
+        self.children: dict[str, TreeNode] = {}
+
+
+class Hierarchy:
+    """파싱된 행으로부터 한 번만 만드는 L1~L4 트리와 레벨별 노드 수."""
+
+    __slots__ = ("roots", "counts")
+
+    def __init__(self) -> None:
+        self.roots: dict[str, TreeNode] = {}
+        self.counts = {"L1": 0, "L2": 0, "L3": 0, "L4": 0}
+
+    def add(self, row: ParsedRow) -> None:
+        siblings = self.roots
+        for level, name in zip(LEVELS, row):
+            node = siblings.get(name)
+            if node is None:
+                node = siblings[name] = TreeNode(name, level)
+                self.counts[level] += 1
+            siblings = node.children
+
+
 @dataclass
 class ParsedExcel:
-    rows: list[ExcelRow] = field(default_factory=list)
+    rows: list[ParsedRow] = field(default_factory=list)
+    _hierarchy: Hierarchy | None = field(default=None, init=False, repr=False)
+
+    @property
+    def hierarchy(self) -> Hierarchy:
+        """preview / diff / upsert가 공유하는 계층 트리 (최초 접근 시 생성)."""
+        if self._hierarchy is None:
+            self._hierarchy = build_hierarchy(self)
+        return self._hierarchy
 
 
 def parse_excel(file_bytes: bytes) -> ParsedExcel:
-    """openpyxl로 엑셀 파싱. 헤더에서 L1~L4 컬럼 자동 감지."""
+    """openpyxl로 엑셀 파싱 (활성 시트). 헤더에서 L1~L4 컬럼 자동 감지."""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(filename=BytesIO(file_bytes), read_only=True, data_only=True)
+    try:
+        return ParsedExcel(rows=_parse_rows(wb.active))
+    finally:
+        wb.close()
+
+
+async def parse_workbooks(
+    files: list[bytes], sheets: list[str] | None = None, all_sheets: bool = False
+) -> ParsedExcel:
+    """여러 파일의 여러 시트를 워커 프로세스에서 병렬 파싱한 뒤 하나로 병합.
+
+    기본은 파일별 활성 시트, sheets를 주면 해당 시트들, all_sheets면 모든 시트를 읽는다.
+    all_sheets일 때만 L1~L4 헤더가 없는 시트를 건너뛰고, 그 외에는 ValueError.
+    시트 목록 확인은 스레드에서, 파싱은 (파일, 시트)마다 하나의 프로세스 작업으로 실행한다.
+    """
+    sheet_names = await asyncio.gather(
+        *(asyncio.to_thread(_list_sheets, file_bytes, sheets, all_sheets) for file_bytes in files)
+    )
+    jobs = [
+        (file_bytes, sheet_name, not all_sheets)
+        for file_bytes, names in zip(files, sheet_names)
+        for sheet_name in names
+    ]
+
+    if len(jobs) == 1:
+        results = [await asyncio.to_thread(_parse_file_sheet, *jobs[0])]
+    else:
+        loop = asyncio.get_running_loop()
+        pool = _get_parse_pool()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(pool, _parse_file_sheet, *job) for job in jobs)
+        )
+
+    rows: list[ParsedRow] = []
+    parsed_sheets = 0
+    for sheet_rows in results:
+        if sheet_rows is None:
+            continue
+        parsed_sheets += 1
+        rows.extend(sheet_rows)
+
+    if not parsed_sheets:
+        raise ValueError("L1~L4 헤더가 있는 시트를 찾을 수 없습니다.")
+    return ParsedExcel(rows=rows)
+
+
+def _list_sheets(file_bytes: bytes, sheets: list[str] | None, all_sheets: bool) -> list[str]:
+    """파싱할 시트 이름 목록 (read-only 워크북이라 시트 내용은 읽지 않는다)."""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(filename=BytesIO(file_bytes), read_only=True)
+    try:
+        return _select_sheets(wb, sheets, all_sheets)
+    finally:
+        wb.close()
+
+
+def _parse_file_sheet(file_bytes: bytes, sheet_name: str, strict: bool) -> list[ParsedRow] | None:
+    """워커 프로세스에서 실행되는 단일 시트 파서."""
+    from openpyxl import load_workbook
+
     wb = load_workbook(filename=BytesIO(file_bytes), read_only=True, data_only=True)
-    ws = wb.active
+    try:
+        return _parse_sheet(wb[sheet_name], strict)
+    finally:
+        wb.close()
+
+
+def _select_sheets(wb: Any, sheets: list[str] | None, all_sheets: bool) -> list[str]:
+    if all_sheets:
+        return list(wb.sheetnames)
+    if not sheets:
+        return [wb.active.title]
+    missing = [name for name in sheets if name not in wb.sheetnames]
+    if missing:
+        raise ValueError(f"시트를 찾을 수 없습니다: {missing}")
+    return list(sheets)
+
+
+def _parse_sheet(ws: Any, strict: bool) -> list[ParsedRow] | None:
+    """단일 시트 파서. 헤더가 없으면 strict가 아닐 때 None."""
+    try:
+        return _parse_rows(ws)
+    except ValueError:
+        if strict:
+            raise
+        return None
+
+
+_parse_pool: ProcessPoolExecutor | None = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=settings.UPLOAD_PARSE_WORKERS or None,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _parse_pool
+
 
+def _parse_rows(ws: Any) -> list[ParsedRow]:
+    """워크시트에서 L1~L4 컬럼을 찾아 유효한 행을 추출."""
     # 헤더 행에서 L1~L4 컬럼 인덱스 찾기
-    header_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True))
+    header_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
     col_map: dict[str, int] = {}
     for idx, cell_value in enumerate(header_row):
         if cell_value is None:
@@ -43,7 +218,7 @@ def parse_excel(file_bytes: bytes) -> ParsedExcel:
             f"엑셀 헤더에서 L1~L4 컬럼을 찾을 수 없습니다. 발견된 컬럼: {list(col_map.keys())}"
         )
 
-    rows: list[ExcelRow] = []
+    rows: list[ParsedRow] = []
     for row in ws.iter_rows(min_row=2, values_only=True):
         l1 = row[col_map["L1"]] if col_map["L1"] < len(row) else None
         l2 = row[col_map["L2"]] if col_map["L2"] < len(row) else None
@@ -55,226 +230,336 @@ def parse_excel(file_bytes: bytes) -> ParsedExcel:
             continue
 
         rows.append(
-            ExcelRow(
-                l1=str(l1).strip() if l1 else "",
-                l2=str(l2).strip() if l2 else "",
-                l3=str(l3).strip() if l3 else "",
-                l4=str(l4).strip() if l4 else "",
+            ParsedRow(
+                str(l1).strip() if l1 else "",
+                str(l2).strip() if l2 else "",
+                str(l3).strip() if l3 else "",
+                str(l4).strip(),
             )
         )
+    return rows
 
-    wb.close()
-    return ParsedExcel(rows=rows)
-
-
-def build_hierarchy(parsed: ParsedExcel) -> list[HierarchyNode]:
-    """파싱된 데이터를 계층 트리로 변환."""
-    tree: dict[str, dict] = {}  # l1 -> {name, children: {l2 -> ...}}
 
+def build_hierarchy(parsed: ParsedExcel) -> Hierarchy:
+    """파싱된 데이터를 계층 트리로 변환. 행 수에 선형 (이름 중복은 dict 해시로 제거)."""
+    hierarchy = Hierarchy()
     for row in parsed.rows:
-        if row.l1 not in tree:
-            tree[row.l1] = {}
-        l2_map = tree[row.l1]
-
-        if row.l2 not in l2_map:
-            l2_map[row.l2] = {}
-        l3_map = l2_map[row.l2]
-
-        if row.l3 not in l3_map:
-            l3_map[row.l3] = []
-        l4_list: list[str] = l3_map[row.l3]
-
-        if row.l4 not in l4_list:
-            l4_list.append(row.l4)
-
-    # dict → HierarchyNode 트리
-    result: list[HierarchyNode] = []
-    for l1_name, l2_map in tree.items():
-        l2_nodes: list[HierarchyNode] = []
-        for l2_name, l3_map in l2_map.items():
-            l3_nodes: list[HierarchyNode] = []
-            for l3_name, l4_list in l3_map.items():
-                l4_nodes = [HierarchyNode(name=n, level="L4") for n in l4_list]
-                l3_nodes.append(HierarchyNode(name=l3_name, level="L3", children=l4_nodes))
-            l2_nodes.append(HierarchyNode(name=l2_name, level="L2", children=l3_nodes))
-        result.append(HierarchyNode(name=l1_name, level="L1", children=l2_nodes))
-
-    return result
-
-
-def build_preview(parsed: ParsedExcel) -> UploadPreview:
-    """미리보기 데이터 생성."""
-    unique_l1 = set()
-    unique_l2 = set()
-    unique_l3 = set()
-    unique_l4 = set()
+        hierarchy.add(row)
+    return hierarchy
+
+
+def build_preview(
+    parsed: ParsedExcel,
+    hierarchy_offset: int = 0,
+    hierarchy_limit: int | None = None,
+    max_nodes: int = PREVIEW_MAX_NODES,
+) -> UploadPreview:
+    """미리보기 데이터 생성.
+
+    hierarchy는 L1 단위로 offset/limit 페이지네이션되며, 노드 수가 max_nodes를
+    넘으면 잘라내고 hierarchy_truncated를 True로 표시한다.
+    """
+    hierarchy = parsed.hierarchy
+    l1_nodes = list(hierarchy.roots.values())
+    end = None if hierarchy_limit is None else hierarchy_offset + hierarchy_limit
+    remaining = max_nodes
+    truncated = False
+
+    def to_response(nodes: Iterable[TreeNode]) -> list[HierarchyNode]:
+        nonlocal remaining, truncated
+        result: list[HierarchyNode] = []
+        for node in nodes:
+            if remaining <= 0:
+                truncated = True
+                break
+            remaining -= 1
+            result.append(
+                HierarchyNode.model_construct(
+                    name=node.name,
+                    level=node.level,
+                    children=to_response(node.children.values()),
+                )
+            )
+        return result
 
-    for row in parsed.rows:
-        unique_l1.add(row.l1)
-        unique_l2.add((row.l1, row.l2))
-        unique_l3.add((row.l1, row.l2, row.l3))
-        unique_l4.add((row.l1, row.l2, row.l3, row.l4))
+    page = to_response(l1_nodes[hierarchy_offset:end])
 
+    counts = hierarchy.counts
     return UploadPreview(
-        rows=parsed.rows[:10],
+        rows=[ExcelRow.model_construct(**row._asdict()) for row in parsed.rows[:PREVIEW_ROW_COUNT]],
         total_rows=len(parsed.rows),
         summary={
-            "l1_count": len(unique_l1),
-            "l2_count": len(unique_l2),
-            "l3_count": len(unique_l3),
-            "l4_count": len(unique_l4),
+            "l1_count": counts["L1"],
+            "l2_count": counts["L2"],
+            "l3_count": counts["L3"],
+            "l4_count": counts["L4"],
         },
-        hierarchy=build_hierarchy(parsed),
+        hierarchy=page,
+        hierarchy_total=len(l1_nodes),
+        hierarchy_truncated=truncated,
     )
 
 
-async def diff_tasks(db: AsyncSession, parsed: ParsedExcel) -> DiffResult:
-    """파싱된 데이터를 기존 DB와 비교하여 diff 트리 반환."""
-    # Root 노드 조회
-    result = await db.execute(
-        select(Task).where(Task.level == "Root", Task.deleted_at.is_(None))
-    )
-    root = result.scalar_one_or_none()
+async def diff_tasks(db: AsyncSession, parsed: ParsedExcel) -> dict:
+    """파싱된 데이터를 기존 DB와 비교하여 diff 트리 반환 (DiffResult 형태의 dict).
 
-    # 기존 태스크를 (level, parent_id, name)으로 인덱싱
-    all_tasks_result = await db.execute(
-        select(Task).where(Task.deleted_at.is_(None))
+    상태: new(신규) / existing(변경 없음) / moved(다른 부모 아래 동일 이름) / removed(파일에 없음).
+    DB는 id, parent_id, name, level 컬럼만 조회하며 파일 크기 + 트리 크기에 선형으로 동작한다.
+    노드가 많아 모델 객체 대신 dict로 만들고 API는 검증 없이 바로 직렬화한다.
+    """
+    tasks = Task.__table__
+    result = await db.execute(
+        select(tasks.c.id, tasks.c.parent_id, tasks.c.name, tasks.c.level).where(
+            tasks.c.deleted_at.is_(None)
+        )
     )
-    all_tasks = list(all_tasks_result.scalars().all())
-
-    # parent_id + name → Task 매핑
-    task_by_parent_name: dict[tuple[UUID | None, str], Task] = {}
-    for t in all_tasks:
-        task_by_parent_name[(t.parent_id, t.name)] = t
-
-    hierarchy = build_hierarchy(parsed)
-    stats = {"new": 0, "existing": 0, "total": 0}
+    index = _TaskIndex(result.tuples().all())
+
+    hierarchy = parsed.hierarchy
+    stats = {"new": 0, "existing": 0, "moved": 0, "removed": 0, "total": 0}
+
+    # 1차: 정확히 같은 위치(부모 경로 + 이름)에 있는 노드를 먼저 확보해
+    # 다른 노드가 moved 후보로 가져가지 않도록 한다.
+    exact: set[int] = set()
+
+    def claim_exact(node: TreeNode, parent: int) -> None:
+        pos = index.by_parent_name.get((parent, node.name))
+        if pos is None:
+            return
+        exact.add(pos)
+        for child in node.children.values():
+            claim_exact(child, pos)
+
+    # 2차: diff 트리 생성 (new 노드 아래는 parent=-1로 정확 매칭을 건너뜀).
+    # removed는 파일 전체의 moved 확보가 끝난 뒤 채우도록 (DB 위치, children)만 모아 둔다.
+    matched: list[tuple[int, list[dict]]] = []
+
+    def diff_node(node: TreeNode, parent: int) -> dict:
+        pos = index.by_parent_name.get((parent, node.name)) if parent >= 0 else None
+        if pos is not None and (pos in exact or pos not in claimed):
+            status = "existing"
+            claimed.add(pos)
+        else:
+            pos = index.take_moved(node.level, node.name, claimed)
+            status = "moved" if pos is not None else "new"
 
-    def diff_node(node: HierarchyNode, parent_id: UUID | None) -> DiffNode:
-        existing = task_by_parent_name.get((parent_id, node.name))
-        status = "existing" if existing else "new"
         stats[status] += 1
         stats["total"] += 1
 
-        children: list[DiffNode] = []
-        child_parent_id = existing.id if existing else None
-        for child in node.children:
-            children.append(diff_node(child, child_parent_id))
-
-        return DiffNode(
-            name=node.name,
-            level=node.level,
-            status=status,
-            children=children,
-        )
-
-    diff_tree: list[DiffNode] = []
-    root_id = root.id if root else None
-    for l1_node in hierarchy:
-        diff_tree.append(diff_node(l1_node, root_id))
-
-    return DiffResult(diff_tree=diff_tree, stats=stats)
+        if pos is None:
+            children = [diff_node(child, -1) for child in node.children.values()]
+        else:
+            children = [diff_node(child, pos) for child in node.children.values()]
+            matched.append((pos, children))
+
+        return {"name": node.name, "level": node.level, "status": status, "children": children}
+
+    def removed_nodes(parent: int) -> list[dict]:
+        removed: list[dict] = []
+        for pos in index.children.get(parent, ()):
+            if pos in claimed:
+                continue
+            stats["removed"] += 1
+            stats["total"] += 1
+            removed.append(
+                {
+                    "name": index.names[pos],
+                    "level": index.levels[pos],
+                    "status": "removed",
+                    "children": removed_nodes(pos),
+                }
+            )
+        return removed
+
+    root = index.root
+    if root >= 0:
+        for l1_node in hierarchy.roots.values():
+            claim_exact(l1_node, root)
+    claimed: set[int] = set(exact)
+
+    diff_tree = [diff_node(l1_node, root) for l1_node in hierarchy.roots.values()]
+
+    # 3차: 어디에도 확보되지 않은 DB 노드만 removed로 표시
+    for pos, children in matched:
+        children.extend(removed_nodes(pos))
+    if root >= 0:
+        diff_tree.extend(removed_nodes(root))
+
+    return {"diff_tree": diff_tree, "stats": stats}
+
+
+class _TaskIndex:
+    """diff용 경량 태스크 인덱스.
+
+    (id, parent_id, name, level) 행을 정수 위치로 압축해 UUID 해싱을 한 번으로 줄인다.
+    """
+
+    def __init__(self, rows: list[tuple[UUID, UUID | None, str, str]]) -> None:
+        self.root = -1
+        self.names: list[str] = [row[2] for row in rows]
+        self.levels: list[str] = [row[3] for row in rows]
+        self.by_parent_name: dict[tuple[int, str], int] = {}
+        self.by_level_name: dict[tuple[str, str], list[int]] = {}
+        self.children: dict[int, list[int]] = {}
+
+        position = {row[0]: pos for pos, row in enumerate(rows)}
+        for pos, (_, parent_id, name, level) in enumerate(rows):
+            if level == "Root":
+                if self.root < 0:
+                    self.root = pos
+                continue
+            parent = position.get(parent_id, -1)
+            self.by_parent_name[(parent, name)] = pos
+            self.by_level_name.setdefault((level, name), []).append(pos)
+            self.children.setdefault(parent, []).append(pos)
+
+    def take_moved(self, level: str, name: str, claimed: set[int]) -> int | None:
+        """같은 레벨·이름을 가진 미확보 노드를 하나 꺼내 moved로 확보."""
+        candidates = self.by_level_name.get((level, name))
+        while candidates:
+            pos = candidates.pop()
+            if pos not in claimed:
+                claimed.add(pos)
+                return pos
+        return None
 
 
 async def upsert_tasks(
-    db: AsyncSession, parsed: ParsedExcel, user_id: UUID
+    db: AsyncSession, parsed: ParsedExcel, user_id: UUID, fingerprint: str | None = None
 ) -> UpsertResult:
-    """파싱된 데이터를 DB에 upsert."""
-    created = 0
+    """파싱된 데이터를 DB에 upsert. fingerprint를 주면 같은 트랜잭션에서 반영 기록을 남긴다."""
+    created_tasks: list[Task] = []
     skipped = 0
 
-    # Root 노드 조회/생성
-    result = await db.execute(
-        select(Task).where(Task.level == "Root", Task.deleted_at.is_(None))
-    )
-    root = result.scalar_one_or_none()
-    if not root:
-        root = Task(
-            level="Root",
-            name="Root",
-            organization="",
+    # live 트리 전체를 한 번에 읽어 (parent_id, name) 색인 (노드마다 SELECT하지 않음)
+    result = await db.execute(select(Task).where(Task.deleted_at.is_(None)))
+    live_tasks = result.scalars().all()
+    by_parent_name = {(task.parent_id, task.name): task for task in live_tasks}
+
+    def create(parent_id: UUID | None, level: str, name: str, organization: str) -> Task:
+        # id를 미리 정해 두고 flush는 끝에 한 번 (INSERT 일괄 실행)
+        task = Task(
+            id=uuid4(),
+            parent_id=parent_id,
+            level=level,
+            name=name,
+            organization=organization,
             created_by=user_id,
             updated_by=user_id,
         )
-        db.add(root)
-        await db.flush()
-        _create_history(db, root, user_id)
-        created += 1
+        db.add(task)
+        created_tasks.append(task)
+        return task
 
-    hierarchy = build_hierarchy(parsed)
+    # Root 노드 조회/생성
+    root = next((task for task in live_tasks if task.level == "Root"), None)
+    if not root:
+        root = create(None, "Root", "Root", "")
 
-    for l1_node in hierarchy:
-        l1_task, is_new = await _find_or_create(
-            db, root.id, "L1", l1_node.name, l1_node.name, user_id
-        )
-        if is_new:
-            created += 1
-        else:
-            skipped += 1
+    subtree_deltas = SubtreeDeltas()
 
-        for l2_node in l1_node.children:
-            l2_task, is_new = await _find_or_create(
-                db, l1_task.id, "L2", l2_node.name, l1_node.name, user_id
-            )
-            if is_new:
-                created += 1
-            else:
-                skipped += 1
-
-            for l3_node in l2_node.children:
-                l3_task, is_new = await _find_or_create(
-                    db, l2_task.id, "L3", l3_node.name, l1_node.name, user_id
+    def find_or_create(ancestors: list[Task], level: str, name: str, organization: str) -> Task:
+        nonlocal skipped
+        key = (ancestors[-1].id, name)
+        task = by_parent_name.get(key)
+        if task is not None:
+            skipped += 1
+            return task
+        task = by_parent_name[key] = create(ancestors[-1].id, level, name, organization)
+        subtree_deltas.add(ancestors, level)
+        return task
+
+    for l1_node in parsed.hierarchy.roots.values():
+        l1_task = find_or_create([root], "L1", l1_node.name, l1_node.name)
+        for l2_node in l1_node.children.values():
+            l2_task = find_or_create([root, l1_task], "L2", l2_node.name, l1_node.name)
+            for l3_node in l2_node.children.values():
+                l3_task = find_or_create(
+                    [root, l1_task, l2_task], "L3", l3_node.name, l1_node.name
                 )
-                if is_new:
-                    created += 1
-                else:
-                    skipped += 1
-
-                for l4_node in l3_node.children:
-                    _, is_new = await _find_or_create(
-                        db, l3_task.id, "L4", l4_node.name, l1_node.name, user_id
+                for l4_node in l3_node.children.values():
+                    find_or_create(
+                        [root, l1_task, l2_task, l3_task], "L4", l4_node.name, l1_node.name
                     )
-                    if is_new:
-                        created += 1
-                    else:
-                        skipped += 1
 
+    await db.flush()
+    for task in created_tasks:
+        _create_history(db, task, user_id)
+
+    # 새로 만든 노드들의 조상 집계를 조상별 UPDATE 한 번씩으로 반영
+    ancestors = await subtree_deltas.apply(db)
+    created = len(created_tasks)
+    result = UpsertResult(created=created, skipped=skipped, total=created + skipped)
+    if fingerprint is not None:
+        await record_applied_upload(db, fingerprint, result)
     await db.commit()
-    return UpsertResult(created=created, skipped=skipped, total=created + skipped)
-
-
-async def _find_or_create(
-    db: AsyncSession,
-    parent_id: UUID,
-    level: str,
-    name: str,
-    organization: str,
-    user_id: UUID,
-) -> tuple[Task, bool]:
-    """이름과 부모 ID로 기존 태스크를 찾거나 새로 생성."""
+    await publish_task_changes("created", created_tasks, ancestors)
+    return result
+
+
+def upload_fingerprint(
+    files: list[bytes], sheets: list[str] | None = None, all_sheets: bool = False
+) -> str:
+    """업로드 내용(파일 바이트 + 시트 선택)의 해시."""
+    digest = hashlib.sha256()
+    for file_bytes in files:
+        digest.update(hashlib.sha256(file_bytes).digest())
+    digest.update(repr((sheets, all_sheets)).encode())
+    return digest.hexdigest()
+
+
+async def lock_task_tree(db: AsyncSession) -> None:
+    """트랜잭션이 끝날 때까지 다른 업로드 confirm과 직렬화 (워커 간 공통, 일반 태스크 쓰기는 막지 않음)."""
+    await db.execute(select(func.pg_advisory_xact_lock(TREE_LOCK_KEY)))
+
+
+async def get_tree_version(db: AsyncSession) -> int:
+    """트리 버전. tasks에 대한 쓰기 문장마다 증가하는 DB 시퀀스 값."""
     result = await db.execute(
-        select(Task).where(
-            Task.parent_id == parent_id,
-            Task.name == name,
-            Task.deleted_at.is_(None),
-        )
+        text("SELECT CASE WHEN is_called THEN last_value ELSE 0 END FROM tree_version_seq")
     )
-    existing = result.scalar_one_or_none()
-    if existing:
-        return existing, False
-
-    task = Task(
-        parent_id=parent_id,
-        level=level,
-        name=name,
-        organization=organization,
-        created_by=user_id,
-        updated_by=user_id,
+    return result.scalar_one()
+
+
+async def get_applied_upload(db: AsyncSession, fingerprint: str) -> UpsertResult | None:
+    """같은 업로드가 현재 트리 버전에 이미 반영되었다면 당시 결과를 반환."""
+    result = await db.execute(
+        select(AppliedUpload.tree_version, AppliedUpload.result).where(
+            AppliedUpload.fingerprint == fingerprint
+        )
     )
-    db.add(task)
+    applied = result.one_or_none()
+    if applied is None or applied.tree_version != await get_tree_version(db):
+        return None
+    return UpsertResult.model_validate(applied.result)
+
+
+async def record_applied_upload(
+    db: AsyncSession, fingerprint: str, result: UpsertResult
+) -> None:
+    """반영 직후(커밋 전, 트리 잠금 안)의 트리 버전과 결과를 기록.
+
+    이전 버전에 기록된 항목은 더 이상 유효하지 않으므로 함께 지운다.
+    """
     await db.flush()
-    _create_history(db, task, user_id)
-    return task, True
+    tree_version = await get_tree_version(db)
+    await db.execute(delete(AppliedUpload).where(AppliedUpload.tree_version < tree_version))
+    stmt = pg_insert(AppliedUpload).values(
+        fingerprint=fingerprint,
+        tree_version=tree_version,
+        result=result.model_dump(),
+        applied_at=datetime.utcnow(),
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[AppliedUpload.fingerprint],
+            set_={
+                "tree_version": stmt.excluded.tree_version,
+                "result": stmt.excluded.result,
+                "applied_at": stmt.excluded.applied_at,
+            },
+        )
+    )
 
 
 def _create_history(db: AsyncSession, task: Task, user_id: UUID) -> None:
@@ -287,3 +572,73 @@ def _create_history(db: AsyncSession, task: Task, user_id: UUID) -> None:
         changed_by=user_id,
     )
     db.add(history)
+
+
+async def iter_export_rows(db: AsyncSession) -> AsyncIterator[tuple[str, str, str, str]]:
+    """L4 기준으로 (L1, L2, L3, L4) 경로를 서버 사이드 커서로 스트리밍."""
+    l1, l2, l3, l4 = (aliased(Task) for _ in range(4))
+    stmt = (
+        select(l1.name, l2.name, l3.name, l4.name)
+        .select_from(l4)
+        .join(l3, l4.parent_id == l3.id)
+        .join(l2, l3.parent_id == l2.id)
+        .join(l1, l2.parent_id == l1.id)
+        .where(
+            l4.level == "L4",
+            l4.deleted_at.is_(None),
+            l3.deleted_at.is_(None),
+            l2.deleted_at.is_(None),
+            l1.deleted_at.is_(None),
+        )
+        .order_by(l1.name, l2.name, l3.name, l4.name)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    result = await db.stream(stmt)
+    async for partition in result.partitions():
+        for row in partition:
+            yield tuple(row)
+
+
+async def export_csv() -> AsyncIterator[bytes]:
+    """parse_excel과 같은 L1~L4 컬럼의 CSV를 배치 단위로 스트리밍."""
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    # Excel에서 한글이 깨지지 않도록 BOM 포함
+    buffer.write("\ufeff")
+    writer.writerow(EXPORT_COLUMNS)
+
+    # 응답 이후에도 커서가 살아 있어야 하므로 요청 세션 대신 별도 (복제본) 세션 사용
+    async with async_read_session() as db:
+        count = 0
+        async for row in iter_export_rows(db):
+            writer.writerow(row)
+            count += 1
+            if count % EXPORT_BATCH_SIZE == 0:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+
+    yield buffer.getvalue().encode("utf-8")
+
+
+async def export_xlsx() -> AsyncIterator[bytes]:
+    """openpyxl write-only 모드로 L1~L4 엑셀을 생성해 스트리밍.
+
+    write-only 워크북은 행을 임시 파일로 흘려보내므로 메모리 사용량이 행 수와 무관하다.
+    xlsx는 zip 포맷이라 저장이 끝난 뒤부터 전송된다 (즉시 전송이 필요하면 CSV 사용).
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("PI")
+    ws.append(EXPORT_COLUMNS)
+
+    async with async_read_session() as db:
+        async for row in iter_export_rows(db):
+            ws.append(row)
+
+    with tempfile.TemporaryFile() as tmp:
+        await asyncio.to_thread(wb.save, tmp)
+        tmp.seek(0)
+        while chunk := await asyncio.to_thread(tmp.read, EXPORT_CHUNK_SIZE):
+            yield chunk
@@ -0,0 +1,49 @@
+"""두 벤치마크 결과(JSON) 비교. 기준 대비 p50/p99가 threshold 이상 느려지면 exit 1.
+
+    python -m benchmarks.compare base.json head.json --threshold 0.15
+"""
+import argparse
+import json
+import sys
+
+METRICS = ("p50_ms", "p99_ms")
+
+
+def compare(base: dict, head: dict, threshold: float) -> list[str]:
+    regressions = []
+    for size, head_size in head["sizes"].items():
+        base_size = base["sizes"].get(size)
+        if not base_size:
+            continue
+        for endpoint, head_stats in head_size["endpoints"].items():
+            base_stats = base_size["endpoints"].get(endpoint)
+            if not base_stats:
+                continue
+            for metric in METRICS:
+                before, after = base_stats[metric], head_stats[metric]
+                change = (after - before) / before if before else 0.0
+                flag = "REGRESSION" if change > threshold else ""
+                print(f"[{size}] {endpoint:32} {metric} {before:>9} -> {after:>9} ({change:+.1%}) {flag}")
+                if flag:
+                    regressions.append(f"{size} {endpoint} {metric}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=0.15, help="허용 지연 증가율")
+    args = parser.parse_args()
+
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.head) as f:
+        head = json.load(f)
+    print(f"base {base['commit']} -> head {head['commit']}")
+    regressions = compare(base, head, args.threshold)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""API 핫 패스 벤치마크.
+
+로컬 PostgreSQL(DATABASE_URL)에 크기별 합성 데이터를 적재한 뒤 FastAPI 앱을
+프로세스 안에서(httpx ASGITransport) 호출하여 지연 시간 분위수와 처리량을 측정한다.
+결과는 커밋별 JSON으로 저장되며 benchmarks.compare로 비교한다.
+
+    ENVIRONMENT=development python -m benchmarks.run --sizes small,medium
+    python -m benchmarks.compare benchmarks/results/<old>.json benchmarks/results/<new>.json
+
+주의: 대상 DB의 tasks / task_histories를 비우고 다시 채운다.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from io import BytesIO
+from pathlib import Path
+
+import httpx
+from openpyxl import Workbook
+
+from app.core.rate_limit import limiter
+from app.db.generate import Shape, generate
+from app.main import app
+
+SIZES = {
+    "small": Shape(l1_count=5, fanout=(4, 4, 7), history_depth=2),
+    "medium": Shape(l1_count=10, fanout=(10, 10, 20), history_depth=3),
+    "large": Shape(l1_count=10, fanout=(20, 50, 100), history_depth=10),
+}
+RESULTS_DIR = Path(__file__).parent / "results"
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def summarize(latencies: list[float], statuses: Counter, wall: float) -> dict:
+    values = sorted(latencies)
+    ms = lambda v: round(v * 1000, 2)  # noqa: E731
+    return {
+        "requests": len(values),
+        "throughput_rps": round(len(values) / wall, 2) if wall else 0.0,
+        "mean_ms": ms(statistics.fmean(values)) if values else 0.0,
+        "p50_ms": ms(_percentile(values, 0.50)),
+        "p90_ms": ms(_percentile(values, 0.90)),
+        "p99_ms": ms(_percentile(values, 0.99)),
+        "max_ms": ms(values[-1]) if values else 0.0,
+        "status": {str(k): v for k, v in statuses.items()},
+    }
+
+
+async def measure(make_request, requests: int, concurrency: int, warmup: int) -> dict:
+    """make_request(i)는 httpx.Response를 반환하는 코루틴."""
+    for i in range(warmup):
+        await make_request(i)
+
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            started_at = time.perf_counter()
+            response = await make_request(i)
+            latencies.append(time.perf_counter() - started_at)
+            statuses[response.status_code] += 1
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    return summarize(latencies, statuses, time.perf_counter() - started_at)
+
+
+def build_workbook(shape: Shape, l4_per_l3: int, new_tag: str = "") -> bytes:
+    """generate()가 만든 트리와 같은 이름의 L1~L4 엑셀 (new_tag가 있으면 신규 L4 포함)."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("PI")
+    ws.append(["L1", "L2", "L3", "L4"])
+    f2, f3, _ = shape.fanout
+    for i in range(shape.l1_count):
+        org = f"조직{i:03d}"
+        for j in range(f2):
+            for k in range(f3):
+                for m in range(l4_per_l3):
+                    ws.append([org, f"{org} 업무{j:03d}", f"세부{k:03d}", f"과제{m:04d}"])
+                if new_tag:
+                    ws.append([org, f"{org} 업무{j:03d}", f"세부{k:03d}", f"신규-{new_tag}"])
+    buffer = BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+async def run_size(name: str, shape: Shape, args: argparse.Namespace) -> dict:
+    dataset = await generate(shape, seed=args.seed, batch_size=50_000, reset=True)
+    print(f"[{name}] loaded {dataset['tasks']} tasks / {dataset['histories']} histories in {dataset['seconds']}s")
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=600) as client:
+        login = {"employee_id": "admin", "password": "admin123"}
+        token = (await client.post("/api/auth/login", json=login)).json()["data"]["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        graph = (await client.get("/api/tasks/graph", headers=headers)).json()["data"]
+        task_ids = [t["id"] for t in graph if t["level"] == "L4"][: args.requests] or [graph[0]["id"]]
+
+        n, c, w = args.requests, args.concurrency, args.warmup
+        results: dict[str, dict] = {}
+
+        results["GET /tasks/graph"] = await measure(
+            lambda i: client.get("/api/tasks/graph", headers=headers), max(1, n // 10), c, 1
+        )
+        results["GET /tasks/{id}"] = await measure(
+            lambda i: client.get(f"/api/tasks/{task_ids[i % len(task_ids)]}", headers=headers), n, c, w
+        )
+        results["GET /tasks/{id}/history"] = await measure(
+            lambda i: client.get(f"/api/tasks/{task_ids[i % len(task_ids)]}/history", headers=headers), n, c, w
+        )
+        results["POST /auth/login"] = await measure(
+            lambda i: client.post("/api/auth/login", json=login), max(1, n // 10), c, 1
+        )
+
+        workbook = build_workbook(shape, args.upload_l4_per_l3)
+        upload = lambda data: {"file": ("bench.xlsx", data, XLSX_MEDIA_TYPE)}  # noqa: E731
+        upload_n = args.upload_requests
+        results["POST /upload/preview"] = await measure(
+            lambda i: client.post("/api/upload/preview", headers=headers, files=upload(workbook)), upload_n, 1, 1
+        )
+        results["POST /upload/diff"] = await measure(
+            lambda i: client.post("/api/upload/diff", headers=headers, files=upload(workbook)), upload_n, 1, 1
+        )
+        # 매번 다른 파일 (신규 L4 포함) → 실제 upsert 경로
+        fresh = [build_workbook(shape, args.upload_l4_per_l3, f"{name}-{i}") for i in range(upload_n)]
+        results["POST /upload/confirm"] = await measure(
+            lambda i: client.post("/api/upload/confirm", headers=headers, files=upload(fresh[i])), upload_n, 1, 0
+        )
+        # 같은 파일 재전송 → 멱등 단축 경로
+        results["POST /upload/confirm (repeat)"] = await measure(
+            lambda i: client.post("/api/upload/confirm", headers=headers, files=upload(fresh[-1])), upload_n, 1, 0
+        )
+
+    return {"dataset": dataset, "endpoints": results}
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def main_async(args: argparse.Namespace) -> dict:
+    # 로그인 5/minute 등 rate limit이 측정을 막지 않도록 비활성화
+    limiter.enabled = False
+    report = {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "params": vars(args),
+        "sizes": {},
+    }
+    for name in args.sizes.split(","):
+        report["sizes"][name] = await run_size(name, SIZES[name], args)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="API 핫 패스 벤치마크")
+    parser.add_argument("--sizes", default="small,medium", help=f"쉼표 구분 ({', '.join(SIZES)})")
+    parser.add_argument("--requests", type=int, default=200, help="엔드포인트당 요청 수")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--upload-requests", type=int, default=3)
+    parser.add_argument("--upload-l4-per-l3", type=int, default=5, help="업로드 엑셀의 L3당 L4 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/<commit>.json)")
+    args = parser.parse_args()
+
+    report = asyncio.run(main_async(args))
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{report['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+
+    for size, result in report["sizes"].items():
+        for endpoint, stats in result["endpoints"].items():
+            print(f"[{size}] {endpoint:32} p50={stats['p50_ms']}ms p99={stats['p99_ms']}ms {stats['throughput_rps']} req/s")
+    print(f"Saved {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""테스트 공통 fixture.
+
+DB 테스트는 비어 있는 PostgreSQL을 TEST_DATABASE_URL로 지정했을 때만 실행된다.
+
+    TEST_DATABASE_URL=postgresql+asyncpg://postgres@localhost/pi_test python -m pytest -q
+
+스키마는 모델 메타데이터로 만들고 테스트마다 모든 테이블을 비운다.
+"""
+import os
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "")
+
+# app import 전에 설정 (settings는 import 시점에 한 번 읽힌다)
+os.environ["ENVIRONMENT"] = "development"
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL or "postgresql+asyncpg://test@localhost/test"
+os.environ["DATABASE_REPLICA_URL"] = ""
+os.environ["DB_POOL_MODE"] = "pgbouncer"
+os.environ["BCRYPT_ROUNDS"] = "4"
+os.environ["QUERY_MONITOR_MODE"] = "raise"  # 요청 안의 N+1은 테스트 실패로
+
+import httpx
+import pytest
+from sqlalchemy import text
+
+from app.api.deps import invalidate_user_cache
+from app.core import security
+from app.core.rate_limit import limiter
+from app.core.security import create_access_token, get_password_hash
+from app.core.token_blacklist import InMemoryTokenBlacklist
+from app.db.session import Base, async_session, engine
+from app.main import app
+from app.models import User
+
+limiter.enabled = False
+
+
+@pytest.fixture(scope="session")
+async def database():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL이 설정되지 않음")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+
+@pytest.fixture(autouse=True)
+def _reset_process_state(monkeypatch):
+    """프로세스 로컬 캐시가 테스트 사이에 새지 않도록 초기화."""
+    invalidate_user_cache()
+    security._jwt_cache.clear()
+    monkeypatch.setattr(security, "_token_blacklist", InMemoryTokenBlacklist())
+
+
+@pytest.fixture
+async def db(database):
+    tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    async with engine.begin() as conn:
+        await conn.execute(text(f"TRUNCATE {tables} CASCADE"))
+    async with async_session() as session:
+        yield session
+
+
+@pytest.fixture
+async def client():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+async def create_user(db, employee_id: str = "admin", role: str = "admin", password: str = "secret") -> User:
+    user = User(
+        employee_id=employee_id,
+        password_hash=get_password_hash(password),
+        name=employee_id,
+        organization="본부",
+        role=role,
+    )
+    db.add(user)
+    await db.commit()
+    return user
+
+
+def auth_headers(user: User) -> dict[str, str]:
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
+
+
+@pytest.fixture
+async def admin(db) -> User:
+    return await create_user(db)
+
+
+@pytest.fixture
+def admin_headers(admin) -> dict[str, str]:
+    return auth_headers(admin)
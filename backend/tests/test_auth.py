@@ -0,0 +1,77 @@
+import time
+
+from app.core.token_blacklist import InMemoryTokenBlacklist
+from tests.conftest import create_user
+
+
+async def login(client, employee_id: str = "admin", password: str = "secret"):
+    return await client.post("/api/auth/login", json={"employee_id": employee_id, "password": password})
+
+
+async def test_in_memory_blacklist_expires_entries():
+    blacklist = InMemoryTokenBlacklist()
+    now = time.time()
+
+    await blacklist.add("expired", now - 1)
+    await blacklist.add("live", now + 60)
+    await blacklist.add("short", now + 0.05)
+
+    assert not await blacklist.contains("expired")
+    assert await blacklist.contains("live")
+    assert await blacklist.contains("short")
+
+    time.sleep(0.06)
+    assert not await blacklist.contains("short")
+    assert await blacklist.clear_expired() == 0  # contains()가 이미 제거
+    assert len(blacklist) == 1
+
+
+async def test_logout_revokes_access_token(client, admin):
+    tokens = (await login(client)).json()["data"]
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    assert (await client.get("/api/auth/me", headers=headers)).status_code == 200
+
+    assert (await client.post("/api/auth/logout", headers=headers)).status_code == 200
+
+    response = await client.get("/api/auth/me", headers=headers)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token has been revoked"
+
+
+async def test_refresh_rotates_and_revokes_refresh_token(client, admin):
+    tokens = (await login(client)).json()["data"]
+
+    response = await client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 200, response.text
+    rotated = response.json()["data"]
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+
+    # 이미 사용한 refresh token은 재사용 불가, 새 토큰은 사용 가능
+    reuse = await client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert reuse.status_code == 401
+    assert reuse.json()["detail"] == "Token has been revoked"
+
+    response = await client.post("/api/auth/refresh", json={"refresh_token": rotated["refresh_token"]})
+    assert response.status_code == 200, response.text
+
+    headers = {"Authorization": f"Bearer {rotated['access_token']}"}
+    assert (await client.get("/api/auth/me", headers=headers)).status_code == 200
+
+
+async def test_access_token_cannot_refresh(client, admin):
+    tokens = (await login(client)).json()["data"]
+
+    response = await client.post("/api/auth/refresh", json={"refresh_token": tokens["access_token"]})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Invalid refresh token"
+
+
+async def test_refresh_rejects_inactive_user(client, db):
+    user = await create_user(db, employee_id="viewer1", role="viewer")
+    tokens = (await login(client, "viewer1")).json()["data"]
+
+    user.is_active = False
+    await db.commit()
+
+    response = await client.post("/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 401
@@ -0,0 +1,24 @@
+import pytest
+from sqlalchemy import func, select
+
+from app.db.generate import Shape, generate
+from app.models import Task
+
+SHAPE = Shape(l1_count=2, fanout=(2, 2, 3), history_depth=2)
+
+
+async def test_generate_refuses_to_append_without_reset(db):
+    counts = await generate(SHAPE, seed=1, batch_size=10, reset=False)
+    assert counts["tasks"] == SHAPE.task_count
+    assert counts["histories"] == SHAPE.task_count * 2
+
+    with pytest.raises(ValueError, match="--reset"):
+        await generate(SHAPE, seed=1, batch_size=10, reset=False)
+
+    await generate(SHAPE, seed=2, batch_size=10, reset=True)
+    roots = await db.scalar(select(func.count()).select_from(Task).where(Task.level == "Root"))
+    assert roots == 1
+    assert await db.scalar(select(func.count()).select_from(Task)) == SHAPE.task_count
+
+    root = (await db.execute(select(Task).where(Task.level == "Root"))).scalar_one()
+    assert (root.subtree_l1_count, root.subtree_l4_count) == (2, 2 * 2 * 2 * 3)
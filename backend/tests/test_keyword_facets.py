@@ -0,0 +1,86 @@
+from sqlalchemy import select, text
+
+from app.models import KeywordFacet
+from app.services.keyword_facets import REBUILD_STATEMENTS, FacetDeltas
+
+
+async def create(client, headers, **data) -> str:
+    response = await client.post("/api/tasks", headers=headers, json=data)
+    assert response.status_code == 200, response.text
+    return response.json()["data"]["id"]
+
+
+async def facets(client, headers, **params) -> dict[str, tuple[int, int]]:
+    response = await client.get("/api/tasks/keywords/facets", headers=headers, params=params)
+    assert response.status_code == 200, response.text
+    return {item["keyword"]: (item["count"], item["ai_count"]) for item in response.json()["data"]["keywords"]}
+
+
+async def facet_rows(db) -> set[tuple]:
+    result = await db.execute(select(KeywordFacet))
+    return {(f.scope_type, f.scope_key, f.keyword, f.task_count, f.ai_count) for f in result.scalars()}
+
+
+async def test_facets_follow_create_update_delete(client, db, admin_headers):
+    root = await create(client, admin_headers, name="Root", organization="")
+    l1 = await create(client, admin_headers, parent_id=root, name="A", organization="A", keywords=["erp"])
+    l2 = await create(
+        client, admin_headers,
+        parent_id=l1, name="B", organization="A", keywords=["erp", " ai "], is_ai_utilized=True,
+    )
+    other = await create(client, admin_headers, parent_id=root, name="C", organization="C", keywords=["erp"])
+
+    # 생성: 전체 / 조직 / 서브트리(자신 포함) 범위에 반영
+    assert await facets(client, admin_headers) == {"erp": (3, 1), "ai": (1, 1)}
+    assert await facets(client, admin_headers, organization="A") == {"erp": (2, 1), "ai": (1, 1)}
+    assert await facets(client, admin_headers, task_id=l1) == {"erp": (2, 1), "ai": (1, 1)}
+    assert await facets(client, admin_headers, task_id=l2) == {"erp": (1, 1), "ai": (1, 1)}
+    assert await facets(client, admin_headers, task_id=root) == {"erp": (3, 1), "ai": (1, 1)}
+    assert await facets(client, admin_headers, task_id=other) == {"erp": (1, 0)}
+
+    # 수정: 키워드·AI 여부 변경
+    response = await client.put(
+        f"/api/tasks/{l2}", headers=admin_headers, json={"keywords": ["mes"], "is_ai_utilized": False}
+    )
+    assert response.status_code == 200, response.text
+    assert await facets(client, admin_headers) == {"erp": (2, 0), "mes": (1, 0)}
+    assert await facets(client, admin_headers, task_id=l1) == {"erp": (1, 0), "mes": (1, 0)}
+
+    # 삭제: 0이 된 키워드는 사라짐
+    response = await client.delete(f"/api/tasks/{l2}", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert await facets(client, admin_headers) == {"erp": (2, 0)}
+    assert await facets(client, admin_headers, task_id=l1) == {"erp": (1, 0)}
+    assert await facets(client, admin_headers, task_id=l2) == {}
+
+    # 증분 결과가 전체 재계산과 같아야 함
+    incremental = await facet_rows(db)
+    for statement in REBUILD_STATEMENTS:
+        await db.execute(text(statement))
+    await db.commit()
+    assert await facet_rows(db) == incremental
+
+
+async def test_facet_scope_parameters_are_exclusive(client, admin_headers):
+    response = await client.get(
+        "/api/tasks/keywords/facets",
+        headers=admin_headers,
+        params={"organization": "A", "task_id": "00000000-0000-0000-0000-000000000000"},
+    )
+    assert response.status_code == 400
+
+
+async def test_cleanup_deletes_only_decremented_keys(db):
+    db.add_all([
+        KeywordFacet(scope_type="all", scope_key="", keyword="k", task_count=1, ai_count=0),
+        KeywordFacet(scope_type="organization", scope_key="B", keyword="k", task_count=0, ai_count=0),
+    ])
+    await db.commit()
+
+    deltas = FacetDeltas()
+    deltas.add({"k"}, "A", False, [], sign=-1)
+    await deltas.apply(db)
+    await db.commit()
+
+    # 감소한 (all, k) / (organization A, k)만 정리되고 같은 키워드의 다른 범위 행은 그대로
+    assert await facet_rows(db) == {("organization", "B", "k", 0, 0)}
@@ -0,0 +1,23 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+
+from app.core.metrics import RequestStats, current_request_stats
+from app.db.session import engine
+
+
+async def test_db_time_is_recorded_for_failed_statements(database):
+    stats = RequestStats()
+    token = current_request_stats.set(stats)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            with pytest.raises(DBAPIError):
+                await conn.execute(text("SELECT 1 / 0"))
+            await conn.rollback()
+            await conn.execute(text("SELECT 2"))
+    finally:
+        current_request_stats.reset(token)
+
+    assert stats.queries == 3
+    assert stats.db_seconds > 0
@@ -0,0 +1,57 @@
+import asyncio
+
+from passlib.context import CryptContext
+from sqlalchemy import select
+
+from app.core import security
+from app.core.config import settings
+from app.models import User
+from tests.conftest import create_user
+
+
+async def login(client, password: str):
+    return await client.post("/api/auth/login", json={"employee_id": "admin", "password": password})
+
+
+async def test_login_verifies_password(client, admin):
+    assert (await login(client, "secret")).status_code == 200
+    assert (await login(client, "wrong")).status_code == 401
+
+
+async def test_login_rehashes_password_with_current_cost(client, db):
+    user = await create_user(db)
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=settings.BCRYPT_ROUNDS + 1).hash("secret")
+    user.password_hash = old_hash
+    await db.commit()
+
+    assert (await login(client, "secret")).status_code == 200
+
+    stored = (await db.execute(select(User.password_hash).where(User.id == user.id))).scalar_one()
+    assert stored != old_hash
+    assert stored.startswith(f"$2b${settings.BCRYPT_ROUNDS:02d}$")
+    assert (await login(client, "secret")).status_code == 200
+
+
+async def test_hash_jobs_are_limited_to_configured_concurrency():
+    hashed = security.get_password_hash("secret")
+    before = security.password_hash_metrics.count
+    peak = 0
+
+    async def observe():
+        nonlocal peak
+        while True:
+            peak = max(peak, security.password_hash_metrics.in_flight)
+            await asyncio.sleep(0)
+
+    watcher = asyncio.create_task(observe())
+    results = await asyncio.gather(
+        *(
+            security.verify_and_update_password("secret", hashed)
+            for _ in range(settings.PASSWORD_HASH_CONCURRENCY * 3)
+        )
+    )
+    watcher.cancel()
+
+    assert all(valid for valid, _ in results)
+    assert 1 <= peak <= settings.PASSWORD_HASH_CONCURRENCY
+    assert security.password_hash_metrics.count - before == len(results)
@@ -0,0 +1,65 @@
+import logging
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.db.query_monitor import (
+    QueryRepetitionError,
+    install_query_monitor,
+    monitor_queries,
+    statement_shape,
+)
+from tests.conftest import TEST_DATABASE_URL
+
+
+@pytest.fixture
+async def monitored_engine(database, monkeypatch):
+    def create(mode: str = "off", slow_ms: int = 0):
+        monkeypatch.setattr(settings, "QUERY_MONITOR_MODE", mode)
+        monkeypatch.setattr(settings, "SLOW_QUERY_MS", slow_ms)
+        engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+        install_query_monitor(engine)
+        engines.append(engine)
+        return engine
+
+    engines = []
+    yield create
+    for engine in engines:
+        await engine.dispose()
+
+
+def test_statement_shape_ignores_parameters():
+    assert statement_shape("SELECT * FROM t WHERE id = $1::UUID") == statement_shape(
+        "SELECT *  FROM t\n WHERE id = $2"
+    )
+    assert statement_shape("SELECT * FROM t WHERE id IN (?, ?, ?)") == "SELECT * FROM t WHERE id IN (?)"
+
+
+async def test_slow_failed_statement_is_logged(monitored_engine, caplog):
+    engine = monitored_engine(slow_ms=10)
+    caplog.set_level(logging.WARNING, logger="app.db.query_monitor")
+
+    async with engine.connect() as conn:
+        with pytest.raises(DBAPIError):
+            await conn.execute(text("SELECT 1 / (random() * 0)::int FROM pg_sleep(0.02)"))
+        await conn.rollback()
+        await conn.execute(text("SELECT 1"))
+
+    slow = [record for record in caplog.records if "Slow query" in record.getMessage()]
+    assert len(slow) == 1
+    assert "pg_sleep" in slow[0].getMessage()
+
+
+async def test_repeated_statement_raises_in_raise_mode(monitored_engine):
+    engine = monitored_engine(mode="raise")
+
+    async with engine.connect() as conn:
+        with monitor_queries(threshold=2):
+            for i in range(2):
+                await conn.execute(text("SELECT CAST(:i AS int)"), {"i": i})
+            with pytest.raises(QueryRepetitionError):
+                await conn.execute(text("SELECT CAST(:i AS int)"), {"i": 3})
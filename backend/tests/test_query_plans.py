@@ -0,0 +1,92 @@
+"""핫 쿼리 실행 계획 회귀 검사.
+
+현실적인 규모(MIN_ROWS 이상)의 트리를 만들고 API가 실제로 실행한 쿼리를 모아
+EXPLAIN (FORMAT JSON)으로 확인한다. tasks / task_histories에 Seq Scan이 있으면 실패.
+(트리 전체를 읽는 diff / export / 업로드 upsert 같은 쿼리는 대상이 아니다)
+"""
+import json
+
+import pytest
+from sqlalchemy import event, select
+
+from app.db.generate import Shape, generate
+from app.db.session import engine
+from app.models import Task
+
+MIN_ROWS = 10_000
+SHAPE = Shape(l1_count=10, fanout=(5, 10, 20), history_depth=2)
+CHECKED_TABLES = {"tasks", "task_histories"}
+
+
+def _find_seq_scans(node: dict) -> list[str]:
+    found = []
+    if node.get("Node Type") == "Seq Scan" and node.get("Relation Name") in CHECKED_TABLES:
+        found.append(node["Relation Name"])
+    for child in node.get("Plans", []):
+        found.extend(_find_seq_scans(child))
+    return found
+
+
+class StatementRecorder:
+    """블록 안에서 엔진이 실행한 (SQL, 파라미터) 기록."""
+
+    def __init__(self) -> None:
+        self.statements: list[tuple[str, tuple]] = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if not executemany and any(table in statement for table in CHECKED_TABLES):
+            self.statements.append((statement, parameters))
+
+    def __enter__(self) -> "StatementRecorder":
+        event.listen(engine.sync_engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        event.remove(engine.sync_engine, "before_cursor_execute", self._record)
+
+
+@pytest.fixture
+async def large_tree(db, admin):
+    counts = await generate(SHAPE, seed=1, batch_size=5000, reset=False)
+    assert counts["tasks"] >= MIN_ROWS
+    result = await db.execute(
+        select(Task).where(Task.level == "L4", Task.deleted_at.is_(None)).order_by(Task.name).limit(1)
+    )
+    return result.scalar_one()
+
+
+async def test_hot_queries_use_indexes(client, admin_headers, large_tree):
+    leaf = large_tree
+    requests = [
+        ("GET", f"/api/tasks/{leaf.id}", None),
+        ("GET", f"/api/tasks/{leaf.id}?fields=id,name", None),
+        ("GET", f"/api/tasks?ids={leaf.id},{leaf.parent_id}", None),
+        ("GET", f"/api/tasks/{leaf.id}/history", None),
+        ("GET", "/api/tasks/graph?level=L1", None),
+        ("GET", f"/api/tasks/graph?organization={leaf.organization}&level=L2", None),
+        ("PUT", f"/api/tasks/{leaf.id}", {"is_ai_utilized": not leaf.is_ai_utilized}),
+        ("DELETE", f"/api/tasks/{leaf.parent_id}", None),  # 자식이 있어 거부되지만 자식 확인 쿼리는 실행
+        (
+            "POST",
+            "/api/tasks",
+            {"parent_id": str(leaf.parent_id), "name": "새 태스크", "organization": leaf.organization},
+        ),
+        ("DELETE", f"/api/tasks/{leaf.id}", None),
+    ]
+
+    with StatementRecorder() as recorder:
+        for method, url, body in requests:
+            response = await client.request(method, url, json=body, headers=admin_headers)
+            assert response.status_code < 500, response.text
+    assert recorder.statements
+
+    failures = []
+    async with engine.connect() as conn:
+        for statement, parameters in recorder.statements:
+            if statement.lstrip().upper().startswith("INSERT"):
+                continue
+            raw = (await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)).scalar_one()
+            plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+            if seq_scans := _find_seq_scans(plan):
+                failures.append(f"Seq Scan on {', '.join(seq_scans)}: {statement}")
+    assert not failures, "\n\n".join(failures)
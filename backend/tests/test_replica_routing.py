@@ -0,0 +1,53 @@
+import time
+from uuid import uuid4
+
+from app.core.recent_writes import InMemoryRecentWrites, RedisRecentWrites
+from app.db import session
+
+
+class FakeRedis:
+    """set(px=) / exists만 지원하는 최소 클라이언트."""
+
+    def __init__(self) -> None:
+        self.expires: dict[str, float] = {}
+
+    async def set(self, key, value, px):
+        self.expires[key] = time.monotonic() + px / 1000
+
+    async def exists(self, key):
+        return int(self.expires.get(key, 0) > time.monotonic())
+
+
+async def test_recent_writer_reads_from_primary(monkeypatch):
+    replica = object()
+    monkeypatch.setattr(session, "replica_engine", object())
+    monkeypatch.setattr(session, "async_read_session", replica)
+    monkeypatch.setattr(session, "_recent_writes", InMemoryRecentWrites(ttl=60))
+    writer, reader = uuid4(), uuid4()
+
+    await session.mark_user_write(writer)
+
+    assert await session.read_session_for(writer) is session.async_session
+    assert await session.read_session_for(reader) is replica
+    assert await session.read_session_for(None) is replica
+
+
+async def test_recent_writes_are_shared_through_redis():
+    client = FakeRedis()
+    user_id = uuid4()
+
+    # 다른 워커의 인스턴스가 같은 Redis를 보면 쓰기를 인식
+    await RedisRecentWrites(client, ttl=60).mark(user_id)
+    assert await RedisRecentWrites(client, ttl=60).contains(user_id)
+    assert not await RedisRecentWrites(client, ttl=60).contains(uuid4())
+
+
+async def test_recent_writes_expire():
+    recent = InMemoryRecentWrites(ttl=0.05)
+    user_id = uuid4()
+
+    await recent.mark(user_id)
+    assert await recent.contains(user_id)
+
+    time.sleep(0.06)
+    assert not await recent.contains(user_id)
@@ -0,0 +1,51 @@
+import gzip
+import warnings
+
+import pytest
+from starlette.datastructures import Headers
+
+from app.core.spa import IMMUTABLE_CACHE, SpaFiles
+
+
+@pytest.fixture
+def spa(tmp_path):
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "index.html").write_text("<html>app</html>")
+    (tmp_path / "index.html.gz").write_bytes(gzip.compress(b"<html>app</html>"))
+    (tmp_path / "assets" / "app-1234.js").write_text("console.log(1)")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", ResourceWarning)
+        return SpaFiles(str(tmp_path))
+
+
+def test_hashed_assets_are_immutable(spa):
+    response = spa.response("assets/app-1234.js", Headers())
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE
+
+
+def test_missing_asset_is_404_not_index(spa):
+    assert spa.response("assets/missing.js", Headers()).status_code == 404
+
+
+def test_index_fallback_is_compressed_and_revalidated(spa):
+    response = spa.response("tasks/123", Headers({"accept-encoding": "gzip, br"}))
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert gzip.decompress(response.body) == b"<html>app</html>"
+
+    etag = response.headers["etag"]
+    assert spa.response("", Headers({"if-none-match": etag, "accept-encoding": "gzip"})).status_code == 304
+    assert spa.response("", Headers()).body == b"<html>app</html>"
+
+
+def test_index_etag_differs_per_encoding(spa):
+    gzipped = spa.response("", Headers({"accept-encoding": "gzip"}))
+    identity = spa.response("", Headers())
+    assert gzipped.headers["etag"].endswith('-gz"')
+    assert identity.headers["etag"] != gzipped.headers["etag"]
+
+    # 다른 인코딩의 ETag로는 재검증되지 않는다 (캐시된 gzip 본문을 identity로 쓰면 안 됨)
+    stale = spa.response("", Headers({"if-none-match": gzipped.headers["etag"]}))
+    assert stale.status_code == 200
+    assert stale.body == b"<html>app</html>"
+    assert spa.response("", Headers({"if-none-match": identity.headers["etag"]})).status_code == 304
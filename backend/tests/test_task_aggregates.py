@@ -0,0 +1,50 @@
+from sqlalchemy import select
+
+from app.models import Task
+from tests.utils import confirm_upload, xlsx
+
+COUNTS = ("subtree_l1_count", "subtree_l2_count", "subtree_l3_count", "subtree_l4_count", "subtree_ai_count")
+
+
+async def subtree_counts(db, name: str) -> tuple[int, ...]:
+    task = (await db.execute(select(Task).where(Task.name == name, Task.deleted_at.is_(None)))).scalar_one()
+    await db.refresh(task)
+    return tuple(getattr(task, column) for column in COUNTS)
+
+
+async def test_upload_confirm_updates_ancestor_aggregates(client, db, admin_headers):
+    await confirm_upload(
+        client,
+        admin_headers,
+        xlsx(("A", "B", "C", "D"), ("A", "B", "C", "E"), ("A", "F", "G", "H"), ("I", "J", "K", "L")),
+    )
+
+    assert await subtree_counts(db, "Root") == (2, 3, 3, 4, 0)
+    assert await subtree_counts(db, "A") == (0, 2, 2, 3, 0)
+    assert await subtree_counts(db, "B") == (0, 0, 1, 2, 0)
+    assert await subtree_counts(db, "C") == (0, 0, 0, 2, 0)
+    assert await subtree_counts(db, "D") == (0, 0, 0, 0, 0)
+
+    # 두 번째 업로드는 새 노드의 조상만 증가
+    await confirm_upload(client, admin_headers, xlsx(("A", "B", "C", "D"), ("A", "B", "M", "N")))
+
+    assert await subtree_counts(db, "Root") == (2, 3, 4, 5, 0)
+    assert await subtree_counts(db, "B") == (0, 0, 2, 3, 0)
+    assert await subtree_counts(db, "C") == (0, 0, 0, 2, 0)
+
+
+async def test_create_and_delete_update_ancestor_aggregates(client, db, admin_headers):
+    await confirm_upload(client, admin_headers, xlsx(("A", "B", "C", "D")))
+    parent = (await db.execute(select(Task).where(Task.name == "C"))).scalar_one()
+
+    response = await client.post(
+        "/api/tasks",
+        headers=admin_headers,
+        json={"parent_id": str(parent.id), "name": "E", "organization": "A", "is_ai_utilized": True},
+    )
+    assert response.status_code == 200, response.text
+    assert await subtree_counts(db, "A") == (0, 1, 1, 2, 1)
+
+    response = await client.delete(f"/api/tasks/{response.json()['data']['id']}", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert await subtree_counts(db, "A") == (0, 1, 1, 1, 0)
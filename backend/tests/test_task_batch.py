@@ -0,0 +1,57 @@
+from uuid import uuid4
+
+from app.api import tasks
+from tests.utils import seed_tasks
+
+ROWS = (("A", "B", "C", "D"), ("A", "B", "C", "E"))
+
+
+async def test_batch_keeps_request_order_and_reports_missing(client, db, admin_headers):
+    ids = await seed_tasks(client, db, admin_headers, *ROWS)
+    unknown = str(uuid4())
+
+    response = await client.get(
+        "/api/tasks",
+        headers=admin_headers,
+        params=[("ids", f"{ids['E']},{unknown}"), ("ids", ids["A"]), ("ids", ids["E"]), ("ids", ids["C"])],
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()["data"]
+    assert [task["id"] for task in data["tasks"]] == [ids["E"], ids["A"], ids["C"]]
+    assert data["missing"] == [unknown]
+    assert data["tasks"][0]["name"] == "E" and "team" in data["tasks"][0]
+
+
+async def test_batch_with_projection(client, db, admin_headers):
+    ids = await seed_tasks(client, db, admin_headers, *ROWS)
+    unknown = str(uuid4())
+
+    response = await client.get(
+        "/api/tasks", headers=admin_headers, params={"ids": f"{ids['D']},{unknown},{ids['B']}", "fields": "name"}
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["data"] == {
+        "tasks": [{"id": ids["D"], "name": "D"}, {"id": ids["B"], "name": "B"}],
+        "missing": [unknown],
+    }
+
+
+async def test_deleted_task_is_missing(client, db, admin_headers):
+    ids = await seed_tasks(client, db, admin_headers, *ROWS)
+    assert (await client.delete(f"/api/tasks/{ids['E']}", headers=admin_headers)).status_code == 200
+
+    response = await client.get("/api/tasks", headers=admin_headers, params={"ids": f"{ids['D']},{ids['E']}"})
+    data = response.json()["data"]
+    assert [task["id"] for task in data["tasks"]] == [ids["D"]]
+    assert data["missing"] == [ids["E"]]
+
+
+async def test_batch_rejects_invalid_requests(client, admin_headers, monkeypatch):
+    assert (await client.get("/api/tasks", headers=admin_headers, params={"ids": "not-a-uuid"})).status_code == 400
+    assert (await client.get("/api/tasks", headers=admin_headers, params={"ids": ","})).status_code == 400
+
+    monkeypatch.setattr(tasks, "MAX_BATCH_IDS", 2)
+    many = ",".join(str(uuid4()) for _ in range(3))
+    response = await client.get("/api/tasks", headers=admin_headers, params={"ids": many})
+    assert response.status_code == 400
+    assert "max 2" in response.json()["detail"]
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from sqlalchemy import select
+
+from app.core.security import add_token_to_blacklist, create_access_token
+from app.models import Task
+from app.services import task_events
+from tests.utils import confirm_upload, seed_tasks, xlsx
+
+
+@pytest.fixture
+def fast_stream(monkeypatch):
+    monkeypatch.setattr(task_events, "HEARTBEAT_SECONDS", 0.02)
+    monkeypatch.setattr(task_events, "AUTH_RECHECK_SECONDS", 0.02)
+
+
+async def test_stream_closes_when_authorization_is_lost(fast_stream):
+    checks = []
+
+    async def still_authorized() -> bool:
+        checks.append(True)
+        return len(checks) < 3
+
+    chunks = [chunk async for chunk in task_events.stream_task_changes(None, still_authorized)]
+
+    assert chunks[0].startswith("retry:")
+    assert chunks[-1] == task_events.UNAUTHORIZED_EVENT
+    assert len(checks) == 3
+
+
+async def test_stream_filters_events_by_organization(fast_stream):
+    stream = task_events.stream_task_changes("A")
+    assert (await anext(stream)).startswith("retry:")
+    next_chunk = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0)
+
+    await task_events.change_broker.publish(
+        {"type": "updated", "tasks": [{"organization": "B"}, {"organization": "A", "name": "x"}]}
+    )
+    chunk = await next_chunk
+    await stream.aclose()
+
+    assert chunk.startswith("event: updated\n")
+    assert '"organization": "B"' not in chunk and '"name": "x"' in chunk
+
+
+async def test_changes_endpoint_closes_after_logout(client, admin, fast_stream):
+    token = create_access_token({"sub": str(admin.id)})
+    request = asyncio.ensure_future(
+        client.get("/api/tasks/changes", headers={"Authorization": f"Bearer {token}"})
+    )
+    await asyncio.sleep(0.05)
+    assert not request.done()
+
+    await add_token_to_blacklist(token)
+    response = await asyncio.wait_for(request, 5)
+
+    assert response.status_code == 200
+    assert response.text.endswith(task_events.UNAUTHORIZED_EVENT)
+
+
+@pytest.fixture
+def published(monkeypatch) -> list[dict]:
+    events = []
+
+    async def publish(event: dict) -> None:
+        events.append(event)
+
+    monkeypatch.setattr(task_events.change_broker, "publish", publish)
+    return events
+
+
+def aggregates_of(events: list[dict]) -> dict[str, tuple[int, int]]:
+    [event] = [event for event in events if event["type"] == "aggregates"]
+    return {item["id"]: (item["subtree_l4_count"], item["subtree_ai_count"]) for item in event["tasks"]}
+
+
+async def test_writes_publish_updated_ancestor_aggregates(client, db, admin_headers, published):
+    ids = await seed_tasks(client, db, admin_headers, ("A", "B", "C", "D"))
+    assert [event["type"] for event in published] == ["created", "aggregates"]
+    assert aggregates_of(published)[ids["C"]] == (1, 0)
+
+    published.clear()
+    response = await client.post(
+        "/api/tasks",
+        json={"parent_id": ids["C"], "name": "E", "organization": "A", "is_ai_utilized": True},
+        headers=admin_headers,
+    )
+    assert response.status_code == 200, response.text
+    assert [event["type"] for event in published] == ["created", "aggregates"]
+    assert aggregates_of(published) == {ids[name]: (2, 1) for name in ("Root", "A", "B", "C")}
+    new_id = response.json()["data"]["id"]
+
+    published.clear()
+    response = await client.put(f"/api/tasks/{new_id}", json={"is_ai_utilized": False}, headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert aggregates_of(published)[ids["Root"]] == (2, 0)
+
+    published.clear()
+    response = await client.delete(f"/api/tasks/{new_id}", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert [event["type"] for event in published] == ["deleted", "aggregates"]
+    assert aggregates_of(published)[ids["B"]] == (1, 0)
+
+
+async def test_update_without_aggregate_change_publishes_no_aggregates(client, db, admin_headers, published):
+    await confirm_upload(client, admin_headers, xlsx(("A", "B", "C", "D")))
+    task_id = (await db.execute(select(Task.id).where(Task.name == "D"))).scalar_one()
+
+    published.clear()
+    response = await client.put(f"/api/tasks/{task_id}", json={"team": "팀"}, headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert [event["type"] for event in published] == ["updated"]
@@ -0,0 +1,56 @@
+from tests.utils import seed_tasks
+
+ROWS = (("A", "B", "C", "D"), ("E", "F", "G", "H"))
+
+
+async def test_graph_projection_returns_only_requested_fields(client, db, admin_headers):
+    await seed_tasks(client, db, admin_headers, *ROWS)
+
+    response = await client.get("/api/tasks/graph", headers=admin_headers, params={"fields": "name, level,name"})
+    assert response.status_code == 200, response.text
+    items = response.json()["data"]
+    assert len(items) == 9
+    assert all(set(item) == {"id", "name", "level"} for item in items)
+
+    response = await client.get(
+        "/api/tasks/graph", headers=admin_headers, params={"fields": "name", "level": "L1"}
+    )
+    assert sorted(item["name"] for item in response.json()["data"]) == ["A", "E"]
+
+
+async def test_detail_projection(client, db, admin_headers):
+    ids = await seed_tasks(client, db, admin_headers, *ROWS)
+
+    response = await client.get(
+        f"/api/tasks/{ids['D']}", headers=admin_headers, params={"fields": "manager_name,version"}
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["data"] == {"id": ids["D"], "manager_name": None, "version": 1}
+
+    # 전체 응답은 그대로
+    response = await client.get(f"/api/tasks/{ids['D']}", headers=admin_headers)
+    assert {"team", "subtree_l4_count", "updated_by"} <= set(response.json()["data"])
+
+
+async def test_unknown_fields_are_rejected(client, db, admin_headers):
+    ids = await seed_tasks(client, db, admin_headers, *ROWS)
+
+    response = await client.get("/api/tasks/graph", headers=admin_headers, params={"fields": "name,password"})
+    assert response.status_code == 400
+    assert "password" in response.json()["detail"]
+
+    # 상세 전용 필드는 그래프에서 허용되지 않음
+    response = await client.get("/api/tasks/graph", headers=admin_headers, params={"fields": "team"})
+    assert response.status_code == 400
+
+    response = await client.get(f"/api/tasks/{ids['D']}", headers=admin_headers, params={"fields": "deleted_at"})
+    assert response.status_code == 400
+
+
+async def test_missing_task_with_projection_is_404(client, db, admin_headers):
+    await seed_tasks(client, db, admin_headers, *ROWS)
+
+    response = await client.get(
+        "/api/tasks/00000000-0000-0000-0000-000000000000", headers=admin_headers, params={"fields": "name"}
+    )
+    assert response.status_code == 404
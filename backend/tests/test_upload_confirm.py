@@ -0,0 +1,61 @@
+from sqlalchemy import select, text
+
+from app.db.session import async_session
+from app.models import AppliedUpload, Task
+from app.services.upload_service import get_tree_version, lock_task_tree
+from tests.utils import confirm_upload, xlsx
+
+
+async def test_repeat_confirm_short_circuits_until_tree_changes(client, db, admin_headers):
+    data = xlsx(("A", "B", "C", "D"))
+
+    first = await confirm_upload(client, admin_headers, data)
+    assert first["data"] == {"created": 5, "skipped": 0, "total": 5}
+
+    repeat = await confirm_upload(client, admin_headers, data)
+    assert repeat["message"] == "이미 반영된 업로드입니다."
+    assert repeat["data"] == first["data"]
+
+    # 다른 경로로 트리가 바뀌면 기록은 무효
+    l4 = (await db.execute(select(Task).where(Task.name == "D"))).scalar_one()
+    response = await client.delete(f"/api/tasks/{l4.id}", headers=admin_headers)
+    assert response.status_code == 200, response.text
+
+    again = await confirm_upload(client, admin_headers, data)
+    assert again["message"] != "이미 반영된 업로드입니다."
+    assert again["data"] == {"created": 1, "skipped": 3, "total": 4}
+
+
+async def test_tree_version_is_bumped_by_task_writes(db):
+    before = await get_tree_version(db)
+    db.add(Task(level="Root", name="Root", organization=""))
+    await db.commit()
+    assert await get_tree_version(db) > before
+
+
+async def test_task_writes_do_not_wait_for_confirm_lock(db):
+    await lock_task_tree(db)
+    async with async_session() as other:
+        await other.execute(text("SET LOCAL lock_timeout = '1s'"))
+        other.add(Task(level="Root", name="Root", organization=""))
+        await other.commit()
+    await db.rollback()
+
+
+async def test_applied_uploads_keep_only_current_version(client, db, admin_headers):
+    await confirm_upload(client, admin_headers, xlsx(("A", "B", "C", "D")))
+    await confirm_upload(client, admin_headers, xlsx(("A", "B", "C", "E")))
+
+    rows = (await db.execute(select(AppliedUpload))).scalars().all()
+    assert len(rows) == 1
+    assert rows[0].tree_version == await get_tree_version(db)
+
+
+async def test_confirm_does_not_query_per_node(client, admin_headers):
+    # conftest가 QUERY_MONITOR_MODE=raise이므로 노드마다 SELECT/INSERT하면 요청이 실패한다
+    rows = [("A", f"B{i}", "C", f"D{i}") for i in range(30)]
+    first = await confirm_upload(client, admin_headers, xlsx(*rows))
+    assert first["data"]["created"] == 1 + 1 + 30 * 3
+
+    second = await confirm_upload(client, admin_headers, xlsx(*rows, ("A", "B0", "C", "E")))
+    assert second["data"] == {"created": 1, "skipped": 1 + 30 * 3, "total": 2 + 30 * 3}
@@ -0,0 +1,88 @@
+from app.models import Task
+from app.schemas import ApiResponse
+from app.schemas.upload import DiffResult
+from app.services.upload_service import ParsedExcel, ParsedRow, diff_tasks
+from tests.utils import XLSX_MEDIA_TYPE, confirm_upload, xlsx
+
+LEVELS = ("L1", "L2", "L3", "L4")
+
+
+async def insert_paths(db, *paths: tuple[str, ...]) -> dict[tuple[str, ...], Task]:
+    """Root 아래에 경로들을 만든다. 경로 튜플 → Task."""
+    root = Task(level="Root", name="Root", organization="")
+    db.add(root)
+    await db.flush()
+    tasks: dict[tuple[str, ...], Task] = {(): root}
+    for path in paths:
+        for depth in range(1, len(path) + 1):
+            key = path[:depth]
+            if key in tasks:
+                continue
+            task = Task(
+                parent_id=tasks[key[:-1]].id,
+                level=LEVELS[depth - 1],
+                name=key[-1],
+                organization=path[0],
+            )
+            db.add(task)
+            await db.flush()
+            tasks[key] = task
+    await db.commit()
+    return tasks
+
+
+def statuses(nodes, prefix=()) -> dict[tuple[str, ...], str]:
+    result = {}
+    for node in nodes:
+        path = prefix + (node["name"],)
+        result[path] = node["status"]
+        result.update(statuses(node["children"], path))
+    return result
+
+
+async def test_moved_node_is_not_also_removed(db):
+    await insert_paths(db, ("A", "B", "X", "Y"), ("A", "C"))
+    parsed = ParsedExcel(rows=[ParsedRow("A", "B", "Z", "q"), ParsedRow("A", "C", "X", "Y")])
+
+    diff = await diff_tasks(db, parsed)
+
+    assert statuses(diff["diff_tree"]) == {
+        ("A",): "existing",
+        ("A", "B"): "existing",
+        ("A", "B", "Z"): "new",
+        ("A", "B", "Z", "q"): "new",
+        ("A", "C"): "existing",
+        ("A", "C", "X"): "moved",
+        ("A", "C", "X", "Y"): "existing",
+    }
+    assert diff["stats"] == {"new": 2, "existing": 4, "moved": 1, "removed": 0, "total": 7}
+
+
+async def test_removed_subtree_and_exact_match_wins_over_move(db):
+    await insert_paths(db, ("A", "B", "X", "Y"), ("A", "C", "X", "W"), ("D", "E", "F", "G"))
+    parsed = ParsedExcel(rows=[ParsedRow("A", "B", "X", "Y"), ParsedRow("A", "C", "X", "W")])
+
+    diff = await diff_tasks(db, parsed)
+
+    result = statuses(diff["diff_tree"])
+    assert result[("A", "B", "X")] == "existing"
+    assert result[("A", "C", "X")] == "existing"
+    assert [result[("D",) + rest] for rest in [(), ("E",), ("E", "F"), ("E", "F", "G")]] == ["removed"] * 4
+    assert diff["stats"] == {"new": 0, "existing": 7, "moved": 0, "removed": 4, "total": 11}
+
+
+async def test_diff_endpoint_matches_response_schema(client, admin_headers):
+    await confirm_upload(client, admin_headers, xlsx(("A", "B", "C", "D")))
+
+    response = await client.post(
+        "/api/upload/diff",
+        headers=admin_headers,
+        files={"file": ("pi.xlsx", xlsx(("A", "B", "C", "E")), XLSX_MEDIA_TYPE)},
+    )
+    assert response.status_code == 200, response.text
+
+    # 검증 없이 직렬화하므로 문서화된 스키마와 같은 모양인지 여기서 확인
+    body = ApiResponse[DiffResult].model_validate(response.json())
+    assert body.success
+    assert body.data.stats == {"new": 1, "existing": 3, "moved": 0, "removed": 1, "total": 5}
+    assert statuses([node.model_dump() for node in body.data.diff_tree])[("A", "B", "C", "D")] == "removed"
@@ -0,0 +1,77 @@
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import pytest
+from openpyxl import Workbook
+
+from app.services import upload_service
+from app.services.upload_service import parse_workbooks
+
+
+def workbook(sheets: dict[str, list[tuple[str, ...]]]) -> bytes:
+    wb = Workbook()
+    wb.remove(wb.active)
+    for title, rows in sheets.items():
+        ws = wb.create_sheet(title)
+        for row in rows:
+            ws.append(row)
+    buffer = BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+HEADER = ("L1", "L2", "L3", "L4")
+
+
+async def test_parses_selected_sheets_of_each_file():
+    first = workbook({"PI": [HEADER, ("A", "B", "C", "D")], "기타": [HEADER, ("A", "B", "C", "E")]})
+    second = workbook({"PI": [HEADER, ("F", "G", "H", "I")]})
+
+    parsed = await parse_workbooks([first, second], sheets=["PI"])
+
+    assert [row.l4 for row in parsed.rows] == ["D", "I"]
+
+
+async def test_all_sheets_skips_sheets_without_header():
+    file_bytes = workbook({"PI": [HEADER, ("A", "B", "C", "D")], "메모": [("note",)]})
+
+    parsed = await parse_workbooks([file_bytes], all_sheets=True)
+
+    assert [row.l4 for row in parsed.rows] == ["D"]
+
+
+async def test_missing_sheet_is_rejected():
+    file_bytes = workbook({"PI": [HEADER, ("A", "B", "C", "D")]})
+
+    with pytest.raises(ValueError, match="시트를 찾을 수 없습니다"):
+        await parse_workbooks([file_bytes], sheets=["없음"])
+
+
+class RecordingPool(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=4)
+        self.sheets: list[str] = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.sheets.append(args[1])
+        return super().submit(fn, *args, **kwargs)
+
+
+async def test_sheets_of_one_file_are_separate_pool_jobs(monkeypatch):
+    pool = RecordingPool()
+    monkeypatch.setattr(upload_service, "_get_parse_pool", lambda: pool)
+    file_bytes = workbook({f"조직{i}": [HEADER, (f"조직{i}", "B", "C", "D")] for i in range(3)})
+
+    parsed = await parse_workbooks([file_bytes], all_sheets=True)
+
+    assert sorted(pool.sheets) == ["조직0", "조직1", "조직2"]
+    assert [row.l1 for row in parsed.rows] == ["조직0", "조직1", "조직2"]
+    pool.shutdown()
+
+
+async def test_single_sheet_is_parsed_without_the_pool(monkeypatch):
+    monkeypatch.setattr(upload_service, "_get_parse_pool", lambda: pytest.fail("pool used"))
+
+    parsed = await parse_workbooks([workbook({"PI": [HEADER, ("A", "B", "C", "D")]})])
+
+    assert [row.l4 for row in parsed.rows] == ["D"]
@@ -0,0 +1,27 @@
+from sqlalchemy import select
+
+from app.models import User
+from tests.conftest import auth_headers, create_user
+
+
+async def test_deactivated_user_is_rejected_after_cached_request(client, db):
+    user = await create_user(db, employee_id="viewer1", role="viewer")
+    headers = auth_headers(user)
+    assert (await client.get("/api/auth/me", headers=headers)).status_code == 200
+
+    user = (await db.execute(select(User).where(User.id == user.id))).scalar_one()
+    user.is_active = False
+    await db.commit()
+
+    assert (await client.get("/api/auth/me", headers=headers)).status_code == 401
+
+
+async def test_role_change_is_applied_after_cached_request(client, db):
+    user = await create_user(db, employee_id="viewer2", role="viewer")
+    headers = auth_headers(user)
+    assert (await client.get("/api/auth/me", headers=headers)).json()["data"]["role"] == "viewer"
+
+    user.role = "editor"
+    await db.commit()
+
+    assert (await client.get("/api/auth/me", headers=headers)).json()["data"]["role"] == "editor"
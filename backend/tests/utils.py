@@ -0,0 +1,35 @@
+from io import BytesIO
+
+from openpyxl import Workbook
+from sqlalchemy import select
+
+from app.models import Task
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+def xlsx(*rows: tuple[str, str, str, str]) -> bytes:
+    """L1~L4 헤더와 행으로 만든 업로드용 엑셀."""
+    wb = Workbook()
+    ws = wb.active
+    ws.append(["L1", "L2", "L3", "L4"])
+    for row in rows:
+        ws.append(row)
+    buffer = BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+async def confirm_upload(client, headers: dict[str, str], data: bytes) -> dict:
+    response = await client.post(
+        "/api/upload/confirm", headers=headers, files={"file": ("pi.xlsx", data, XLSX_MEDIA_TYPE)}
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+async def seed_tasks(client, db, headers: dict[str, str], *rows: tuple[str, str, str, str]) -> dict[str, str]:
+    """rows를 업로드로 반영하고 이름 → id(str) 반환."""
+    await confirm_upload(client, headers, xlsx(*rows))
+    result = await db.execute(select(Task.name, Task.id))
+    return {name: str(task_id) for name, task_id in result.all()}
@@ -1,5 +1,5 @@
 import { apiClient } from './client';
-import type { TaskGraphItem, TaskDetail, TaskHistory } from '../types/task';
+import type { TaskGraphItem, TaskDetail, TaskHistory, KeywordFacets } from '../types/task';
 
 interface TaskFilters {
   organization?: string;
@@ -46,6 +46,23 @@ export const taskApi = {
     return apiClient.get<TaskDetail>(`/tasks/${taskId}`);
   },
 
+  // 여러 태스크 상세를 한 번에 조회 (최대 500개, 요청 순서 유지)
+  getTasks: async (taskIds: string[]): Promise<{ tasks: TaskDetail[]; missing: string[] }> => {
+    const params = new URLSearchParams({ ids: taskIds.join(',') });
+    return apiClient.get<{ tasks: TaskDetail[]; missing: string[] }>(`/tasks?${params.toString()}`);
+  },
+
+  // 키워드 빈도 (전체 / AI 활용 / 미활용), organization 또는 taskId(서브트리)로 범위 제한
+  getKeywordFacets: async (scope?: { organization?: string; taskId?: string; limit?: number }): Promise<KeywordFacets> => {
+    const params = new URLSearchParams();
+    if (scope?.organization) params.append('organization', scope.organization);
+    if (scope?.taskId) params.append('task_id', scope.taskId);
+    if (scope?.limit) params.append('limit', String(scope.limit));
+
+    const query = params.toString() ? `?${params.toString()}` : '';
+    return apiClient.get<KeywordFacets>(`/tasks/keywords/facets${query}`);
+  },
+
   createTask: async (data: TaskCreateRequest): Promise<TaskDetail> => {
     return apiClient.post<TaskDetail>('/tasks', data);
   },
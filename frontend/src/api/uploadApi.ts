@@ -29,12 +29,14 @@ export interface UploadPreview {
     l4_count: number;
   };
   hierarchy: HierarchyNode[];
+  hierarchy_total: number;
+  hierarchy_truncated: boolean;
 }
 
 export interface DiffNode {
   name: string;
   level: string;
-  status: 'new' | 'existing';
+  status: 'new' | 'existing' | 'moved' | 'removed';
   children: DiffNode[];
 }
 
@@ -43,6 +45,8 @@ export interface DiffResult {
   stats: {
     new: number;
     existing: number;
+    moved: number;
+    removed: number;
     total: number;
   };
 }
@@ -395,6 +395,10 @@ const DiffTreeNode = ({ node, depth }: { node: DiffNode; depth: number }) => {
 
         {node.status === 'new' ? (
           <Badge variant="success" size="sm">신규</Badge>
+        ) : node.status === 'moved' ? (
+          <Badge variant="warning" size="sm">이동</Badge>
+        ) : node.status === 'removed' ? (
+          <Badge variant="danger" size="sm">파일에 없음</Badge>
         ) : (
           <Badge variant="default" size="sm">기존</Badge>
         )}
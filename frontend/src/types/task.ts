@@ -11,6 +11,12 @@ export interface TaskGraphItem {
   manager_id: string | null;
   keywords: string[];
   is_ai_utilized: boolean;
+  // 서브트리 집계 (하위 노드 수: 레벨별, AI 활용)
+  subtree_l1_count?: number;
+  subtree_l2_count?: number;
+  subtree_l3_count?: number;
+  subtree_l4_count?: number;
+  subtree_ai_count?: number;
 }
 
 export interface TaskDetail extends TaskGraphItem {
@@ -21,6 +27,18 @@ export interface TaskDetail extends TaskGraphItem {
   updated_at: string;
 }
 
+export interface KeywordFacetItem {
+  keyword: string;
+  count: number;
+  ai_count: number;
+  non_ai_count: number;
+}
+
+export interface KeywordFacets {
+  scope: 'all' | 'organization' | 'task';
+  keywords: KeywordFacetItem[];
+}
+
 export interface TaskHistory {
   id: string;
   task_id: string;